@@ -0,0 +1 @@
+# Offline benchmark tools for the listening pipeline
\ No newline at end of file
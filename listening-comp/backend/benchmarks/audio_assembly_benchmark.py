@@ -0,0 +1,111 @@
+"""Benchmark in-memory vs ffmpeg assembly of question audio
+
+Assembles a typical dialogue (announcer introduction, conversation turns
+with short pauses, announcer question) through AudioGenerator.assemble_audio
+in both modes and reports wall time per assembly.
+
+Parts are real Polly segments from a directory of MP3 files (for example
+the TTS cache) when --parts-dir is given, otherwise synthetic MP3 frames of
+realistic size. No AWS calls are made.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.audio_assembly_benchmark --turns 10 --iterations 20
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+# AudioGenerator builds boto3 clients, which need a region but no credentials
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from backend.benchmarks.common import latency_summary, write_report
+from backend.services import mp3_frames
+from backend.services.audio_generator import AudioGenerator
+
+# Polly neural MP3: MPEG-2 Layer III, 24 kHz mono, ~48 kbps
+POLLY_FORMAT = (0b10, 24000, True)
+
+
+def synthetic_part(duration_ms: int) -> bytes:
+    """Stand-in for a Polly segment with a realistic frame size"""
+    return mp3_frames.silence(duration_ms, *POLLY_FORMAT, bitrate_kbps=48)
+
+
+def load_parts(parts_dir: str, count: int):
+    files = sorted(
+        os.path.join(parts_dir, name) for name in os.listdir(parts_dir) if name.endswith(".mp3")
+    )[:count]
+    if len(files) < count:
+        raise SystemExit(f"Need {count} MP3 files in {parts_dir}, found {len(files)}")
+    parts = []
+    for path in files:
+        with open(path, "rb") as f:
+            parts.append(f.read())
+    return parts
+
+
+def dialogue_steps(parts):
+    """Intro, turns separated by short pauses, then the question"""
+    steps = [parts[0], 2000]
+    for turn in parts[1:-1]:
+        steps.extend([turn, 500])
+    steps.extend([2000, parts[-1]])
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--turns", type=int, default=10, help="Conversation turns")
+    parser.add_argument("--turn-ms", type=int, default=3000, help="Synthetic turn duration")
+    parser.add_argument("--parts-dir", help="Directory of real MP3 segments to use as parts")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--output", default="backend/data/benchmarks/audio_assembly.json")
+    args = parser.parse_args()
+
+    part_count = args.turns + 2
+    if args.parts_dir:
+        parts = load_parts(args.parts_dir, part_count)
+    else:
+        parts = [synthetic_part(args.turn_ms) for _ in range(part_count)]
+    steps = dialogue_steps(parts)
+
+    modes = ["memory"]
+    if shutil.which("ffmpeg"):
+        modes.append("ffmpeg")
+    else:
+        print("ffmpeg not found; benchmarking the in-memory path only")
+
+    results = {}
+    work_dir = tempfile.mkdtemp(prefix="assembly_bench_")
+    try:
+        for mode in modes:
+            generator = AudioGenerator(assembly_mode=mode)
+            latencies = []
+            size = 0
+            for i in range(args.iterations):
+                output_file = os.path.join(work_dir, f"{mode}_{i}.mp3")
+                start = time.perf_counter()
+                generator.assemble_audio(steps, output_file)
+                latencies.append(time.perf_counter() - start)
+                size = os.path.getsize(output_file)
+                os.unlink(output_file)
+            results[mode] = {"latency": latency_summary(latencies), "output_bytes": size}
+            print(f"{mode}: p50={results[mode]['latency']['p50_ms']}ms "
+                  f"p99={results[mode]['latency']['p99_ms']}ms size={size}B")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    write_report({
+        "parts": part_count,
+        "source": args.parts_dir or "synthetic",
+        "iterations": args.iterations,
+        "results": results,
+    }, args.output)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
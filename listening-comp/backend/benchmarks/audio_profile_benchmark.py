@@ -0,0 +1,93 @@
+"""Benchmark output size and encode time of the audio profiles
+
+Transcodes question audio into every profile in AUDIO_PROFILES through
+AudioTranscoder and reports, per profile, the output size, the size
+relative to the standard MP3, the first (cold) encode time, the cached
+lookup time and the download time over a slow link.
+
+Sources are MP3 files given with --input (for example generated question
+audio in frontend/static/audio), otherwise a synthetic speech-like clip in
+Polly's format is generated with ffmpeg. Requires ffmpeg with libmp3lame
+and libopus. No AWS calls are made.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.audio_profile_benchmark --input frontend/static/audio/question_*.mp3
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from backend.benchmarks.common import latency_summary, write_report
+from backend.services.audio_transcoder import AUDIO_PROFILES, AudioTranscoder
+
+
+def synthetic_source(path: str, seconds: int):
+    """Amplitude-modulated pink noise, encoded like Polly's neural MP3 (24 kHz mono, 48 kbps)"""
+    subprocess.run([
+        'ffmpeg', '-hide_banner', '-loglevel', 'error', '-y',
+        '-f', 'lavfi', '-i', f'anoisesrc=d={seconds}:c=pink:r=24000:a=0.3',
+        '-af', 'volume=0.5*(1+sin(2*PI*3*t)):eval=frame',
+        '-ac', '1', '-c:a', 'libmp3lame', '-b:a', '48k', path
+    ], check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--input", nargs="*", help="MP3 files to transcode")
+    parser.add_argument("--seconds", type=int, default=60, help="Length of the synthetic clip")
+    parser.add_argument("--link-kbps", type=float, default=400, help="Link speed for the download estimate")
+    parser.add_argument("--output", default="backend/data/benchmarks/audio_profiles.json")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="audio_profile_benchmark_")
+    try:
+        sources = args.input
+        if not sources:
+            sources = [os.path.join(work_dir, "synthetic.mp3")]
+            synthetic_source(sources[0], args.seconds)
+        source_bytes = sum(os.path.getsize(path) for path in sources)
+
+        transcoder = AudioTranscoder(os.path.join(work_dir, "profiles"))
+        results = {}
+        for profile in AUDIO_PROFILES:
+            cold, warm, output_bytes = [], [], 0
+            for source in sources:
+                start = time.perf_counter()
+                path = transcoder.transcode(source, profile)
+                cold.append(time.perf_counter() - start)
+                output_bytes += os.path.getsize(path)
+                start = time.perf_counter()
+                transcoder.transcode(source, profile)
+                warm.append(time.perf_counter() - start)
+            results[profile] = {
+                "label": AUDIO_PROFILES[profile]["label"],
+                "bytes": output_bytes,
+                "size_ratio": round(output_bytes / source_bytes, 3),
+                "download_s": round(output_bytes * 8 / 1000 / args.link_kbps / len(sources), 2),
+                "encode": latency_summary(cold),
+                "cached": latency_summary(warm),
+            }
+        report = {
+            "config": vars(args),
+            "sources": len(sources),
+            "source_bytes": source_bytes,
+            "profiles": results,
+            "transcoder": transcoder.stats(),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    write_report(report, args.output)
+    print(f"{'profile':<10} {'KB':>8} {'ratio':>7} {'download s':>11} {'encode p50':>11} {'cached p50':>11}")
+    for profile, stats in results.items():
+        print(f"{profile:<10} {stats['bytes'] / 1024:>8.0f} {stats['size_ratio']:>7.2f} {stats['download_s']:>11.2f} "
+              f"{stats['encode']['p50_ms']:>9.0f}ms {stats['cached']['p50_ms']:>9.1f}ms")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
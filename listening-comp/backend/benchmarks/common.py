@@ -0,0 +1,38 @@
+"""Shared helpers for the benchmark scripts"""
+import json
+import os
+from typing import Dict, List
+
+from backend.utils.metrics import percentile
+
+
+def latency_summary(latencies_s: List[float]) -> Dict:
+    """Summarize latencies (in seconds) as milliseconds"""
+    return {
+        "count": len(latencies_s),
+        "mean_ms": round(sum(latencies_s) / len(latencies_s) * 1000, 3) if latencies_s else 0.0,
+        "p50_ms": round(percentile(latencies_s, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies_s, 99) * 1000, 3),
+        "max_ms": round(max(latencies_s) * 1000, 3) if latencies_s else 0.0,
+    }
+
+
+def directory_size_mb(path: str) -> float:
+    """Total size of all files below a directory in MB"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total / (1024 * 1024)
+
+
+def write_report(report: Dict, output_file: str):
+    """Write a benchmark report as JSON"""
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,213 @@
+"""Benchmark Chroma HNSW settings for the vector store collections
+
+Builds a throwaway Chroma collection for every combination of the requested
+HNSW parameters and reports recall@k against exact (brute-force) search,
+build time, query latency percentiles and memory use.
+
+Each configuration runs in its own process so that RSS numbers are not
+polluted by indexes built for earlier configurations.
+
+Usage (from the listening-comp directory):
+
+    # Synthetic corpus shaped like Titan v2 embeddings
+    python -m backend.benchmarks.hnsw_benchmark --size 50000 --M 16 32 --search-ef 10 64 128
+
+    # Export the real transcript embeddings once, then benchmark against them
+    python -m backend.benchmarks.hnsw_benchmark --export-from backend/data/vectorstore \\
+        --collection transcripts --out backend/data/benchmarks/transcripts.npy
+    python -m backend.benchmarks.hnsw_benchmark --corpus backend/data/benchmarks/transcripts.npy
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+import chromadb
+import numpy as np
+
+from backend.benchmarks.common import (
+    directory_size_mb,
+    latency_summary,
+    write_report,
+)
+from backend.services.vector_store import DEFAULT_HNSW_CONFIG, hnsw_metadata
+from backend.utils.metrics import current_rss_mb
+
+ADD_BATCH_SIZE = 1000
+
+
+def export_embeddings(persist_directory: str, collection_name: str, output_file: str) -> int:
+    """Export all embeddings of an existing collection to a .npy file"""
+    client = chromadb.PersistentClient(path=persist_directory)
+    collection = client.get_collection(name=collection_name)
+    total = collection.count()
+    batches = []
+    for offset in range(0, total, ADD_BATCH_SIZE):
+        result = collection.get(
+            include=["embeddings"],
+            limit=ADD_BATCH_SIZE,
+            offset=offset
+        )
+        batches.append(np.asarray(result["embeddings"], dtype=np.float32))
+    embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    np.save(output_file, embeddings)
+    return len(embeddings)
+
+
+def synthetic_corpus(size: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """Clustered, unit-normalized vectors similar to sentence embeddings"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    assignments = rng.integers(0, clusters, size=size)
+    vectors = centers[assignments] + 0.35 * rng.normal(size=(size, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_neighbors(corpus: np.ndarray, queries: np.ndarray, k: int, space: str) -> np.ndarray:
+    """Brute-force top-k neighbor indices using Chroma's distance definitions"""
+    if space == "l2":
+        distances = (
+            (queries ** 2).sum(axis=1, keepdims=True)
+            - 2 * queries @ corpus.T
+            + (corpus ** 2).sum(axis=1)
+        )
+    elif space == "cosine":
+        normed_corpus = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+        normed_queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        distances = 1 - normed_queries @ normed_corpus.T
+    elif space == "ip":
+        distances = 1 - queries @ corpus.T
+    else:
+        raise ValueError(f"Unsupported space: {space}")
+    top = np.argpartition(distances, k, axis=1)[:, :k]
+    order = np.take_along_axis(distances, top, axis=1).argsort(axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def run_config(data_file: str, config: Dict, k: int) -> Dict:
+    """Build and query one index configuration (runs in a child process)"""
+    data = np.load(data_file)
+    corpus, queries, truth = data["corpus"], data["queries"], data["truth"]
+    work_dir = tempfile.mkdtemp(prefix="hnsw_bench_")
+    try:
+        client = chromadb.PersistentClient(path=work_dir)
+        collection = client.create_collection(
+            name="bench",
+            metadata=hnsw_metadata(config),
+            embedding_function=None
+        )
+        rss_before = current_rss_mb()
+
+        build_start = time.perf_counter()
+        for offset in range(0, len(corpus), ADD_BATCH_SIZE):
+            batch = corpus[offset:offset + ADD_BATCH_SIZE]
+            collection.add(
+                ids=[str(i) for i in range(offset, offset + len(batch))],
+                embeddings=batch.tolist()
+            )
+        build_seconds = time.perf_counter() - build_start
+
+        latencies = []
+        hits = 0
+        for query, expected in zip(queries, truth):
+            start = time.perf_counter()
+            result = collection.query(query_embeddings=[query.tolist()], n_results=k)
+            latencies.append(time.perf_counter() - start)
+            found = {int(i) for i in result["ids"][0]}
+            hits += len(found & {int(i) for i in expected})
+
+        return {
+            "config": config,
+            f"recall@{k}": round(hits / (len(queries) * k), 4),
+            "build_seconds": round(build_seconds, 3),
+            "query_latency": latency_summary(latencies),
+            "index_rss_mb": round(current_rss_mb() - rss_before, 1),
+            "on_disk_mb": round(directory_size_mb(work_dir), 1),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def config_grid(args) -> List[Dict]:
+    """All combinations of the requested HNSW parameters"""
+    return [
+        {"space": args.space, "M": m, "construction_ef": ef_c, "search_ef": ef_s}
+        for m, ef_c, ef_s in itertools.product(args.M, args.construction_ef, args.search_ef)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--corpus", help=".npy file of embeddings (default: synthetic)")
+    parser.add_argument("--size", type=int, default=20000, help="Synthetic corpus size")
+    parser.add_argument("--dim", type=int, default=1024, help="Synthetic vector dimension")
+    parser.add_argument("--clusters", type=int, default=200, help="Synthetic topic clusters")
+    parser.add_argument("--queries", type=int, default=200, help="Held-out query vectors")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors per query")
+    parser.add_argument("--space", default=DEFAULT_HNSW_CONFIG["space"], choices=["l2", "cosine", "ip"])
+    parser.add_argument("--M", type=int, nargs="+", default=[DEFAULT_HNSW_CONFIG["M"]])
+    parser.add_argument("--construction-ef", type=int, nargs="+",
+                        default=[DEFAULT_HNSW_CONFIG["construction_ef"]])
+    parser.add_argument("--search-ef", type=int, nargs="+",
+                        default=[DEFAULT_HNSW_CONFIG["search_ef"]])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="backend/data/benchmarks/hnsw.json")
+    parser.add_argument("--export-from", help="Persist directory to export embeddings from")
+    parser.add_argument("--collection", default="transcripts", help="Collection name to export")
+    parser.add_argument("--out", help="Output .npy file for --export-from")
+    args = parser.parse_args()
+
+    if args.export_from:
+        if not args.out:
+            parser.error("--out is required with --export-from")
+        count = export_embeddings(args.export_from, args.collection, args.out)
+        print(f"Exported {count} embeddings to {args.out}")
+        return
+
+    if args.corpus:
+        vectors = np.load(args.corpus).astype(np.float32)
+    else:
+        vectors = synthetic_corpus(args.size + args.queries, args.dim, args.clusters, args.seed)
+    if len(vectors) <= args.queries:
+        parser.error("Corpus must be larger than the number of queries")
+
+    rng = np.random.default_rng(args.seed)
+    vectors = vectors[rng.permutation(len(vectors))]
+    queries, corpus = vectors[:args.queries], vectors[args.queries:]
+    print(f"Computing exact neighbors for {len(queries)} queries over {len(corpus)} vectors...")
+    truth = exact_neighbors(corpus, queries, args.k, args.space)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hnsw_data_") as data_dir:
+        data_file = os.path.join(data_dir, "data.npz")
+        np.savez(data_file, corpus=corpus, queries=queries, truth=truth)
+        context = multiprocessing.get_context("spawn")
+        for config in config_grid(args):
+            print(f"Benchmarking {config}...")
+            with context.Pool(1) as pool:
+                result = pool.apply(run_config, (data_file, config, args.k))
+            results.append(result)
+            print(
+                f"  recall@{args.k}={result[f'recall@{args.k}']} "
+                f"p50={result['query_latency']['p50_ms']}ms "
+                f"p99={result['query_latency']['p99_ms']}ms "
+                f"build={result['build_seconds']}s rss={result['index_rss_mb']}MB"
+            )
+
+    write_report({
+        "corpus": args.corpus or "synthetic",
+        "corpus_size": len(corpus),
+        "dimension": int(corpus.shape[1]),
+        "k": args.k,
+        "results": results,
+    }, args.output)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
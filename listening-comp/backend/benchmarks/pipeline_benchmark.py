@@ -0,0 +1,346 @@
+"""End-to-end benchmark of the listening pipeline against fake AWS services
+
+Replaces the Bedrock runtime (converse, converse_stream, invoke_model) and
+Polly (synthesize_speech) clients with in-process fakes that sleep for a
+configurable latency, with jitter, and fail a configurable share of calls
+with ThrottlingException. The real application code runs on top of them:
+
+- index: QuestionVectorStore.add_questions in batches of 10 (Titan
+  embeddings via invoke_model)
+- search: QuestionVectorStore.search_similar_questions
+- question: QuestionGenerator.generate_similar_question (search + converse)
+- transcript_question: QuestionVectorStore.generate_question_from_transcript
+- audio: AudioGenerator.generate_audio (Polly synthesis + assembly)
+
+Each stage reports throughput, latency percentiles and errors. The report
+(JSON) records the git commit and configuration, and --compare prints the
+p50/throughput change against an earlier report. Everything is written to a
+temporary directory; no AWS credentials or network access are needed.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.pipeline_benchmark --iterations 50 --error-rate 0.02
+    python -m backend.benchmarks.pipeline_benchmark --compare backend/data/benchmarks/pipeline_before.json
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from botocore.exceptions import ClientError
+
+from backend.benchmarks.common import latency_summary, write_report
+from backend.question_generator import QuestionGenerator
+from backend.services import mp3_frames
+from backend.services.audio_generator import AudioGenerator
+from backend.services.bedrock_gateway import BedrockGateway
+from backend.services.vector_store import QuestionVectorStore
+
+STAGES = ("index", "search", "question", "transcript_question", "audio")
+
+# Polly neural MP3: MPEG-2 Layer III, 24 kHz mono, ~48 kbps
+POLLY_FORMAT = (0b10, 24000, True)
+
+EMBEDDING_DIMENSION = 1024
+
+_LINES = [
+    "すみません、駅はどこですか。",
+    "まっすぐ行って、二つ目の角を右に曲がってください。",
+    "明日の会議は何時からですか。",
+    "十時からです。資料を忘れないでください。",
+    "このシャツ、もう少し大きいサイズはありますか。",
+    "はい、Lサイズがございます。",
+    "週末は何をしましたか。",
+    "友達と映画を見に行きました。",
+]
+
+
+class FakeLatency:
+    """Shared latency/error model for the fake clients"""
+
+    def __init__(self, jitter_ms: float, error_rate: float, seed: int):
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+
+    def wait(self, operation: str, latency_ms: float):
+        """Sleep like the service would, then maybe fail with a throttle"""
+        with self._lock:
+            delay = latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.error_rate
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+            if fail:
+                self.errors[operation] = self.errors.get(operation, 0) + 1
+        time.sleep(delay / 1000)
+        if fail:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded (fake)"}},
+                operation
+            )
+
+
+def fake_question(seed: str) -> str:
+    """A question in the generator's block format, varied by seed"""
+    rng = random.Random(seed)
+    first, second, third = rng.sample(_LINES, 3)
+    options = "\n".join(f"{n}. {line}" for n, line in enumerate(rng.sample(_LINES, 4), 1))
+    return (
+        f"Introduction: {first}（{seed[:6]}）\n"
+        f"Conversation: 男：{second} 女：{third}\n"
+        f"Question: 女の人はこの後どうしますか。\n"
+        f"Options:\n{options}\n"
+    )
+
+
+def fake_embedding(text: str) -> List[float]:
+    """Deterministic unit vector for a text"""
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    vector = [rng.gauss(0, 1) for _ in range(EMBEDDING_DIMENSION)]
+    norm = sum(x * x for x in vector) ** 0.5
+    return [x / norm for x in vector]
+
+
+class FakeBedrockRuntime:
+    """Stands in for the bedrock-runtime client"""
+
+    def __init__(self, latency: FakeLatency, converse_ms: float, embed_ms: float, text_ms: float):
+        self.latency = latency
+        self.converse_ms = converse_ms
+        self.embed_ms = embed_ms
+        self.text_ms = text_ms
+
+    def converse(self, modelId, messages, **kwargs):
+        self.latency.wait("converse", self.converse_ms)
+        prompt = messages[-1]["content"][0]["text"]
+        text = fake_question(hashlib.sha256(f"{prompt}{time.perf_counter_ns()}".encode()).hexdigest())
+        return {
+            "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "usage": {"inputTokens": len(prompt) // 4, "outputTokens": len(text) // 2},
+        }
+
+    def converse_stream(self, modelId, messages, **kwargs):
+        response = self.converse(modelId, messages, **kwargs)
+        text = response["output"]["message"]["content"][0]["text"]
+        events = [{"contentBlockDelta": {"delta": {"text": line + "\n"}}} for line in text.splitlines()]
+        events.append({"metadata": {"usage": response["usage"]}})
+        return {"stream": iter(events)}
+
+    def invoke_model(self, modelId, body):
+        request = json.loads(body)
+        if "embed" in modelId:
+            self.latency.wait("invoke_model.embed", self.embed_ms)
+            result = {"embedding": fake_embedding(request["inputText"]),
+                      "inputTextTokenCount": len(request["inputText"]) // 2}
+        else:
+            self.latency.wait("invoke_model.text", self.text_ms)
+            rng = random.Random(request["inputText"])
+            result = {"results": [{"outputText": json.dumps({
+                "Introduction": rng.choice(_LINES),
+                "Conversation": f"男：{rng.choice(_LINES)} 女：{rng.choice(_LINES)}",
+                "Question": "男の人は何をしますか。",
+                "Options": rng.sample(_LINES, 4),
+                "CorrectAnswer": "A",
+                "Explanation": "会話の内容から。",
+            }, ensure_ascii=False)}]}
+        return {"body": io.BytesIO(json.dumps(result).encode("utf-8")), "ResponseMetadata": {"HTTPHeaders": {}}}
+
+
+class FakePolly:
+    """Stands in for the Polly client, returning silent MP3 of a realistic length"""
+
+    def __init__(self, latency: FakeLatency, polly_ms: float):
+        self.latency = latency
+        self.polly_ms = polly_ms
+
+    def synthesize_speech(self, Text, OutputFormat, VoiceId, **kwargs):
+        self.latency.wait("synthesize_speech", self.polly_ms)
+        # Roughly 150ms of speech per Japanese character
+        audio = mp3_frames.silence(max(300, 150 * len(Text)), *POLLY_FORMAT, bitrate_kbps=48)
+        return {"AudioStream": io.BytesIO(audio), "ContentType": "audio/mpeg"}
+
+
+def run_stage(name: str, operation: Callable, items: List, concurrency: int) -> Dict:
+    """Run operation over items with a thread pool; returns stats and results"""
+    latencies, errors, results = [], [], []
+    lock = threading.Lock()
+
+    def timed(item):
+        start = time.perf_counter()
+        try:
+            result = operation(item)
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+            return
+        with lock:
+            latencies.append(time.perf_counter() - start)
+            if result is not None:
+                results.append(result)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, items))
+    wall = time.perf_counter() - wall_start
+    stats = {
+        "operations": len(items),
+        "succeeded": len(latencies),
+        "errors": len(errors),
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(latencies) / wall, 3) if wall else 0.0,
+        "latency": latency_summary(latencies),
+        "sample_errors": sorted(set(errors))[:5],
+    }
+    return {"stats": stats, "results": results}
+
+
+def print_summary(report: Dict):
+    print(f"\n{'stage':<20} {'ok':>9} {'throughput':>12} {'p50':>10} {'p99':>10}")
+    for stage, stats in report["stages"].items():
+        print(f"{stage:<20} {stats['succeeded']:>4}/{stats['operations']:<4} {stats['throughput_per_s']:>10.2f}/s "
+              f"{stats['latency']['p50_ms']:>8.1f}ms {stats['latency']['p99_ms']:>8.1f}ms")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: Dict, baseline_file: str):
+    """Print the change of each stage against an earlier report"""
+    with open(baseline_file, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_file} (commit {baseline.get('commit', '?')}):")
+    for stage, stats in report["stages"].items():
+        before = baseline.get("stages", {}).get(stage)
+        if not before:
+            continue
+        p50, p50_before = stats["latency"]["p50_ms"], before["latency"]["p50_ms"]
+        tput, tput_before = stats["throughput_per_s"], before["throughput_per_s"]
+        p50_change = f"{(p50 - p50_before) / p50_before * 100:+.1f}%" if p50_before else "n/a"
+        tput_change = f"{(tput - tput_before) / tput_before * 100:+.1f}%" if tput_before else "n/a"
+        print(f"{stage:<20} p50 {p50_before:.1f} -> {p50:.1f}ms ({p50_change}), "
+              f"throughput {tput_before:.2f} -> {tput:.2f}/s ({tput_change})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--iterations", type=int, default=20, help="Operations per stage")
+    parser.add_argument("--index-questions", type=int, default=50, help="Questions indexed before searching")
+    parser.add_argument("--concurrency", type=int, default=4, help="Callers running each stage at once")
+    parser.add_argument("--converse-ms", type=float, default=800, help="Fake Converse latency")
+    parser.add_argument("--embed-ms", type=float, default=60, help="Fake Titan embedding latency")
+    parser.add_argument("--text-ms", type=float, default=1200, help="Fake Titan text latency")
+    parser.add_argument("--polly-ms", type=float, default=150, help="Fake Polly latency per part")
+    parser.add_argument("--jitter-ms", type=float, default=50, help="Uniform jitter added to every call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of calls failing with a throttle")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--stages", default=",".join(STAGES), help="Comma-separated stages to run")
+    parser.add_argument("--output", default="backend/data/benchmarks/pipeline.json")
+    parser.add_argument("--compare", help="Earlier report to compare against")
+    args = parser.parse_args()
+
+    stages = [stage for stage in args.stages.split(",") if stage]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise SystemExit(f"Unknown stages: {sorted(unknown)}")
+
+    latency = FakeLatency(args.jitter_ms, args.error_rate, args.seed)
+    gateway = BedrockGateway(
+        client=FakeBedrockRuntime(latency, args.converse_ms, args.embed_ms, args.text_ms),
+        max_concurrency=max(8, args.concurrency)
+    )
+    work_dir = tempfile.mkdtemp(prefix="pipeline_benchmark_")
+    report = {"commit": git_commit(), "config": vars(args), "stages": {}}
+    try:
+        vector_store = QuestionVectorStore(persist_directory=os.path.join(work_dir, "vectorstore"), gateway=gateway)
+        question_generator = QuestionGenerator(vector_store=vector_store, gateway=gateway)
+        audio_generator = AudioGenerator(
+            max_workers=args.concurrency,
+            polly_tps=1000.0,
+            audio_dir=os.path.join(work_dir, "audio"),
+            script_cache_dir=os.path.join(work_dir, "script_cache"),
+            polly_client=FakePolly(latency, args.polly_ms),
+            gateway=gateway
+        )
+        topics = ["Shopping", "Restaurant", "Travel", "School/Work", "Daily Conversation"]
+
+        # Seed questions and transcripts so search and generation have something to find
+        seed_parser = QuestionGenerator.parse_question_batch
+        seed_questions = [seed_parser(fake_question(f"seed-{i}"))[0] for i in range(args.index_questions)]
+        seed_batches = [
+            (f"bench{batch:04d}", seed_questions[start:start + 10])
+            for batch, start in enumerate(range(0, len(seed_questions), 10))
+        ]
+        questions = []
+
+        if "index" in stages:
+            result = run_stage(
+                "index", lambda batch: vector_store.add_questions(2, batch[1], batch[0]),
+                seed_batches, 1
+            )
+            report["stages"]["index"] = result["stats"]
+        else:
+            for video_id, batch in seed_batches:
+                vector_store.add_questions(2, batch, video_id)
+        vector_store.add_transcript(
+            "benchtranscript",
+            [{"text": line, "start": i * 3.0, "duration": 3.0} for i, line in enumerate(_LINES * 3)]
+        )
+
+        queries = [topics[i % len(topics)] for i in range(args.iterations)]
+        if "search" in stages:
+            report["stages"]["search"] = run_stage(
+                "search", lambda topic: vector_store.search_similar_questions(2, topic, n_results=3),
+                queries, args.concurrency
+            )["stats"]
+        if "question" in stages or "audio" in stages:
+            def generate_question(topic):
+                question = question_generator.generate_similar_question(2, topic)
+                if question is None:
+                    raise RuntimeError("No question generated")
+                return question
+
+            result = run_stage("question", generate_question, queries, args.concurrency)
+            questions = result["results"]
+            if "question" in stages:
+                report["stages"]["question"] = result["stats"]
+        if "transcript_question" in stages:
+            report["stages"]["transcript_question"] = run_stage(
+                "transcript_question", vector_store.generate_question_from_transcript,
+                queries, args.concurrency
+            )["stats"]
+        if "audio" in stages:
+            report["stages"]["audio"] = run_stage(
+                "audio", audio_generator.generate_audio, questions, args.concurrency
+            )["stats"]
+
+        report["fake_service_calls"] = {"calls": latency.calls, "injected_errors": latency.errors}
+        report["gateway_metrics"] = gateway.metrics()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    write_report(report, args.output)
+    print_summary(report)
+    print(f"Report written to {args.output}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark per-session vs shared construction of the app's resources
+
+Simulates a number of browser sessions starting up. In "per-session" mode
+every session builds its own AudioGenerator, QuestionVectorStore,
+YouTubeService and QuestionStore (what st.session_state initialization
+used to do); in "shared" mode they are built once and every session reuses
+them (frontend/resources.py). Each mode runs in a fresh subprocess and
+reports per-session startup latency and RSS growth.
+
+Only clients are constructed; no AWS calls are made. Chroma and SQLite use
+a temporary directory.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.session_startup_benchmark --sessions 50
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# The resources build boto3 clients, which need a region but no credentials
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from backend.benchmarks.common import latency_summary, write_report
+from backend.utils.metrics import current_rss_mb
+
+MODES = ("per-session", "shared")
+
+
+def build_resources(work_dir: str):
+    from backend.services.audio_generator import AudioGenerator
+    from backend.services.question_store import QuestionStore
+    from backend.services.vector_store import QuestionVectorStore
+    from backend.services.youtube_service import YouTubeService
+
+    return {
+        "audio_generator": AudioGenerator(),
+        "vector_store": QuestionVectorStore(persist_directory=os.path.join(work_dir, "vectorstore")),
+        "youtube_service": YouTubeService(),
+        "question_store": QuestionStore(os.path.join(work_dir, "questions.sqlite3"), legacy_json_path=None),
+    }
+
+
+def run_mode(mode: str, sessions: int, work_dir: str) -> dict:
+    """Start the sessions in this process and measure them"""
+    rss_start = current_rss_mb()
+    shared = None
+    session_states = []
+    latencies = []
+    for _ in range(sessions):
+        start = time.perf_counter()
+        if mode == "shared":
+            if shared is None:
+                shared = build_resources(work_dir)
+            session_states.append(dict(shared))
+        else:
+            session_states.append(build_resources(work_dir))
+        latencies.append(time.perf_counter() - start)
+    return {
+        "latency": latency_summary(latencies),
+        "first_session_ms": round(latencies[0] * 1000, 3),
+        "later_sessions": latency_summary(latencies[1:]),
+        "rss_start_mb": round(rss_start, 1),
+        "rss_end_mb": round(current_rss_mb(), 1),
+        "rss_per_session_mb": round((current_rss_mb() - rss_start) / sessions, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--output", default="backend/data/benchmarks/session_startup.json")
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(args.worker, args.sessions, args.work_dir)))
+        return
+
+    results = {}
+    for mode in MODES:
+        work_dir = tempfile.mkdtemp(prefix="session_bench_")
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-m", "backend.benchmarks.session_startup_benchmark",
+                 "--worker", mode, "--sessions", str(args.sessions), "--work-dir", work_dir],
+                capture_output=True, text=True, check=True
+            )
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(f"{mode}: first={results[mode]['first_session_ms']}ms "
+              f"later p50={results[mode]['later_sessions']['p50_ms']}ms "
+              f"RSS/session={results[mode]['rss_per_session_mb']}MB "
+              f"RSS end={results[mode]['rss_end_mb']}MB")
+
+    write_report({"sessions": args.sessions, "results": results}, args.output)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
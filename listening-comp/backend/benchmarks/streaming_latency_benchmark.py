@@ -0,0 +1,152 @@
+"""Benchmark perceived latency of streamed versus blocking question generation
+
+Generates the same question repeatedly through the Bedrock gateway, once
+with Converse (the learner sees nothing until the whole reply arrives) and
+once with ConverseStream fed through IncrementalQuestionParser. Reports time
+to first token, time until the first question block (e.g. the introduction)
+is complete and can be shown, and total time. By default a stub client
+replays a canned question with a configurable first-token delay and
+per-token delay, so no AWS requests are made; pass --live to call Bedrock.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.streaming_latency_benchmark --requests 10 --first-token-ms 400 --token-ms 15
+"""
+import argparse
+import re
+import time
+
+from backend.benchmarks.common import latency_summary, write_report
+from backend.services.bedrock_gateway import BedrockGateway
+from backend.services.question_stream_parser import IncrementalQuestionParser
+
+MODEL_ID = "amazon.nova-lite-v1:0"
+
+PROMPT = """Create a new JLPT N4 listening question about shopping. Use exactly this format:
+
+Introduction: <one sentence setting the scene>
+Conversation: <a short dialogue>
+Question: <the question>
+Options:
+1. <option>
+2. <option>
+3. <option>
+4. <option>
+
+Return ONLY the question without any additional text."""
+
+CANNED_QUESTION = """Introduction: デパートで女の人と店員が話しています。
+Conversation: 女：すみません、このシャツの青いのはありますか。
+男：申し訳ありません、青は売り切れです。白と黒ならございます。
+女：じゃあ、黒を見せてください。サイズはMでお願いします。
+Question: 女の人はどのシャツを見ますか。
+Options:
+1. 青いシャツのM
+2. 白いシャツのM
+3. 黒いシャツのM
+4. 黒いシャツのL
+"""
+
+
+class StubStreamingClient:
+    """Stands in for bedrock-runtime, replaying CANNED_QUESTION with artificial latency"""
+
+    def __init__(self, first_token_ms: float, token_ms: float):
+        self.first_token_ms = first_token_ms
+        self.token_ms = token_ms
+        # Roughly one token per word or per two Japanese characters
+        self.tokens = re.findall(r"\s*\S{1,2}", CANNED_QUESTION) + ["\n"]
+
+    def _usage(self):
+        return {"inputTokens": len(PROMPT) // 4, "outputTokens": len(self.tokens)}
+
+    def converse(self, modelId, messages, **kwargs):
+        time.sleep((self.first_token_ms + self.token_ms * len(self.tokens)) / 1000)
+        return {
+            "output": {"message": {"content": [{"text": CANNED_QUESTION}]}},
+            "usage": self._usage(),
+        }
+
+    def converse_stream(self, modelId, messages, **kwargs):
+        def events():
+            time.sleep(self.first_token_ms / 1000)
+            yield {"messageStart": {"role": "assistant"}}
+            for token in self.tokens:
+                time.sleep(self.token_ms / 1000)
+                yield {"contentBlockDelta": {"delta": {"text": token}, "contentBlockIndex": 0}}
+            yield {"messageStop": {"stopReason": "end_turn"}}
+            yield {"metadata": {"usage": self._usage()}}
+
+        return {"stream": events()}
+
+
+def run_blocking(gateway: BedrockGateway, model_id: str) -> float:
+    start = time.perf_counter()
+    text = gateway.converse_text(model_id, PROMPT)
+    parser = IncrementalQuestionParser()
+    parser.feed(text)
+    parser.finish()
+    return time.perf_counter() - start
+
+
+def run_streaming(gateway: BedrockGateway, model_id: str):
+    """Returns (time to first token, time to first complete block, total)"""
+    start = time.perf_counter()
+    first_token = first_block = None
+    parser = IncrementalQuestionParser()
+    for delta in gateway.converse_stream_text(model_id, PROMPT):
+        now = time.perf_counter() - start
+        if first_token is None:
+            first_token = now
+        parser.feed(delta)
+        if first_block is None and parser.completed_fields:
+            first_block = now
+    parser.finish()
+    total = time.perf_counter() - start
+    return first_token, first_block if first_block is not None else total, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--live", action="store_true", help="Call Bedrock instead of the stub client")
+    parser.add_argument("--model-id", default=MODEL_ID)
+    parser.add_argument("--first-token-ms", type=float, default=400, help="Stub delay before the first token")
+    parser.add_argument("--token-ms", type=float, default=15, help="Stub delay per output token")
+    parser.add_argument("--output", default="backend/data/benchmarks/streaming_latency.json")
+    args = parser.parse_args()
+
+    client = None if args.live else StubStreamingClient(args.first_token_ms, args.token_ms)
+    gateway = BedrockGateway(client=client)
+
+    blocking = [run_blocking(gateway, args.model_id) for _ in range(args.requests)]
+    first_tokens, first_blocks, totals = [], [], []
+    for _ in range(args.requests):
+        first_token, first_block, total = run_streaming(gateway, args.model_id)
+        first_tokens.append(first_token)
+        first_blocks.append(first_block)
+        totals.append(total)
+
+    report = {
+        "config": vars(args),
+        "blocking": {"total": latency_summary(blocking)},
+        "streaming": {
+            "first_token": latency_summary(first_tokens),
+            "first_block": latency_summary(first_blocks),
+            "total": latency_summary(totals),
+        },
+        "gateway_metrics": gateway.metrics(),
+    }
+    write_report(report, args.output)
+
+    print(f"{'mode':<10} {'first token p50':>16} {'first block p50':>16} {'total p50':>10} {'total p99':>10}")
+    print(f"{'blocking':<10} {'-':>16} {'-':>16} "
+          f"{report['blocking']['total']['p50_ms']:>10.0f} {report['blocking']['total']['p99_ms']:>10.0f}")
+    streaming = report["streaming"]
+    print(f"{'streaming':<10} {streaming['first_token']['p50_ms']:>16.0f} {streaming['first_block']['p50_ms']:>16.0f} "
+          f"{streaming['total']['p50_ms']:>10.0f} {streaming['total']['p99_ms']:>10.0f}")
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
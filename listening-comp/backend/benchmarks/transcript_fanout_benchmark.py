@@ -0,0 +1,114 @@
+"""Benchmark concurrent transcript fetching against a local fake server
+
+Starts a local HTTP server that serves fake transcripts at
+/transcript/<video_id> after a configurable latency (plus jitter, with a
+fraction of videos that are much slower), then fetches a level's worth of
+videos through YouTubeService.get_transcripts at several concurrency
+limits. Reports wall time, speedup over the first (lowest) limit and how many
+videos hit the per-video timeout. No YouTube requests are made.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.benchmarks.transcript_fanout_benchmark --videos 20 --latency-ms 300
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.benchmarks.common import write_report
+from backend.services.youtube_service import YouTubeService
+
+
+class FakeTranscriptServer:
+    """Serves fake transcripts with artificial latency on a free local port"""
+
+    def __init__(self, latency_ms: float, jitter_ms: float, slow_fraction: float, slow_ms: float, seed: int = 0):
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                video_id = self.path.rsplit("/", 1)[-1]
+                # Seeded per video, so every run sees the same slow videos
+                rng = random.Random(f"{seed}-{video_id}")
+                delay = latency_ms + rng.uniform(0, jitter_ms)
+                if rng.random() < slow_fraction:
+                    delay = slow_ms
+                time.sleep(delay / 1000)
+                body = json.dumps([
+                    {"text": f"{video_id} のセリフ {i}", "start": i * 2.0, "duration": 2.0}
+                    for i in range(50)
+                ], ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def fetcher(self, video_id: str):
+        with urllib.request.urlopen(f"{self.url}/transcript/{video_id}", timeout=60) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    def shutdown(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--videos", type=int, default=20)
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Comma-separated concurrency limits")
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--slow-fraction", type=float, default=0.05, help="Share of videos that respond slowly")
+    parser.add_argument("--slow-ms", type=float, default=5000)
+    parser.add_argument("--timeout", type=float, default=2.0, help="Per-video timeout in seconds")
+    parser.add_argument("--rate", type=float, default=50.0, help="Allowed fetches per second per host")
+    parser.add_argument("--output", default="backend/data/benchmarks/transcript_fanout.json")
+    args = parser.parse_args()
+
+    urls = [f"https://www.youtube.com/watch?v=fake{i:07d}" for i in range(args.videos)]
+    results = {}
+    baseline = None
+    for concurrency in [int(c) for c in args.concurrency.split(",")]:
+        server = FakeTranscriptServer(args.latency_ms, args.jitter_ms, args.slow_fraction, args.slow_ms)
+        try:
+            service = YouTubeService(
+                transcript_fetcher=server.fetcher,
+                max_concurrent_fetches=concurrency,
+                requests_per_second=args.rate,
+                fetch_timeout=args.timeout
+            )
+            start = time.perf_counter()
+            transcripts = asyncio.run(service.get_transcripts(urls))
+            elapsed = time.perf_counter() - start
+            # Let timed-out fetches finish before the server goes away
+            service.close()
+        finally:
+            server.shutdown()
+        baseline = baseline or elapsed
+        results[str(concurrency)] = {
+            "seconds": round(elapsed, 3),
+            "speedup": round(baseline / elapsed, 2),
+            "fetched": len(transcripts),
+            "timed_out": args.videos - len(transcripts),
+        }
+        print(f"concurrency={concurrency}: {elapsed:.2f}s speedup={results[str(concurrency)]['speedup']}x "
+              f"fetched={len(transcripts)}/{args.videos}")
+
+    write_report({"config": vars(args), "results": results}, args.output)
+    print(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
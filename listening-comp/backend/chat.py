@@ -1,8 +1,8 @@
 # Create BedrockChat
 # bedrock_chat.py
-import boto3
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
+from backend.services.bedrock_gateway import THROTTLED_MESSAGE, BedrockThrottledError, get_bedrock_gateway
 
 
 # Model ID
@@ -13,7 +13,7 @@ MODEL_ID = "amazon.nova-micro-v1:0"
 class BedrockChat:
     def __init__(self, model_id: str = MODEL_ID):
         """Initialize Bedrock chat client"""
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name="us-east-1")
+        self.gateway = get_bedrock_gateway()
         self.model_id = model_id
 
     def generate_response(self, message: str, inference_config: Optional[Dict[str, Any]] = None) -> Optional[str]:
@@ -27,17 +27,33 @@ class BedrockChat:
         }]
 
         try:
-            response = self.bedrock_client.converse(
-                modelId=self.model_id,
-                messages=messages,
-                inferenceConfig=inference_config
-            )
+            response = self.gateway.converse(self.model_id, messages, inference_config)
             return response['output']['message']['content'][0]['text']
             
+        except BedrockThrottledError:
+            st.warning(THROTTLED_MESSAGE)
+            return None
         except Exception as e:
             st.error(f"Error generating response: {str(e)}")
             return None
 
+    def generate_response_stream(self, message: str, inference_config: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """Generate a response, yielding text as Bedrock streams it back"""
+        if inference_config is None:
+            inference_config = {"temperature": 0.7}
+
+        messages = [{
+            "role": "user",
+            "content": [{"text": message}]
+        }]
+
+        try:
+            yield from self.gateway.converse_stream(self.model_id, messages, inference_config)
+        except BedrockThrottledError:
+            st.warning(THROTTLED_MESSAGE)
+        except Exception as e:
+            st.error(f"Error generating response: {str(e)}")
+
 
 if __name__ == "__main__":
     chat = BedrockChat()
@@ -45,5 +61,7 @@ if __name__ == "__main__":
         user_input = input("You: ")
         if user_input.lower() == '/exit':
             break
-        response = chat.generate_response(user_input)
-        print("Bot:", response)
+        print("Bot: ", end="", flush=True)
+        for text in chat.generate_response_stream(user_input):
+            print(text, end="", flush=True)
+        print()
@@ -2,12 +2,12 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import TextFormatter
 from typing import Optional, Dict
 import re
 from urllib.parse import urlparse, parse_qs
 from .structured_data import TranscriptStructurer
+from backend.services.transcript_cache import cached_transcript
 import logging
 
 # Configure logging
@@ -57,8 +57,8 @@ class YouTubeTranscriptDownloader:
 
             logger.info(f"Downloading transcript for video ID: {video_id}")
 
-            # Get transcript
-            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=["ja"])
+            # Get transcript (served from the shared transcript cache when fresh)
+            transcript = cached_transcript(video_id, "ja")
             if not transcript:
                 logger.error("No transcript found")
                 return None
@@ -0,0 +1,316 @@
+"""Bulk ingestion pipeline: fetch -> structure -> parse -> index
+
+Takes a file of YouTube URLs (one per line, # for comments) and runs the
+steps that used to be done by hand (get_transcript.py, structured_data.py,
+QuestionVectorStore.index_questions_file) as concurrent stages connected by
+bounded queues. Every stage a video completes is checkpointed in a
+manifest, so a rerun skips finished work and resumes failed videos at the
+stage that failed. Stage throughput is reported at the end.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.ingest_pipeline urls.txt
+    python -m backend.ingest_pipeline urls.txt --stub   # offline, no YouTube/AWS
+"""
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from backend.services.youtube_service import YouTubeService
+from backend.utils.file_utils import atomic_write_bytes
+from backend.utils.logger import Logger
+
+STAGES = ("fetch", "structure", "parse", "index")
+_DONE = object()
+
+
+class Manifest:
+    """Per-video, per-stage checkpoints stored as JSON"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.videos = json.load(f)
+        except FileNotFoundError:
+            self.videos = {}
+
+    def completed(self, video_id: str, stage: str) -> Optional[Dict]:
+        with self._lock:
+            return self.videos.get(video_id, {}).get("stages", {}).get(stage)
+
+    def record(self, video_id: str, url: str, stage: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        with self._lock:
+            entry = self.videos.setdefault(video_id, {"url": url, "stages": {}})
+            if error is None:
+                entry["stages"][stage] = {**(result or {}), "completed_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+                entry.pop("error", None)
+            else:
+                entry["error"] = {"stage": stage, "message": error}
+            data = json.dumps(self.videos, ensure_ascii=False, indent=2).encode("utf-8")
+            atomic_write_bytes(self.path, data)
+
+
+class StageStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.processed = 0
+        self.skipped = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+
+    def add(self, outcome: str, started: float, ended: float):
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            if outcome == "processed":
+                self.busy_seconds += ended - started
+                self.first_start = started if self.first_start is None else min(self.first_start, started)
+                self.last_end = ended if self.last_end is None else max(self.last_end, ended)
+
+    def summary(self) -> Dict:
+        wall = (self.last_end - self.first_start) if self.processed else 0.0
+        return {
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "wall_seconds": round(wall, 3),
+            "videos_per_second": round(self.processed / wall, 3) if wall else 0.0,
+        }
+
+
+class IngestPipeline:
+    def __init__(
+        self,
+        transcript_fetcher: Callable[[str, str], List[Dict]],
+        structurer,
+        vector_store_factory: Callable[[], object],
+        data_dir: str = "backend/data",
+        manifest_path: Optional[str] = None,
+        workers: Optional[Dict[str, int]] = None,
+        queue_size: int = 4
+    ):
+        """
+        Args:
+            transcript_fetcher: Returns transcript segments for (video_id, language)
+            structurer: TranscriptStructurer (or stub) used for section extraction
+            vector_store_factory: Builds the QuestionVectorStore, only if indexing is needed
+            data_dir: Directory for transcripts/ and questions/
+            manifest_path: Checkpoint file (defaults to data_dir/ingest_manifest.json)
+            workers: Worker threads per stage
+            queue_size: Capacity of the queue in front of each stage
+        """
+        self.transcript_fetcher = transcript_fetcher
+        self.structurer = structurer
+        self.vector_store_factory = vector_store_factory
+        self._vector_store = None
+        self._vector_store_lock = threading.Lock()
+        self.transcript_dir = os.path.join(data_dir, "transcripts")
+        self.questions_dir = os.path.join(data_dir, "questions")
+        os.makedirs(self.transcript_dir, exist_ok=True)
+        os.makedirs(self.questions_dir, exist_ok=True)
+        self.manifest = Manifest(manifest_path or os.path.join(data_dir, "ingest_manifest.json"))
+        self.workers = {"fetch": 4, "structure": 2, "parse": 1, "index": 1, **(workers or {})}
+        self.queue_size = queue_size
+        self.stats = {stage: StageStats() for stage in STAGES}
+        self.logger = Logger().get_logger()
+
+    @property
+    def vector_store(self):
+        with self._vector_store_lock:
+            if self._vector_store is None:
+                self._vector_store = self.vector_store_factory()
+            return self._vector_store
+
+    # Stage bodies: take the video's work item, return the checkpoint record
+
+    def _fetch(self, item: Dict) -> Dict:
+        segments = self.transcript_fetcher(item["video_id"], "ja")
+        if not segments:
+            raise ValueError("No transcript found")
+        path = os.path.join(self.transcript_dir, f"{item['video_id']}.txt")
+        atomic_write_bytes(path, "\n".join(s["text"] for s in segments).encode("utf-8"))
+        return {"transcript_file": path, "segments": len(segments)}
+
+    def _structure(self, item: Dict) -> Dict:
+        with open(item["fetch"]["transcript_file"], "r", encoding="utf-8") as f:
+            transcript = f.read()
+        sections = self.structurer.structure_transcript(transcript)
+        if not sections:
+            raise ValueError("No sections extracted")
+        base = os.path.join(self.questions_dir, item["video_id"])
+        if not self.structurer.save_questions(sections, base):
+            raise IOError("Could not save structured questions")
+        return {"section_files": {str(n): f"{base}_section{n}.txt" for n in sections}}
+
+    def _parse(self, item: Dict) -> Dict:
+        parsed = {
+            section: self.vector_store.parse_questions_from_file(path)
+            for section, path in item["structure"]["section_files"].items()
+        }
+        path = os.path.join(self.questions_dir, f"{item['video_id']}_parsed.json")
+        atomic_write_bytes(path, json.dumps(parsed, ensure_ascii=False).encode("utf-8"))
+        return {"parsed_file": path, "questions": {s: len(q) for s, q in parsed.items()}}
+
+    def _index(self, item: Dict) -> Dict:
+        with open(item["parse"]["parsed_file"], "r", encoding="utf-8") as f:
+            parsed = json.load(f)
+        results = {}
+        for section, questions in parsed.items():
+            if questions:
+                results[section] = self.vector_store.add_questions(int(section), questions, item["video_id"])
+        return {"index_stats": results}
+
+    def _record(self, item: Dict, stage: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        """Checkpoint a stage outcome; a failed manifest write is logged, not raised"""
+        try:
+            self.manifest.record(item["video_id"], item.get("url", ""), stage, result, error=error)
+        except Exception as e:
+            self.logger.error(f"[{stage}] {item.get('video_id')}: could not update the manifest: {str(e)}")
+
+    def _process(self, stage: str, item: Dict) -> bool:
+        """Run one stage on a work item; returns whether to pass it on"""
+        video_id = item["video_id"]
+        started = time.perf_counter()
+        done = self.manifest.completed(video_id, stage)
+        if done is not None:
+            item[stage] = done
+            self.stats[stage].add("skipped", started, started)
+            return True
+        try:
+            item[stage] = getattr(self, f"_{stage}")(item)
+        except Exception as e:
+            self.stats[stage].add("failed", started, time.perf_counter())
+            self.logger.error(f"[{stage}] {video_id} failed: {str(e)}")
+            self._record(item, stage, error=str(e))
+            return False
+        self._record(item, stage, item[stage])
+        self.stats[stage].add("processed", started, time.perf_counter())
+        self.logger.info(f"[{stage}] {video_id} done in {time.perf_counter() - started:.2f}s")
+        return True
+
+    def _worker(self, stage: str, inbox: queue.Queue, outbox: Optional[queue.Queue]):
+        # Never let an item kill the thread: the bounded queues would fill up
+        # and block the upstream stages, so run() would never return
+        while True:
+            item = inbox.get()
+            try:
+                if item is _DONE:
+                    return
+                forward = False
+                try:
+                    forward = self._process(stage, item)
+                except Exception as e:
+                    self.logger.error(f"[{stage}] could not process work item {item!r}: {str(e)}")
+                if forward and outbox is not None:
+                    outbox.put(item)
+            finally:
+                inbox.task_done()
+
+    def run(self, urls: List[str]) -> Dict:
+        """Ingest the videos and return the per-stage throughput report"""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in STAGES]
+        stage_threads = []
+        for index, stage in enumerate(STAGES):
+            outbox = queues[index + 1] if index + 1 < len(STAGES) else None
+            threads = [
+                threading.Thread(target=self._worker, args=(stage, queues[index], outbox), daemon=True)
+                for _ in range(self.workers[stage])
+            ]
+            for thread in threads:
+                thread.start()
+            stage_threads.append(threads)
+
+        start = time.perf_counter()
+        seen = set()
+        for url in urls:
+            video_id = YouTubeService.extract_video_id(url)
+            if not video_id or video_id in seen:
+                self.logger.warning(f"Skipping invalid or repeated URL: {url}")
+                continue
+            seen.add(video_id)
+            queues[0].put({"video_id": video_id, "url": url})
+
+        # Shut the stages down in order once each one's input is exhausted
+        for index, threads in enumerate(stage_threads):
+            for _ in threads:
+                queues[index].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        return {
+            "videos": len(seen),
+            "total_seconds": round(time.perf_counter() - start, 3),
+            "stages": {stage: self.stats[stage].summary() for stage in STAGES},
+        }
+
+
+def read_urls(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("urls_file", help="File with one YouTube URL per line")
+    parser.add_argument("--data-dir", help="Output directory (default backend/data, or backend/data/ingest_stub with --stub)")
+    parser.add_argument("--manifest", help="Checkpoint manifest path (default <data-dir>/ingest_manifest.json)")
+    parser.add_argument("--stub", action="store_true", help="Use offline stubs instead of YouTube and Bedrock")
+    parser.add_argument("--stub-latency", type=float, default=0.05, help="Seconds each stubbed call sleeps")
+    parser.add_argument("--queue-size", type=int, default=4)
+    for stage in STAGES:
+        parser.add_argument(f"--{stage}-workers", type=int)
+    parser.add_argument("--report", help="Also write the throughput report to this JSON file")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir or ("backend/data/ingest_stub" if args.stub else "backend/data")
+    if args.stub:
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+        from backend.services.vector_store import QuestionVectorStore
+        from backend.stubs import HashEmbeddingFunction, StubStructurer, StubTranscriptFetcher
+
+        transcript_fetcher = StubTranscriptFetcher(latency=args.stub_latency)
+        structurer = StubStructurer(latency=args.stub_latency)
+        embedding_fn = HashEmbeddingFunction(latency=args.stub_latency)
+        vector_store_factory = lambda: QuestionVectorStore(
+            persist_directory=os.path.join(data_dir, "vectorstore"), embedding_fn=embedding_fn
+        )
+    else:
+        from backend.services.transcript_cache import get_transcript_cache
+        from backend.services.vector_store import QuestionVectorStore
+        from backend.structured_data import TranscriptStructurer
+
+        transcript_fetcher = get_transcript_cache().get_or_fetch
+        structurer = TranscriptStructurer()
+        vector_store_factory = QuestionVectorStore
+
+    pipeline = IngestPipeline(
+        transcript_fetcher,
+        structurer,
+        vector_store_factory,
+        data_dir=data_dir,
+        manifest_path=args.manifest,
+        workers={stage: getattr(args, f"{stage}_workers") for stage in STAGES if getattr(args, f"{stage}_workers")},
+        queue_size=args.queue_size,
+    )
+    report = pipeline.run(read_urls(args.urls_file))
+
+    print(f"Ingested {report['videos']} videos in {report['total_seconds']}s")
+    for stage, summary in report["stages"].items():
+        print(f"  {stage:<9} processed={summary['processed']} skipped={summary['skipped']} "
+              f"failed={summary['failed']} busy={summary['busy_seconds']}s "
+              f"throughput={summary['videos_per_second']} videos/s")
+    if args.report:
+        from backend.benchmarks.common import write_report
+        write_report(report, args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,53 @@
-import boto3
 import json
-from typing import Dict, List, Optional
-from backend.vector_store import QuestionVectorStore
+import math
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from backend.services.bedrock_gateway import BedrockGateway, BedrockThrottledError, get_bedrock_gateway
+from backend.services.question_stream_parser import IncrementalQuestionParser
+from backend.services.vector_store import QuestionVectorStore
+from backend.utils.content_hash import content_hash, normalize_text
+from backend.utils.logger import Logger
+
+# Line that starts each question in a batch reply; the model sometimes numbers it
+QUESTION_DELIMITER = "=== Question ==="
+_DELIMITER_LINE = re.compile(r"^\s*===[^\n]*===\s*$", re.MULTILINE)
+
+# Fields a question needs for its section, besides the 4 options
+REQUIRED_FIELDS = {
+    2: ("Introduction", "Conversation", "Question"),
+    3: ("Situation", "Question"),
+}
+
+# Rough output budget per question, used to size maxTokens for a batch
+TOKENS_PER_QUESTION = 400
 
 
 class QuestionGenerator:
-    def __init__(self):
-        """Initialize Bedrock client and vector store"""
-        self.bedrock_client = boto3.client("bedrock-runtime", region_name="us-east-1")
-        self.vector_store = QuestionVectorStore()
+    def __init__(self, vector_store: Optional[QuestionVectorStore] = None, gateway: Optional[BedrockGateway] = None):
+        """Initialize Bedrock gateway and vector store (shared ones if given)"""
+        self.gateway = gateway or get_bedrock_gateway()
+        self.vector_store = vector_store or QuestionVectorStore()
         self.model_id = "amazon.nova-lite-v1:0"
+        self.logger = Logger().get_logger()
 
-    def _invoke_bedrock(self, prompt: str) -> Optional[str]:
-        """Invoke Bedrock with the given prompt"""
-        try:
-            messages = [{"role": "user", "content": [{"text": prompt}]}]
+    def _invoke_bedrock(self, prompt: str, inference_config: Optional[Dict] = None) -> Optional[str]:
+        """Invoke Bedrock with the given prompt
 
-            response = self.bedrock_client.converse(
-                modelId=self.model_id,
-                messages=messages,
-                inferenceConfig={"temperature": 0.7},
+        Returns None if the call fails; BedrockThrottledError is raised so
+        callers can tell the user to retry later.
+        """
+        try:
+            return self.gateway.converse_text(
+                self.model_id, prompt, inference_config=inference_config or {"temperature": 0.7}
             )
-
-            return response["output"]["message"]["content"][0]["text"]
+        except BedrockThrottledError:
+            raise
         except Exception as e:
-            print(f"Error invoking Bedrock: {str(e)}")
-            return None
-
-    def generate_similar_question(self, section_num: int, topic: str) -> Dict:
-        """Generate a new question similar to existing ones on a given topic"""
-        # Get similar questions for context
-        similar_questions = self.vector_store.search_similar_questions(
-            section_num, topic, n_results=3
-        )
-
-        if not similar_questions:
+            self.logger.error(f"Error invoking Bedrock: {str(e)}")
             return None
 
+    def _build_example_context(self, section_num: int, similar_questions: List[Dict]) -> str:
+        """Format similar stored questions as prompt examples"""
         # Create context from similar questions
         context = "Here are some example JLPT listening questions:\n\n"
         for idx, q in enumerate(similar_questions, 1):
@@ -58,6 +69,19 @@ class QuestionGenerator:
                     for i, opt in enumerate(q["Options"], 1):
                         context += f"{i}. {opt}\n"
             context += "\n"
+        return context
+
+    def _build_similar_question_prompt(self, section_num: int, topic: str) -> Optional[str]:
+        """Build the generation prompt from similar stored questions (None if there are none)"""
+        # Get similar questions for context
+        similar_questions = self.vector_store.search_similar_questions(
+            section_num, topic, n_results=3
+        )
+
+        if not similar_questions:
+            return None
+
+        context = self._build_example_context(section_num, similar_questions)
 
         # Create prompt for generating new question
         prompt = f"""Based on the following example JLPT listening questions, create a new question about {topic}.
@@ -72,6 +96,25 @@ class QuestionGenerator:
         
         New Question:
         """
+        return prompt
+
+    def _finalize_question(self, question: Dict) -> Dict:
+        """Ensure we have exactly 4 options"""
+        if "Options" not in question or len(question.get("Options", [])) != 4:
+            # Use default options if we don't have exactly 4
+            question["Options"] = [
+                "ピザを食べる",
+                "ハンバーガーを食べる",
+                "サラダを食べる",
+                "パスタを食べる",
+            ]
+        return question
+
+    def generate_similar_question(self, section_num: int, topic: str) -> Dict:
+        """Generate a new question similar to existing ones on a given topic"""
+        prompt = self._build_similar_question_prompt(section_num, topic)
+        if not prompt:
+            return None
 
         # Generate new question
         response = self._invoke_bedrock(prompt)
@@ -80,67 +123,149 @@ class QuestionGenerator:
 
         # Parse the generated question
         try:
-            lines = response.strip().split("\n")
-            question = {}
-            current_key = None
-            current_value = []
-
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                if line.startswith("Introduction:"):
-                    if current_key:
-                        question[current_key] = " ".join(current_value)
-                    current_key = "Introduction"
-                    current_value = [line.replace("Introduction:", "").strip()]
-                elif line.startswith("Conversation:"):
-                    if current_key:
-                        question[current_key] = " ".join(current_value)
-                    current_key = "Conversation"
-                    current_value = [line.replace("Conversation:", "").strip()]
-                elif line.startswith("Situation:"):
-                    if current_key:
-                        question[current_key] = " ".join(current_value)
-                    current_key = "Situation"
-                    current_value = [line.replace("Situation:", "").strip()]
-                elif line.startswith("Question:"):
-                    if current_key:
-                        question[current_key] = " ".join(current_value)
-                    current_key = "Question"
-                    current_value = [line.replace("Question:", "").strip()]
-                elif line.startswith("Options:"):
-                    if current_key:
-                        question[current_key] = " ".join(current_value)
-                    current_key = "Options"
-                    current_value = []
-                elif line[0].isdigit() and line[1] == "." and current_key == "Options":
-                    current_value.append(line[2:].strip())
-                elif current_key:
-                    current_value.append(line)
-
-            if current_key:
-                if current_key == "Options":
-                    question[current_key] = current_value
-                else:
-                    question[current_key] = " ".join(current_value)
-
-            # Ensure we have exactly 4 options
-            if "Options" not in question or len(question.get("Options", [])) != 4:
-                # Use default options if we don't have exactly 4
-                question["Options"] = [
-                    "ピザを食べる",
-                    "ハンバーガーを食べる",
-                    "サラダを食べる",
-                    "パスタを食べる",
-                ]
-
-            return question
+            parser = IncrementalQuestionParser()
+            parser.feed(response.strip())
+            return self._finalize_question(parser.finish())
         except Exception as e:
-            print(f"Error parsing generated question: {str(e)}")
+            self.logger.error(f"Error parsing generated question: {str(e)}")
             return None
 
+    def generate_similar_question_stream(self, section_num: int, topic: str) -> Iterator[Tuple[Dict, bool]]:
+        """Stream a new similar question as (question, complete) pairs
+
+        Partial questions hold the fields parsed so far, so the UI can show
+        the introduction while the model is still writing the options. The
+        final pair has complete=True and the same question that
+        generate_similar_question would return; it is missing if the
+        request fails. BedrockThrottledError is raised as is.
+        """
+        prompt = self._build_similar_question_prompt(section_num, topic)
+        if not prompt:
+            return
+
+        parser = IncrementalQuestionParser()
+        try:
+            for delta in self.gateway.converse_stream_text(
+                self.model_id, prompt, inference_config={"temperature": 0.7}
+            ):
+                yield parser.feed(delta), False
+        except BedrockThrottledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Error streaming from Bedrock: {str(e)}")
+            return
+        yield self._finalize_question(parser.finish()), True
+
+    def _build_batch_prompt(self, topic: str, context: str, count: int) -> str:
+        """Prompt asking for several delimited questions in one reply"""
+        return f"""Based on the following example JLPT listening questions, create {count} new questions about {topic}.
+        Each question should follow the same format but be different from the examples and from each other.
+        Make sure each question tests listening comprehension and has a clear correct answer.
+        
+        {context}
+        
+        Generate {count} new questions following the exact same format as above. Include all components (Introduction/Situation, 
+        Conversation/Question, and Options with exactly 4 numbered options). Make sure each question is challenging but fair, 
+        and the options are plausible but with only one clearly correct answer.
+        Start every question with a line containing only {QUESTION_DELIMITER}
+        Return ONLY the questions without any additional text.
+        """
+
+    @staticmethod
+    def parse_question_batch(response: str) -> List[Dict]:
+        """Split a batch reply on the delimiter lines and parse each question"""
+        questions = []
+        for block in _DELIMITER_LINE.split(response):
+            if not block.strip():
+                continue
+            parser = IncrementalQuestionParser()
+            parser.feed(block)
+            questions.append(parser.finish())
+        return questions
+
+    @staticmethod
+    def is_valid_question(question: Dict, section_num: int) -> bool:
+        """Check a parsed question has its section's fields and 4 distinct options"""
+        if any(not question.get(field) for field in REQUIRED_FIELDS[section_num]):
+            return False
+        options = question.get("Options", [])
+        normalized = {normalize_text(option) for option in options}
+        return len(options) == 4 and len(normalized) == 4 and "" not in normalized
+
+    @staticmethod
+    def question_key(question: Dict, section_num: int) -> str:
+        """Content hash of the fields that make a question distinct, for deduplication"""
+        return content_hash(" ".join(question.get(field, "") for field in REQUIRED_FIELDS[section_num]))
+
+    def generate_question_batch(
+        self,
+        section_num: int,
+        topic: str,
+        count: int,
+        batch_size: int = 10,
+        max_calls: Optional[int] = None
+    ) -> Tuple[List[Dict], Dict[str, int]]:
+        """Generate up to count distinct questions on a topic, several per Bedrock call
+
+        The similar-question search runs once and its examples are reused for
+        every call. Each reply holds up to batch_size delimited questions,
+        parsed in one pass; questions that are malformed or duplicate an
+        example or an earlier question are dropped, and further calls are
+        made until count is reached or max_calls (default: twice the calls
+        count needs) is used up. A throttled call ends the run with the
+        questions accepted so far.
+
+        Returns the questions and this run's counts (calls, parsed, invalid,
+        duplicates, accepted, throttled).
+        """
+        stats = {
+            "calls": 0, "parsed": 0, "invalid": 0, "duplicates": 0, "accepted": 0, "throttled": 0
+        }
+        similar_questions = self.vector_store.search_similar_questions(
+            section_num, topic, n_results=3
+        )
+        if not similar_questions or count <= 0:
+            return [], stats
+
+        context = self._build_example_context(section_num, similar_questions)
+        seen = {self.question_key(q, section_num) for q in similar_questions}
+        questions = []
+        if max_calls is None:
+            max_calls = 2 * math.ceil(count / batch_size)
+
+        for _ in range(max_calls):
+            if len(questions) >= count:
+                break
+            batch_count = min(batch_size, count - len(questions))
+            stats["calls"] += 1
+            try:
+                response = self._invoke_bedrock(
+                    self._build_batch_prompt(topic, context, batch_count),
+                    inference_config={"temperature": 0.7, "maxTokens": TOKENS_PER_QUESTION * batch_count}
+                )
+            except BedrockThrottledError as e:
+                self.logger.warning(f"Stopping batch generation after a throttled call: {str(e)}")
+                stats["throttled"] += 1
+                break
+            if not response:
+                break
+
+            for question in self.parse_question_batch(response):
+                stats["parsed"] += 1
+                if not self.is_valid_question(question, section_num):
+                    stats["invalid"] += 1
+                    continue
+                key = self.question_key(question, section_num)
+                if key in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(key)
+                questions.append(question)
+
+        questions = questions[:count]
+        stats["accepted"] = len(questions)
+        return questions, stats
+
     def get_feedback(self, question: Dict, selected_answer: int) -> Dict:
         """Generate feedback for the selected answer"""
         if not question or "Options" not in question:
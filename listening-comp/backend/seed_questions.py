@@ -0,0 +1,50 @@
+"""Seed the question store with generated practice questions
+
+Generates questions for one practice type and topic with
+QuestionGenerator.generate_question_batch (several questions per Bedrock
+call, one similar-question search for the whole run) and saves them to the
+question store, where they show up in the sidebar like any other question.
+
+Usage (from the listening-comp directory):
+
+    python -m backend.seed_questions --practice-type "Dialogue Practice" --topic Shopping --count 200
+"""
+import argparse
+
+from backend.question_generator import QuestionGenerator
+from backend.services.question_store import QuestionStore
+
+# Section numbers match PracticeControls: dialogues are section 2, phrases section 3
+PRACTICE_SECTIONS = {
+    "Dialogue Practice": 2,
+    "Phrase Matching": 3,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--practice-type", required=True, choices=sorted(PRACTICE_SECTIONS))
+    parser.add_argument("--topic", required=True)
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=10, help="Questions requested per Bedrock call")
+    args = parser.parse_args()
+
+    generator = QuestionGenerator()
+    questions, stats = generator.generate_question_batch(
+        PRACTICE_SECTIONS[args.practice_type], args.topic, args.count, batch_size=args.batch_size
+    )
+    store = QuestionStore()
+    for question in questions:
+        store.add(question, args.practice_type, args.topic)
+
+    print(
+        f"Saved {len(questions)} of {args.count} questions for {args.practice_type} / {args.topic} "
+        f"({stats.get('calls', 0)} calls, {stats.get('parsed', 0)} parsed, "
+        f"{stats.get('invalid', 0)} invalid, {stats.get('duplicates', 0)} duplicates)"
+    )
+    if stats.get("throttled"):
+        print("Stopped early because Bedrock throttled the requests; run again later to add more.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,68 @@
 import boto3
 import json
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import tempfile
 import subprocess
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+from botocore.config import Config
+from backend.services import mp3_frames
+from backend.services.audio_store import AudioArtifactStore
+from backend.services.audio_transcoder import AUDIO_PROFILES, AudioTranscoder
+from backend.services.bedrock_gateway import BedrockGateway, get_bedrock_gateway
+from backend.services.question_store import QuestionStore
+from backend.services.script_builder import (
+    QUESTION_FIELDS, SECTION_SOURCE, SECTIONS, assign_sections, build_audio_plan, build_script
+)
+from backend.services.tts_cache import TTSCache
+from backend.utils.content_hash import stable_hash
+from backend.utils.file_utils import atomic_write_bytes
+from backend.utils.rate_limiter import TokenBucket
 
 class AudioGenerator:
-    def __init__(self):
-        self.bedrock = boto3.client('bedrock-runtime', region_name="us-east-1")
-        self.polly = boto3.client('polly')
+    def __init__(
+        self,
+        max_workers: int = 4,
+        polly_tps: float = 8.0,
+        tts_cache_max_bytes: int = 256 * 1024 * 1024,
+        assembly_mode: str = 'memory',
+        audio_quota_bytes: int = 500 * 1024 * 1024,
+        audio_dir: Optional[str] = None,
+        script_cache_dir: Optional[str] = None,
+        polly_client=None,
+        gateway: Optional[BedrockGateway] = None,
+        question_store: Optional[QuestionStore] = None
+    ):
+        """
+        Args:
+            max_workers: Maximum number of concurrent Polly requests
+            polly_tps: Client-side cap on Polly requests per second, kept below
+                the account's SynthesizeSpeech quota
+            tts_cache_max_bytes: Size bound of the synthesized segment cache
+            assembly_mode: 'memory' joins MP3 frames in-process and falls back to
+                ffmpeg when parts cannot be joined; 'ffmpeg' always uses ffmpeg
+            audio_quota_bytes: Size of generated question audio above which
+                files not referenced by saved questions are removed
+            audio_dir: Output directory for audio (default frontend/static/audio)
+            script_cache_dir: Directory of cached scripts (default backend/data/script_cache)
+            polly_client: Pre-built Polly client (e.g. a stub)
+            gateway: Bedrock gateway to use instead of the process-wide one
+            question_store: Store of saved questions whose audio the garbage
+                collector keeps (default: opened on first collection)
+        """
+        if assembly_mode not in ('memory', 'ffmpeg'):
+            raise ValueError(f"Unknown assembly mode: {assembly_mode}")
+        self.gateway = gateway or get_bedrock_gateway()
+        self.polly = polly_client or boto3.client('polly', config=Config(
+            max_pool_connections=max_workers,
+            retries={'mode': 'adaptive', 'max_attempts': 5}
+        ))
         self.model_id = "amazon.nova-pro-v1:0"
+        self.max_workers = max_workers
+        self.polly_limiter = TokenBucket(rate=polly_tps)
+        self.assembly_mode = assembly_mode
         
         # Define Japanese neural voices by gender
         self.voices = {
@@ -20,38 +71,46 @@ class AudioGenerator:
             'announcer': 'Takumi'  # Default announcer voice
         }
         
+        # Pauses (ms) between sections, conversation turns and source segments
+        self.pause_settings = {'long': 2000, 'short': 500, 'segment': 1000}
+        
         # Create audio output directory
-        self.audio_dir = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        self.audio_dir = audio_dir or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
             "frontend/static/audio"
         )
         os.makedirs(self.audio_dir, exist_ok=True)
+        self.audio_store = AudioArtifactStore(
+            self.audio_dir, quota_bytes=audio_quota_bytes, question_store=question_store
+        )
+        self.tts_cache = TTSCache(os.path.join(self.audio_dir, "tts_cache"), max_bytes=tts_cache_max_bytes)
+        self.transcoder = AudioTranscoder(os.path.join(self.audio_dir, "profiles"))
+        
+        # Parsed scripts keyed by question content, in memory and on disk
+        self.script_cache_dir = script_cache_dir or os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "data", "script_cache"
+        )
+        os.makedirs(self.script_cache_dir, exist_ok=True)
+        self._scripts = {}
 
     def _invoke_bedrock(self, prompt: str) -> str:
         """Invoke Bedrock with the given prompt using converse API"""
-        messages = [{
-            "role": "user",
-            "content": [{
-                "text": prompt
-            }]
-        }]
-        
         try:
-            response = self.bedrock.converse(
-                modelId=self.model_id,
-                messages=messages,
-                inferenceConfig={
+            return self.gateway.converse_text(
+                self.model_id,
+                prompt,
+                inference_config={
                     "temperature": 0.3,
                     "topP": 0.95,
                     "maxTokens": 2000
                 }
             )
-            return response['output']['message']['content'][0]['text']
         except Exception as e:
             print(f"Error in Bedrock converse: {str(e)}")
             raise e
 
-    def validate_conversation_parts(self, parts: List[Tuple[str, str, str]]) -> bool:
+    def validate_conversation_parts(self, parts: List[Tuple[str, str, str, str]]) -> bool:
         """
         Validate that the conversation parts are properly formatted.
         Returns True if valid, False otherwise.
@@ -66,7 +125,7 @@ class AudioGenerator:
             return False
             
         # Check that each part has valid content
-        for i, (speaker, text, gender) in enumerate(parts):
+        for i, (speaker, text, gender, section) in enumerate(parts):
             # Check speaker
             if not speaker or not isinstance(speaker, str):
                 print(f"Error: Invalid speaker in part {i+1}")
@@ -80,6 +139,10 @@ class AudioGenerator:
             if gender not in ['male', 'female']:
                 print(f"Error: Invalid gender in part {i+1}: {gender}")
                 return False
+            
+            if section not in SECTIONS:
+                print(f"Error: Invalid section in part {i+1}: {section}")
+                return False
                 
             # Check text contains Japanese characters
             if not any('\u4e00' <= c <= '\u9fff' or '\u3040' <= c <= '\u309f' or '\u30a0' <= c <= '\u30ff' for c in text):
@@ -88,11 +151,53 @@ class AudioGenerator:
         
         return True
 
-    def parse_conversation(self, question: Dict) -> List[Tuple[str, str, str]]:
+    def parse_conversation(self, question: Dict) -> List[Tuple[str, str, str, str]]:
         """
         Convert question into a format for audio generation.
-        Returns a list of (speaker, text, gender) tuples.
+        Returns a list of (speaker, text, gender, section) tuples.
+        
+        Structured questions are split locally by build_script; Bedrock is only
+        asked when that fails. Scripts are cached by question content, so
+        regenerating audio for the same question never re-invokes Bedrock.
         """
+        cache_key = stable_hash({field: question.get(field) for field in QUESTION_FIELDS})
+        parts = self._load_script(cache_key)
+        if parts:
+            return parts
+        
+        parts = build_script(question)
+        if parts and self.validate_conversation_parts(parts):
+            print("Built conversation script from structured question fields")
+        else:
+            print("Falling back to Bedrock to format the conversation")
+            parts = self._parse_conversation_with_llm(question)
+        
+        self._store_script(cache_key, parts)
+        return parts
+
+    def _load_script(self, cache_key: str) -> List[Tuple[str, str, str, str]]:
+        """Cached script for a question, or None"""
+        if cache_key in self._scripts:
+            return list(self._scripts[cache_key])
+        path = os.path.join(self.script_cache_dir, f"{cache_key}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                parts = [tuple(part) for part in json.load(f)]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if any(len(part) != 4 for part in parts):
+            # Written before parts carried their section
+            return None
+        self._scripts[cache_key] = parts
+        return list(parts)
+
+    def _store_script(self, cache_key: str, parts: List[Tuple[str, str, str, str]]):
+        self._scripts[cache_key] = list(parts)
+        path = os.path.join(self.script_cache_dir, f"{cache_key}.json")
+        atomic_write_bytes(path, json.dumps(parts, ensure_ascii=False).encode('utf-8'))
+
+    def _parse_conversation_with_llm(self, question: Dict) -> List[Tuple[str, str, str, str]]:
+        """Ask Nova to split the question into speaker parts, retrying on invalid output"""
         max_retries = 3
         for attempt in range(max_retries):
             try:
@@ -197,6 +302,7 @@ class AudioGenerator:
                     parts.append((current_speaker, current_text, current_gender))
                 
                 # Validate the parsed parts
+                parts = assign_sections(parts)
                 if self.validate_conversation_parts(parts):
                     return parts
                     
@@ -216,8 +322,9 @@ class AudioGenerator:
         else:
             return 'Kazuha'  # Female voice
 
-    def generate_audio_part(self, text: str, voice_name: str) -> str:
-        """Generate audio for a single part using Amazon Polly"""
+    def _synthesize_to_cache(self, cache_key: str, text: str, voice_name: str) -> bytes:
+        """Call Amazon Polly and store the result in the TTS cache"""
+        self.polly_limiter.acquire()
         response = self.polly.synthesize_speech(
             Text=text,
             OutputFormat='mp3',
@@ -225,11 +332,39 @@ class AudioGenerator:
             Engine='neural',
             LanguageCode='ja-JP'
         )
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-            temp_file.write(response['AudioStream'].read())
-            return temp_file.name
+        audio = response['AudioStream'].read()
+        self.tts_cache.put(cache_key, audio)
+        return audio
+
+    def synthesize_part_bytes(self, text: str, voice_name: str) -> bytes:
+        """Get MP3 bytes for a single part, from the TTS cache or Amazon Polly"""
+        cache_key = TTSCache.make_key(text, voice_name, 'neural', 'mp3')
+        cached = self.tts_cache.read(cache_key, characters=len(text))
+        if cached is not None:
+            return cached
+        return self._synthesize_to_cache(cache_key, text, voice_name)
+
+    def generate_audio_part(self, text: str, voice_name: str) -> str:
+        """
+        Generate audio for a single part using Amazon Polly.
+        Returns the path of the segment in the TTS cache, which callers must not delete.
+        """
+        cache_key = TTSCache.make_key(text, voice_name, 'neural', 'mp3')
+        cached_file = self.tts_cache.get(cache_key, characters=len(text))
+        if cached_file:
+            return cached_file
+        audio = self._synthesize_to_cache(cache_key, text, voice_name)
+        cached_file = self.tts_cache.path_for(cache_key)
+        if not os.path.exists(cached_file):
+            # Evicted already; hand out a temporary copy instead
+            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
+                temp_file.write(audio)
+                return temp_file.name
+        return cached_file
+
+    def _is_temporary(self, audio_file: str) -> bool:
+        """Whether a file is a throwaway intermediate (cached segments and silence files are kept)"""
+        return not os.path.abspath(audio_file).startswith(os.path.abspath(self.audio_dir) + os.sep)
 
     def combine_audio_files(self, audio_files: List[str], output_file: str):
         """Combine multiple audio files using ffmpeg"""
@@ -259,8 +394,8 @@ class AudioGenerator:
             # Clean up temporary files
             if file_list and os.path.exists(file_list):
                 os.unlink(file_list)
-            for audio_file in audio_files:
-                if os.path.exists(audio_file):
+            for audio_file in set(audio_files):
+                if self._is_temporary(audio_file) and os.path.exists(audio_file):
                     try:
                         os.unlink(audio_file)
                     except Exception as e:
@@ -278,66 +413,238 @@ class AudioGenerator:
             ])
         return output_file
 
-    def generate_audio(self, question: Dict) -> str:
+    def build_audio_plan(self, parts: List[Tuple[str, str, str, str]]) -> List[Tuple[str, object]]:
         """
-        Generate audio for the entire question.
-        Returns the path to the generated audio file.
+        Lay out the final audio as an ordered list of steps.
+        Each step is ('pause', duration_ms) or ('part', index into parts).
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = os.path.join(self.audio_dir, f"question_{timestamp}.mp3")
+        return build_audio_plan(parts, self.pause_settings)
+
+    def _synthesize_timed(self, speaker: str, text: str, gender: str) -> Tuple[bytes, Dict]:
+        """Synthesize one part and measure how long it took"""
+        voice = self.get_voice_for_gender(gender)
+        print(f"Using voice {voice} for {speaker} ({gender})")
+        start = time.perf_counter()
+        audio = self.synthesize_part_bytes(text, voice)
+        if not audio:
+            raise Exception("Failed to generate audio part")
+        return audio, {
+            'speaker': speaker,
+            'voice': voice,
+            'characters': len(text),
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+
+    def synthesize_parts(self, parts: List[Tuple[str, str, str, str]]) -> Tuple[List[bytes], Dict]:
+        """
+        Synthesize all parts concurrently with a bounded worker pool.
+        Returns MP3 bytes in the same order as parts, and this call's timings.
+        """
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._synthesize_timed, speaker, text, gender)
+                for speaker, text, gender, _ in parts
+            ]
         
-        try:
-            # Parse conversation into parts
-            parts = self.parse_conversation(question)
+        # All futures are finished once the executor has shut down
+        results = []
+        errors = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            raise errors[0]
+        
+        part_stats = [stats for _, stats in results]
+        synthesis_stats = {
+            'parts': part_stats,
+            'total_seconds': round(time.perf_counter() - start, 3),
+            'sequential_seconds': round(sum(stats['seconds'] for stats in part_stats), 3),
+            'tts_cache': self.tts_cache.stats()
+        }
+        cache_stats = synthesis_stats['tts_cache']
+        print(
+            f"Synthesized {len(parts)} parts in {synthesis_stats['total_seconds']}s "
+            f"(sum of part latencies {synthesis_stats['sequential_seconds']}s); "
+            f"TTS cache hit ratio {cache_stats['hit_ratio']}, "
+            f"{cache_stats['characters_saved']} Polly characters saved"
+        )
+        return [audio for audio, _ in results], synthesis_stats
+
+    def assemble_audio(self, steps: List[Union[bytes, int]], output_file: str) -> Dict:
+        """
+        Assemble encoded parts and pauses into a single MP3 written once.
+        
+        Args:
+            steps: MP3 bytes for spoken parts, or an int pause duration in ms
+            output_file: Path of the combined audio
             
-            # Generate audio for each part
-            audio_parts = []
-            current_section = None
+        Returns:
+            Dict: Assembly mode used, time taken and output size
+        """
+        start = time.perf_counter()
+        mode = self.assembly_mode
+        if mode == 'memory':
+            try:
+                atomic_write_bytes(output_file, mp3_frames.concatenate(steps))
+            except ValueError as e:
+                print(f"In-memory assembly not possible ({str(e)}), falling back to ffmpeg")
+                mode = 'ffmpeg'
+        if mode == 'ffmpeg':
+            self._assemble_with_ffmpeg(steps, output_file)
+        
+        return {
+            'mode': mode,
+            'seconds': round(time.perf_counter() - start, 3),
+            'bytes': os.path.getsize(output_file)
+        }
+
+    def _assemble_with_ffmpeg(self, steps: List[Union[bytes, int]], output_file: str):
+        """Assemble via temporary files and the ffmpeg concat demuxer"""
+        audio_files = []
+        for step in steps:
+            if isinstance(step, int):
+                audio_files.append(self.generate_silence(step))
+            else:
+                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
+                    temp_file.write(step)
+                    audio_files.append(temp_file.name)
+        # ffmpeg picks the container from the extension, so keep .mp3 last
+        temp_output = f"{output_file}.{os.getpid()}.{uuid.uuid4().hex}.mp3"
+        if not self.combine_audio_files(audio_files, temp_output):
+            raise Exception("Failed to combine audio files")
+        os.replace(temp_output, output_file)
+
+    def voice_map(self) -> Dict[str, str]:
+        """Voice used for each gender, part of the audio's content key"""
+        return {gender: self.get_voice_for_gender(gender) for gender in ('male', 'female', 'announcer')}
+
+    def prepare_script(self, question: Dict, include_sources: bool = False) -> Tuple[List, List, str, bool]:
+        """
+        Parse the question and lay out its audio.
+        
+        Args:
+            question: Question data
+            include_sources: Append the source segment placeholders after the question
             
-            # Generate silence files for pauses
-            long_pause = self.generate_silence(2000)  # 2 second pause
-            short_pause = self.generate_silence(500)  # 0.5 second pause
+        Returns:
+            (parts, plan, output_file, exists) where output_file is the
+            content-addressed path of the audio and exists tells whether it
+            has already been generated
+        """
+        parts = self.parse_conversation(question)
+        plan = self.build_audio_plan(parts)
+        prefix = 'question'
+        sources = question.get("source_segments") if include_sources else None
+        if sources:
+            plan.append(('pause', self.pause_settings['long']))
+            for _ in sources:
+                # Here you would fetch the original audio from YouTube
+                # For now, we'll generate TTS as a placeholder
+                parts.append(('Source', "This is where the original audio segment would play", 'announcer', SECTION_SOURCE))
+                plan.extend([('part', len(parts) - 1), ('pause', self.pause_settings['segment'])])
+            prefix = 'question_with_source'
+        
+        key = AudioArtifactStore.key_for(parts, self.voice_map(), plan, sources)
+        existing = self.audio_store.lookup(key, prefix)
+        if existing:
+            return parts, plan, existing, True
+        return parts, plan, self.audio_store.path_for(key, prefix), False
+
+    def generate_audio_stream(self, question: Dict) -> Iterator[bytes]:
+        """
+        Generate audio for the question progressively.
+        
+        All parts are synthesized concurrently, and MP3 frames for each part
+        (with the same pauses as generate_audio) are yielded in playback order
+        as soon as that part is ready. Source segment placeholders are appended
+        as in generate_audio_from_transcript. Once everything has been yielded
+        the combined audio is persisted, and its path is the generator's
+        return value. Audio that already exists is yielded in one chunk.
+        """
+        parts, plan, output_file, exists = self.prepare_script(question, include_sources=True)
+        if exists:
+            with open(output_file, 'rb') as f:
+                yield f.read()
+            return output_file
+        
+        start = time.perf_counter()
+        chunks = []
+        pending_pauses = []
+        fmt = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._synthesize_timed, speaker, text, gender)
+                for speaker, text, gender, _ in parts
+            ]
+            for kind, value in plan:
+                if kind == 'pause':
+                    pending_pauses.append(value)
+                    if fmt is None:
+                        continue
+                else:
+                    frames, header = mp3_frames.frames_only(futures[value].result()[0])
+                    if fmt is None:
+                        fmt = mp3_frames.stream_format(header)
+                    elif mp3_frames.stream_format(header) != fmt:
+                        raise ValueError("Cannot stream parts with mismatched MP3 formats")
+                chunk = b"".join(mp3_frames.silence(pause, *fmt) for pause in pending_pauses)
+                pending_pauses = []
+                if kind == 'part':
+                    chunk += frames
+                chunks.append(chunk)
+                if len(chunks) == 1:
+                    print(f"First audio chunk ready after {time.perf_counter() - start:.3f}s")
+                yield chunk
+        
+        atomic_write_bytes(output_file, b"".join(chunks))
+        print(
+            f"Streamed {os.path.basename(output_file)} in {time.perf_counter() - start:.3f}s "
+            f"({os.path.getsize(output_file)} bytes)"
+        )
+        self.audio_store.collect_garbage()
+        return output_file
+
+    def _render_audio(self, question: Dict, include_sources: bool) -> str:
+        """Reuse or generate the audio for a question and return its path"""
+        try:
+            # Parse conversation into parts
+            parts, plan, output_file, exists = self.prepare_script(question, include_sources)
+            if exists:
+                print(f"Reusing existing audio {os.path.basename(output_file)}")
+                return output_file
             
-            for speaker, text, gender in parts:
-                # Detect section changes and add appropriate pauses
-                if speaker.lower() == 'announcer':
-                    if '次の会話' in text:  # Introduction
-                        if current_section is not None:
-                            audio_parts.append(long_pause)
-                        current_section = 'intro'
-                    elif '質問' in text or '選択肢' in text:  # Question or options
-                        audio_parts.append(long_pause)
-                        current_section = 'question'
-                elif current_section == 'intro':
-                    audio_parts.append(long_pause)
-                    current_section = 'conversation'
-                
-                # Get appropriate voice for this speaker
-                voice = self.get_voice_for_gender(gender)
-                print(f"Using voice {voice} for {speaker} ({gender})")
-                
-                # Generate audio for this part
-                audio_file = self.generate_audio_part(text, voice)
-                if not audio_file:
-                    raise Exception("Failed to generate audio part")
-                audio_parts.append(audio_file)
-                
-                # Add short pause between conversation turns
-                if current_section == 'conversation':
-                    audio_parts.append(short_pause)
+            # Synthesize all parts concurrently, then assemble them in order
+            part_audio, _ = self.synthesize_parts(parts)
+            steps = [
+                value if kind == 'pause' else part_audio[value]
+                for kind, value in plan
+            ]
             
-            # Combine all parts into final audio
-            if not self.combine_audio_files(audio_parts, output_file):
-                raise Exception("Failed to combine audio files")
+            # Combine all parts into final audio (written atomically)
+            assembly_stats = self.assemble_audio(steps, output_file)
+            print(
+                f"Assembled {os.path.basename(output_file)} ({assembly_stats['mode']}) "
+                f"in {assembly_stats['seconds']}s, {assembly_stats['bytes']} bytes"
+            )
+            self.audio_store.collect_garbage()
             
             return output_file
             
         except Exception as e:
-            # Clean up the output file if it exists
-            if os.path.exists(output_file):
-                os.unlink(output_file)
             raise Exception(f"Audio generation failed: {str(e)}")
 
+    def generate_audio(self, question: Dict) -> str:
+        """
+        Generate audio for the entire question.
+        Returns the path to the generated audio file; identical questions
+        share one file.
+        """
+        return self._render_audio(question, include_sources=False)
+
     def generate_audio_from_transcript(self, question: Dict) -> str:
         """Generate audio for a question that includes transcript source data
         
@@ -347,43 +654,11 @@ class AudioGenerator:
         Returns:
             str: Path to the generated audio file
         """
-        # Generate the main question audio
-        main_audio = self.generate_audio(question)
-        
-        # If there are source segments, append them after a pause
-        if "source_segments" in question:
-            # Create a list to store all audio files
-            audio_files = [main_audio]
-            
-            # Add 2 second silence
-            silence = self.generate_silence(2000)
-            audio_files.append(silence)
-            
-            # Add original audio clips if available
-            for segment in question["source_segments"]:
-                # Here you would fetch the original audio from YouTube
-                # For now, we'll generate TTS as a placeholder
-                segment_audio = self.generate_audio_part(
-                    "This is where the original audio segment would play",
-                    self.get_voice_for_gender("announcer")
-                )
-                audio_files.append(segment_audio)
-                
-                # Add 1 second silence between segments
-                audio_files.append(self.generate_silence(1000))
-            
-            # Combine all audio files
-            output_file = os.path.join(
-                self.audio_dir,
-                f"question_with_source_{uuid.uuid4()}.mp3"
-            )
-            self.combine_audio_files(audio_files, output_file)
-            
-            # Clean up temporary files
-            for file in audio_files:
-                if file != output_file and os.path.exists(file):
-                    os.unlink(file)
-                    
-            return output_file
-            
-        return main_audio
+        return self._render_audio(question, include_sources=True)
+
+    def audio_for_profile(self, audio_file: str, profile: str) -> Tuple[str, str]:
+        """
+        Get generated audio in an output profile (see AUDIO_PROFILES).
+        Returns (path, mime type); each file is encoded once per profile.
+        """
+        return self.transcoder.transcode(audio_file, profile), AUDIO_PROFILES[profile]['mime']
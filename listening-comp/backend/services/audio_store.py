@@ -0,0 +1,128 @@
+import os
+import time
+from typing import Callable, Dict, Optional, Set
+from backend.services.question_pool import DEFAULT_POOL_FILE, load_pooled_question_audio
+from backend.services.question_store import QuestionStore
+from backend.utils.content_hash import stable_hash
+from backend.utils.logger import Logger
+
+# Prefixes of generated question audio in the audio directory
+ARTIFACT_PREFIXES = ("question_",)
+
+
+def load_stored_question_audio(store: QuestionStore, pool_file: str = DEFAULT_POOL_FILE) -> Set[str]:
+    """File names of the audio referenced by saved or pre-generated questions"""
+    return store.referenced_audio_files() | load_pooled_question_audio(pool_file)
+
+
+class AudioArtifactStore:
+    """Content-addressed store for generated question audio
+
+    Files are named after a hash of everything that determines the audio
+    (parsed script, voice map, pause layout), so identical questions reuse
+    the existing file and concurrent requests cannot collide. A quota-based
+    garbage collector removes artifacts that no saved question references.
+    """
+
+    def __init__(
+        self,
+        audio_dir: str,
+        quota_bytes: int = 500 * 1024 * 1024,
+        references_loader: Optional[Callable[[], Set[str]]] = None,
+        min_age_seconds: float = 600.0,
+        question_store: Optional[QuestionStore] = None
+    ):
+        """
+        Args:
+            audio_dir: Directory holding the generated audio
+            quota_bytes: Total artifact size above which unreferenced files are removed
+            references_loader: Returns the file names of audio still in use
+                (default: audio of saved and pre-generated questions)
+            min_age_seconds: Newer artifacts are never collected, since they may
+                belong to a question that has not been saved yet
+            question_store: Store of saved questions (e.g. the app's shared one);
+                opened on the first collection if not given
+        """
+        self.audio_dir = audio_dir
+        self.quota_bytes = quota_bytes
+        self.question_store = question_store
+        self.references_loader = references_loader or self._load_references
+        self.min_age_seconds = min_age_seconds
+        self.logger = Logger().get_logger()
+        os.makedirs(audio_dir, exist_ok=True)
+
+    def _load_references(self) -> Set[str]:
+        if self.question_store is None:
+            # Opened once and reused by later collections
+            self.question_store = QuestionStore()
+        return load_stored_question_audio(self.question_store)
+
+    @staticmethod
+    def key_for(script, voice_map: Dict, layout, extra=None) -> str:
+        """Content key of a piece of audio"""
+        return stable_hash({
+            "script": script,
+            "voices": voice_map,
+            "layout": layout,
+            "extra": extra
+        })
+
+    def path_for(self, key: str, prefix: str = "question") -> str:
+        return os.path.join(self.audio_dir, f"{prefix}_{key[:32]}.mp3")
+
+    def lookup(self, key: str, prefix: str = "question") -> Optional[str]:
+        """Existing artifact for key, or None"""
+        path = self.path_for(key, prefix)
+        try:
+            # Refresh the mtime so recently reused audio is collected last
+            os.utime(path, None)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def collect_garbage(self) -> Dict:
+        """Remove unreferenced artifacts, oldest first, while over the quota"""
+        artifacts = []
+        total = 0
+        for name in os.listdir(self.audio_dir):
+            if not name.startswith(ARTIFACT_PREFIXES) or not name.endswith(".mp3"):
+                continue
+            path = os.path.join(self.audio_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            artifacts.append((stat.st_mtime, stat.st_size, name, path))
+            total += stat.st_size
+
+        result = {"removed": 0, "bytes_freed": 0, "total_bytes": total}
+        if total <= self.quota_bytes:
+            return result
+
+        referenced = self.references_loader()
+        cutoff = time.time() - self.min_age_seconds
+        for mtime, size, name, path in sorted(artifacts):
+            if total <= self.quota_bytes:
+                break
+            if name in referenced or mtime > cutoff:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            result["removed"] += 1
+            result["bytes_freed"] += size
+
+        result["total_bytes"] = total
+        if result["removed"]:
+            self.logger.info(
+                f"Audio GC removed {result['removed']} unreferenced files "
+                f"({result['bytes_freed']} bytes), {total} bytes remain"
+            )
+        if total > self.quota_bytes:
+            self.logger.warning(
+                f"Audio directory is {total} bytes, above the {self.quota_bytes} byte quota, "
+                f"but the remaining files are referenced or recent"
+            )
+        return result
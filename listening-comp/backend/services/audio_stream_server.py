@@ -0,0 +1,178 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Iterator, Optional
+from backend.utils.logger import Logger
+
+
+class StreamingAudioJob:
+    """Runs an audio chunk generator in the background and buffers its output
+
+    Any number of HTTP clients can replay the buffered chunks and then follow
+    new ones as they are produced. If output_file is not given, the value
+    returned by the generator is used as the persisted file.
+    """
+
+    def __init__(self, job_id: str, chunks: Iterable[bytes], output_file: Optional[str] = None):
+        self.job_id = job_id
+        self.output_file = output_file
+        self.logger = Logger().get_logger()
+        self._chunks = []
+        self._done = False
+        self._error = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, args=(chunks,), daemon=True)
+        self._thread.start()
+
+    def _run(self, chunks: Iterable[bytes]):
+        try:
+            iterator = iter(chunks)
+            while True:
+                try:
+                    chunk = next(iterator)
+                except StopIteration as stop:
+                    if self.output_file is None:
+                        self.output_file = stop.value
+                    break
+                with self._condition:
+                    self._chunks.append(chunk)
+                    self._condition.notify_all()
+        except Exception as e:
+            self.logger.error(f"Streaming audio job {self.job_id} failed: {str(e)}", exc_info=True)
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield all chunks from the start, waiting for new ones until the job ends"""
+        index = 0
+        while True:
+            with self._condition:
+                while index >= len(self._chunks) and not self._done:
+                    self._condition.wait()
+                if index >= len(self._chunks):
+                    return
+                chunk = self._chunks[index]
+            index += 1
+            yield chunk
+
+    def wait(self, timeout: Optional[float] = None) -> str:
+        """Block until generation finishes and return the persisted file
+
+        Raises:
+            TimeoutError: If the job is still running after timeout seconds
+            Exception: The error raised by the generator, if any
+        """
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise TimeoutError(f"Audio job {self.job_id} did not finish in time")
+        if self._error:
+            raise self._error
+        return self.output_file
+
+
+class AudioStreamServer:
+    """Small local HTTP server that serves streaming audio jobs as chunked MP3
+
+    GET /stream/<job_id>.mp3 returns the job's audio with chunked transfer
+    encoding, so playback can start after the first conversation turn.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8503, public_url: Optional[str] = None, max_jobs: int = 32):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            public_url: Base URL the browser uses to reach the server, if it
+                differs from http://host:port (e.g. behind a proxy)
+            max_jobs: Number of recent jobs kept available for replay
+        """
+        self.logger = Logger().get_logger()
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        bound_host, bound_port = self._httpd.server_address[:2]
+        self.public_url = (public_url or f"http://{bound_host}:{bound_port}").rstrip("/")
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"Audio stream server listening on {bound_host}:{bound_port}")
+
+    def submit(self, chunks: Iterable[bytes], output_file: Optional[str] = None) -> StreamingAudioJob:
+        """Start a streaming job for a chunk generator"""
+        job = StreamingAudioJob(uuid.uuid4().hex, chunks, output_file)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[StreamingAudioJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def url_for(self, job: StreamingAudioJob) -> str:
+        return f"{self.public_url}/stream/{job.job_id}.mp3"
+
+    def shutdown(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class StreamHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                job_id = self.path.split("?")[0].rsplit("/", 1)[-1].removesuffix(".mp3")
+                job = server.get_job(job_id) if self.path.startswith("/stream/") else None
+                if job is None:
+                    self.send_error(404, "Unknown audio stream")
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "audio/mpeg")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                try:
+                    for chunk in job.iter_chunks():
+                        if chunk:
+                            self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+                            self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    # The player went away; the job keeps running for the persisted file
+                    pass
+
+            def log_message(self, format, *args):
+                server.logger.debug(f"Audio stream server: {format % args}")
+
+        return StreamHandler
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_stream_server() -> AudioStreamServer:
+    """Process-wide stream server, started on first use
+
+    The port and browser-facing URL can be set with AUDIO_STREAM_PORT and
+    AUDIO_STREAM_PUBLIC_URL.
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = AudioStreamServer(
+                host=os.getenv("AUDIO_STREAM_HOST", "127.0.0.1"),
+                port=int(os.getenv("AUDIO_STREAM_PORT", "8503")),
+                public_url=os.getenv("AUDIO_STREAM_PUBLIC_URL")
+            )
+        return _server
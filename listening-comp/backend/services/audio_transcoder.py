@@ -0,0 +1,158 @@
+import hashlib
+import os
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+from backend.services.tts_cache import TTSCache
+from backend.utils.content_hash import stable_hash
+from backend.utils.logger import Logger
+
+# Output profiles for question audio. The generated MP3 is the source for
+# every profile; "ffmpeg_args" is None for the profile that serves it as is.
+AUDIO_PROFILES = {
+    "mp3": {
+        "label": "MP3 (standard)",
+        "extension": "mp3",
+        "mime": "audio/mpeg",
+        "ffmpeg_args": None,
+    },
+    "mp3_low": {
+        "label": "MP3 (data saver)",
+        "extension": "mp3",
+        "mime": "audio/mpeg",
+        "ffmpeg_args": ["-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "24k", "-f", "mp3"],
+    },
+    "opus": {
+        "label": "Ogg/Opus (smallest)",
+        "extension": "ogg",
+        "mime": "audio/ogg",
+        "ffmpeg_args": ["-ac", "1", "-c:a", "libopus", "-b:a", "16k", "-application", "voip", "-f", "ogg"],
+    },
+}
+
+DEFAULT_PROFILE = "mp3"
+
+
+class AudioTranscoder:
+    """Re-encodes generated audio into the output profiles, once per source and profile
+
+    Transcodes are stored in a TTSCache keyed by the SHA-256 of the source
+    file's bytes and the profile's encoder settings, so every profile of a
+    given audio file is encoded once and shared by all sessions. Concurrent
+    requests for the same transcode wait for a single encode. Encode time
+    and output size are tracked per profile.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        profiles: Dict[str, Dict] = None,
+        max_source_hashes: int = 1024
+    ):
+        """
+        Args:
+            cache_dir: Directory holding the transcoded files
+            max_bytes: Upper bound for the total size of transcoded files
+            profiles: Output profiles by name (defaults to AUDIO_PROFILES)
+            max_source_hashes: Source file hashes remembered, least recently used dropped first
+        """
+        self.profiles = profiles or AUDIO_PROFILES
+        self.cache = TTSCache(cache_dir, max_bytes=max_bytes)
+        self.logger = Logger().get_logger()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        # (path, size, mtime_ns) -> SHA-256 of the file, so sources are hashed once
+        self._source_hashes: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self.max_source_hashes = max_source_hashes
+        self._stats = {
+            name: {"encodes": 0, "hits": 0, "encode_seconds": 0.0, "source_bytes": 0, "output_bytes": 0}
+            for name in self.profiles
+        }
+
+    def _source_hash(self, source_file: str) -> str:
+        stat = os.stat(source_file)
+        identity = (os.path.abspath(source_file), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._source_hashes.get(identity)
+            if cached:
+                self._source_hashes.move_to_end(identity)
+        if cached:
+            return cached
+        digest = hashlib.sha256()
+        with open(source_file, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        with self._lock:
+            self._source_hashes[identity] = digest.hexdigest()
+            while len(self._source_hashes) > self.max_source_hashes:
+                self._source_hashes.popitem(last=False)
+        return digest.hexdigest()
+
+    def _encode(self, source_file: str, ffmpeg_args) -> bytes:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-loglevel', 'error', '-i', source_file, *ffmpeg_args, 'pipe:1'],
+            capture_output=True,
+            check=True
+        )
+        return result.stdout
+
+    def transcode(self, source_file: str, profile: str) -> str:
+        """Path of source_file in the given profile, encoding it on first use"""
+        if profile not in self.profiles:
+            raise ValueError(f"Unknown audio profile: {profile}")
+        settings = self.profiles[profile]
+        if settings["ffmpeg_args"] is None:
+            return source_file
+
+        key = stable_hash([self._source_hash(source_file), settings["ffmpeg_args"]])
+        extension = settings["extension"]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                cached = self.cache.get(key, extension=extension)
+                if cached:
+                    with self._lock:
+                        self._stats[profile]["hits"] += 1
+                    return cached
+
+                start = time.perf_counter()
+                data = self._encode(source_file, settings["ffmpeg_args"])
+                elapsed = time.perf_counter() - start
+                path = self.cache.put(key, data, extension=extension)
+                source_bytes = os.path.getsize(source_file)
+                with self._lock:
+                    stats = self._stats[profile]
+                    stats["encodes"] += 1
+                    stats["encode_seconds"] += elapsed
+                    stats["source_bytes"] += source_bytes
+                    stats["output_bytes"] += len(data)
+                self.logger.info(
+                    f"Encoded {os.path.basename(source_file)} as {profile} in {elapsed:.2f}s "
+                    f"({source_bytes / 1024:.0f}KB -> {len(data) / 1024:.0f}KB)"
+                )
+                return path
+        finally:
+            # Also after a hit or a failed encode, so locks do not pile up per key.
+            # Current waiters hold their own reference; a newer lock is left alone.
+            with self._lock:
+                if self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+
+    def stats(self) -> Dict[str, Dict]:
+        """Encodes, cache hits, mean encode time and size ratio per profile"""
+        with self._lock:
+            return {
+                name: {
+                    "encodes": stats["encodes"],
+                    "hits": stats["hits"],
+                    "mean_encode_ms": round(stats["encode_seconds"] / stats["encodes"] * 1000, 1)
+                    if stats["encodes"] else 0.0,
+                    "size_ratio": round(stats["output_bytes"] / stats["source_bytes"], 3)
+                    if stats["source_bytes"] else 0.0,
+                }
+                for name, stats in self._stats.items()
+            }
@@ -0,0 +1,232 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterator, List, Optional
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from backend.utils.logger import Logger
+from backend.utils.metrics import percentile
+
+DEFAULT_REGION = "us-east-1"
+
+# Error codes Bedrock uses when a request is rejected for rate or capacity.
+# Compared case-insensitively: errors inside a converse_stream arrive as an
+# EventStreamError with camel-cased codes such as "throttlingException".
+THROTTLING_CODES = {"ThrottlingException", "ServiceQuotaExceededException", "TooManyRequestsException"}
+_THROTTLING_CODES_LOWER = frozenset(code.lower() for code in THROTTLING_CODES)
+
+
+# Shown to users when a request fails with BedrockThrottledError
+THROTTLED_MESSAGE = "Bedrock is busy right now (requests are being throttled). Please try again in a moment."
+
+
+class BedrockThrottledError(Exception):
+    """Bedrock kept throttling a request after all retries"""
+
+
+class _ModelMetrics:
+    def __init__(self, window: int):
+        self.calls = 0
+        self.errors = 0
+        self.throttled = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.latencies = deque(maxlen=window)
+        self.first_token_latencies = deque(maxlen=window)
+
+    def summary(self) -> Dict:
+        def pct(values, p):
+            return round(percentile(values, p) * 1000, 1)
+
+        summary = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "p50_ms": pct(self.latencies, 50),
+            "p99_ms": pct(self.latencies, 99),
+        }
+        if self.first_token_latencies:
+            summary["ttft_p50_ms"] = pct(self.first_token_latencies, 50)
+            summary["ttft_p99_ms"] = pct(self.first_token_latencies, 99)
+        return summary
+
+
+class BedrockGateway:
+    """Shared Bedrock runtime client for every module in the app
+
+    Owns one boto3 client with a connection pool sized for max_concurrency
+    and botocore's adaptive retry mode (exponential backoff plus client-side
+    rate limiting on throttles), caps the number of in-flight requests, and
+    records latency and token usage per model.
+    """
+
+    def __init__(
+        self,
+        region: str = DEFAULT_REGION,
+        max_concurrency: int = 8,
+        max_attempts: int = 8,
+        read_timeout: int = 120,
+        client=None,
+        metrics_window: int = 1000
+    ):
+        """
+        Args:
+            region: AWS region of the Bedrock runtime endpoint
+            max_concurrency: Requests allowed in flight at once across all callers
+            max_attempts: Total attempts per request, including adaptive retries
+            read_timeout: Seconds to wait for a response
+            client: Pre-built bedrock-runtime client (e.g. a stub)
+            metrics_window: Recent latencies kept per model for percentiles
+        """
+        self.client = client or boto3.client('bedrock-runtime', region_name=region, config=Config(
+            max_pool_connections=max_concurrency,
+            retries={'mode': 'adaptive', 'max_attempts': max_attempts},
+            read_timeout=read_timeout,
+            tcp_keepalive=True
+        ))
+        self.logger = Logger().get_logger()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._metrics_window = metrics_window
+        self._metrics: Dict[str, _ModelMetrics] = {}
+
+    def _record(self, model_id: str, latency: float, input_tokens: int = 0, output_tokens: int = 0,
+                error: Optional[Exception] = None, first_token_latency: Optional[float] = None):
+        with self._lock:
+            metrics = self._metrics.setdefault(model_id, _ModelMetrics(self._metrics_window))
+            metrics.calls += 1
+            metrics.latencies.append(latency)
+            if first_token_latency is not None:
+                metrics.first_token_latencies.append(first_token_latency)
+            metrics.input_tokens += input_tokens
+            metrics.output_tokens += output_tokens
+            if error is not None:
+                metrics.errors += 1
+                if isinstance(error, BedrockThrottledError):
+                    metrics.throttled += 1
+        if error is None:
+            self.logger.debug(
+                f"Bedrock {model_id}: {latency * 1000:.0f}ms, {input_tokens} input / {output_tokens} output tokens"
+            )
+
+    def _raise_mapped(self, model_id: str, e: Exception, start: float):
+        """Record a failed call and re-raise it, turning throttles into BedrockThrottledError"""
+        error = e
+        if isinstance(e, ClientError):
+            code = e.response.get("Error", {}).get("Code", "")
+            if code.lower() in _THROTTLING_CODES_LOWER:
+                error = BedrockThrottledError(f"Bedrock throttled {model_id}: {e}")
+        self._record(model_id, time.perf_counter() - start, error=error)
+        if error is not e:
+            self.logger.warning(str(error))
+            raise error from e
+        raise e
+
+    def _call(self, model_id: str, operation, **kwargs):
+        """Run a client call inside a concurrency slot; returns (response, latency)"""
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                return operation(modelId=model_id, **kwargs), time.perf_counter() - start
+            except Exception as e:
+                self._raise_mapped(model_id, e, start)
+
+    def converse(self, model_id: str, messages: List[Dict], inference_config: Optional[Dict] = None, **kwargs) -> Dict:
+        """Call the Converse API and return the raw response"""
+        if inference_config is not None:
+            kwargs["inferenceConfig"] = inference_config
+        response, latency = self._call(model_id, self.client.converse, messages=messages, **kwargs)
+        usage = response.get("usage", {})
+        self._record(model_id, latency, usage.get("inputTokens", 0), usage.get("outputTokens", 0))
+        return response
+
+    def converse_text(self, model_id: str, prompt: str, inference_config: Optional[Dict] = None) -> str:
+        """Send a single user prompt and return the text of the reply"""
+        response = self.converse(
+            model_id,
+            [{"role": "user", "content": [{"text": prompt}]}],
+            inference_config
+        )
+        return response["output"]["message"]["content"][0]["text"]
+
+    def converse_stream(self, model_id: str, messages: List[Dict], inference_config: Optional[Dict] = None,
+                        **kwargs) -> Iterator[str]:
+        """Call ConverseStream and yield the text deltas as they arrive
+
+        The concurrency slot is held until the stream is exhausted or closed.
+        Total latency, time to first token and token usage (from the stream's
+        metadata event) are recorded when the stream ends.
+        """
+        if inference_config is not None:
+            kwargs["inferenceConfig"] = inference_config
+        with self._slots:
+            start = time.perf_counter()
+            first_token = None
+            usage = {}
+            try:
+                response = self.client.converse_stream(modelId=model_id, messages=messages, **kwargs)
+                for event in response["stream"]:
+                    if "contentBlockDelta" in event:
+                        text = event["contentBlockDelta"].get("delta", {}).get("text")
+                        if text:
+                            if first_token is None:
+                                first_token = time.perf_counter() - start
+                            yield text
+                    elif "metadata" in event:
+                        usage = event["metadata"].get("usage", {})
+            except GeneratorExit:
+                # Consumer stopped early; still count the call
+                self._record(model_id, time.perf_counter() - start, first_token_latency=first_token)
+                raise
+            except Exception as e:
+                self._raise_mapped(model_id, e, start)
+            self._record(
+                model_id,
+                time.perf_counter() - start,
+                usage.get("inputTokens", 0),
+                usage.get("outputTokens", 0),
+                first_token_latency=first_token
+            )
+
+    def converse_stream_text(self, model_id: str, prompt: str, inference_config: Optional[Dict] = None) -> Iterator[str]:
+        """Stream the reply to a single user prompt as text deltas"""
+        return self.converse_stream(
+            model_id,
+            [{"role": "user", "content": [{"text": prompt}]}],
+            inference_config
+        )
+
+    def invoke_model(self, model_id: str, body: Dict) -> Dict:
+        """Call InvokeModel with a JSON body and return the decoded JSON response"""
+        response, latency = self._call(model_id, self.client.invoke_model, body=json.dumps(body))
+        result = json.loads(response["body"].read())
+        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        self._record(
+            model_id,
+            latency,
+            int(headers.get("x-amzn-bedrock-input-token-count", result.get("inputTextTokenCount", 0))),
+            int(headers.get("x-amzn-bedrock-output-token-count", 0))
+        )
+        return result
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Calls, errors, throttles, token totals and latency percentiles per model"""
+        with self._lock:
+            return {model_id: metrics.summary() for model_id, metrics in self._metrics.items()}
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_bedrock_gateway() -> BedrockGateway:
+    """Process-wide Bedrock gateway, created on first use"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = BedrockGateway()
+        return _gateway
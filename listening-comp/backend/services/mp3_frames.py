@@ -0,0 +1,156 @@
+"""Minimal MPEG audio (Layer III) frame handling for in-memory assembly
+
+MP3 streams are sequences of self-contained frames, so encoded parts with
+the same sample rate and channel layout can be joined byte-wise once
+container metadata (ID3 tags, Xing/Info header frames) is removed.
+Silence is produced directly as frames whose side information is all
+zeros, which decoders render as digital silence.
+"""
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Version bits -> (name, sample rates by index)
+_SAMPLE_RATES = {
+    0b11: ("MPEG1", (44100, 48000, 32000)),
+    0b10: ("MPEG2", (22050, 24000, 16000)),
+    0b00: ("MPEG2.5", (11025, 12000, 8000)),
+}
+
+# Layer III bitrates (kbps) by index for MPEG1 and MPEG2/2.5
+_BITRATES = {
+    "MPEG1": (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    "MPEG2": (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+CHANNEL_MODE_MONO = 0b11
+
+
+def parse_frame_header(data: bytes, offset: int = 0) -> Optional[Dict]:
+    """Parse a Layer III frame header at offset, or return None if there is none"""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset:offset + 4]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version_bits = (b1 >> 3) & 0b11
+    layer_bits = (b1 >> 1) & 0b11
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0b11
+    if version_bits not in _SAMPLE_RATES or layer_bits != 0b01:
+        return None
+    if bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    version, sample_rates = _SAMPLE_RATES[version_bits]
+    bitrates = _BITRATES["MPEG1" if version == "MPEG1" else "MPEG2"]
+    sample_rate = sample_rates[sample_rate_index]
+    bitrate = bitrates[bitrate_index] * 1000
+    padding = (b2 >> 1) & 1
+    mono = (b3 >> 6) == CHANNEL_MODE_MONO
+    coefficient = 144 if version == "MPEG1" else 72
+    if version == "MPEG1":
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    return {
+        "version_bits": version_bits,
+        "version": version,
+        "sample_rate": sample_rate,
+        "bitrate": bitrate,
+        "mono": mono,
+        "protected": not (b1 & 1),
+        "side_info_size": side_info,
+        "samples_per_frame": 1152 if version == "MPEG1" else 576,
+        "frame_length": coefficient * bitrate // sample_rate + padding,
+    }
+
+
+def _strip_id3(data: bytes) -> bytes:
+    """Remove a leading ID3v2 tag and a trailing ID3v1 tag"""
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        data = data[10 + size + footer:]
+    if len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+    return data
+
+
+def _find_first_frame(data: bytes) -> Tuple[int, Dict]:
+    """Offset and header of the first frame followed by another valid frame"""
+    offset = data.find(b"\xff")
+    while offset != -1:
+        header = parse_frame_header(data, offset)
+        if header:
+            following = offset + header["frame_length"]
+            if following >= len(data) or parse_frame_header(data, following):
+                return offset, header
+        offset = data.find(b"\xff", offset + 1)
+    raise ValueError("No MPEG Layer III frames found")
+
+
+def frames_only(data: bytes) -> Tuple[bytes, Dict]:
+    """Strip tags and Xing/Info frames, returning the raw frames and their format"""
+    data = _strip_id3(data)
+    offset, header = _find_first_frame(data)
+    body_start = offset + 4 + (2 if header["protected"] else 0) + header["side_info_size"]
+    if data[body_start:body_start + 4] in (b"Xing", b"Info"):
+        offset += header["frame_length"]
+        header = parse_frame_header(data, offset) or header
+    return data[offset:], header
+
+
+def stream_format(header: Dict) -> Tuple[int, int, bool]:
+    """Properties that must match for frames to be concatenated"""
+    return header["version_bits"], header["sample_rate"], header["mono"]
+
+
+@lru_cache(maxsize=32)
+def silence(duration_ms: int, version_bits: int, sample_rate: int, mono: bool, bitrate_kbps: int = 32) -> bytes:
+    """Silent Layer III frames of (approximately) the given duration"""
+    version, sample_rates = _SAMPLE_RATES[version_bits]
+    bitrates = _BITRATES["MPEG1" if version == "MPEG1" else "MPEG2"]
+    bitrate_index = bitrates.index(bitrate_kbps)
+    sample_rate_index = sample_rates.index(sample_rate)
+    header = bytes([
+        0xFF,
+        0xE0 | (version_bits << 3) | (0b01 << 1) | 1,  # Layer III, no CRC
+        (bitrate_index << 4) | (sample_rate_index << 2),
+        (CHANNEL_MODE_MONO if mono else 0b00) << 6,
+    ])
+    frame = parse_frame_header(header + bytes(4))
+    frame_bytes = header + bytes(frame["frame_length"] - 4)
+    frame_count = max(1, round(duration_ms * sample_rate / 1000 / frame["samples_per_frame"]))
+    return frame_bytes * frame_count
+
+
+def concatenate(segments: List) -> bytes:
+    """Join encoded parts and pauses into one MP3 stream
+
+    Args:
+        segments: Items that are either MP3 bytes or an int pause duration
+            in milliseconds. Pauses take the format of the first MP3 part.
+
+    Raises:
+        ValueError: If the parts are not MP3 or their formats differ
+    """
+    parsed = []
+    fmt = None
+    for segment in segments:
+        if isinstance(segment, int):
+            parsed.append(segment)
+            continue
+        frames, header = frames_only(segment)
+        if fmt is None:
+            fmt = stream_format(header)
+        elif stream_format(header) != fmt:
+            raise ValueError(f"Mismatched MP3 formats: {stream_format(header)} vs {fmt}")
+        parsed.append(frames)
+    if fmt is None:
+        raise ValueError("No MP3 parts to concatenate")
+    return b"".join(
+        silence(segment, *fmt) if isinstance(segment, int) else segment
+        for segment in parsed
+    )
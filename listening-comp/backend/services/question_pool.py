@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from backend.utils.file_utils import atomic_write_bytes
+from backend.utils.logger import Logger
+
+DEFAULT_POOL_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "question_pool.json"
+)
+
+# (practice_type, topic)
+PoolKey = Tuple[str, str]
+
+
+def load_pooled_question_audio(pool_file: str = DEFAULT_POOL_FILE) -> Set[str]:
+    """File names of the audio held by pre-generated questions"""
+    try:
+        with open(pool_file, 'r', encoding='utf-8') as f:
+            pools = json.load(f).get("pools", [])
+    except (FileNotFoundError, json.JSONDecodeError):
+        return set()
+    return {
+        os.path.basename(entry["audio_file"])
+        for pool in pools
+        for entry in pool["entries"]
+        if entry.get("audio_file")
+    }
+
+
+class QuestionPool:
+    """Pre-generated questions (with audio) kept ready per (practice type, topic)
+
+    Questions are generated in the background until each pool in use holds
+    target_size entries, and a pool is refilled as soon as taking from it
+    leaves low_watermark or fewer. A refill that fails or generates nothing
+    is not retried until a cooldown has passed, doubling with each further
+    failure. The pools are persisted so ready questions survive restarts.
+    """
+
+    def __init__(
+        self,
+        generators: Dict[str, Callable[[str], Optional[Dict]]],
+        render_audio: Optional[Callable[[Dict], str]] = None,
+        target_size: int = 3,
+        low_watermark: int = 1,
+        pool_file: str = DEFAULT_POOL_FILE,
+        max_workers: int = 2,
+        retry_after: float = 60.0,
+        max_retry_after: float = 900.0
+    ):
+        """
+        Args:
+            generators: Question generator per practice type, called with the topic;
+                returning None means nothing can be generated for that topic right now
+            render_audio: Generates the audio for a question and returns its path
+            target_size: Questions to keep ready per pool
+            low_watermark: Refill once a pool holds this many questions or fewer
+            pool_file: JSON file the pools are persisted to
+            max_workers: Pools refilled at the same time
+            retry_after: Seconds before a pool whose refill failed is refilled again
+            max_retry_after: Upper bound for the cooldown after repeated failures
+        """
+        self.generators = generators
+        self.render_audio = render_audio
+        self.target_size = target_size
+        self.low_watermark = low_watermark
+        self.pool_file = pool_file
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self.logger = Logger().get_logger()
+        self._lock = threading.Lock()
+        self._refilling: Set[PoolKey] = set()
+        # key -> (consecutive failed refills, monotonic time before which ensure skips it)
+        self._failures: Dict[PoolKey, Tuple[int, float]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="question-pool")
+        self._pools: Dict[PoolKey, List[Dict]] = self._load()
+
+    def _load(self) -> Dict[PoolKey, List[Dict]]:
+        try:
+            with open(self.pool_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Ignoring unreadable question pool {self.pool_file}: {str(e)}")
+            return {}
+
+        pools = {}
+        for pool in saved.get("pools", []):
+            entries = []
+            for entry in pool["entries"]:
+                # Audio may have been removed while the app was down; keep the question
+                if entry.get("audio_file") and not os.path.exists(entry["audio_file"]):
+                    entry["audio_file"] = None
+                entries.append(entry)
+            # Version 1 keys also held an unused level
+            pools.setdefault(tuple(pool["key"][:2]), []).extend(entries)
+        self.logger.info(f"Loaded {sum(len(e) for e in pools.values())} pre-generated questions")
+        return pools
+
+    def _save_locked(self):
+        data = {
+            "version": 2,
+            "pools": [
+                {"key": list(key), "entries": entries}
+                for key, entries in self._pools.items()
+            ]
+        }
+        atomic_write_bytes(self.pool_file, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def size(self, practice_type: str, topic: str) -> int:
+        with self._lock:
+            return len(self._pools.get((practice_type, topic), []))
+
+    def ensure(self, practice_type: str, topic: str):
+        """Start filling a pool in the background if it is below the watermark
+
+        Does nothing while the pool's last refill is cooling down after a failure.
+        """
+        key = (practice_type, topic)
+        if practice_type not in self.generators:
+            raise ValueError(f"No question generator for practice type: {practice_type}")
+        with self._lock:
+            if len(self._pools.get(key, [])) > self.low_watermark or key in self._refilling:
+                return
+            if key in self._failures and time.monotonic() < self._failures[key][1]:
+                return
+            self._refilling.add(key)
+        self._executor.submit(self._refill, key)
+
+    def take(self, practice_type: str, topic: str) -> Optional[Dict]:
+        """
+        Pop a ready question, or return None if the pool is empty so the
+        caller can generate one synchronously. Triggers a background refill.
+
+        Returns:
+            {"question": ..., "audio_file": ..., "created_at": ...} or None
+        """
+        key = (practice_type, topic)
+        with self._lock:
+            entries = self._pools.get(key, [])
+            entry = entries.pop(0) if entries else None
+            if entry is not None:
+                self._save_locked()
+        self.ensure(practice_type, topic)
+        return entry
+
+    def _generate_entry(self, key: PoolKey) -> Optional[Dict]:
+        practice_type, topic = key
+        question = self.generators[practice_type](topic)
+        if not question:
+            return None
+        audio_file = self.render_audio(question) if self.render_audio else None
+        return {
+            "question": question,
+            "audio_file": audio_file,
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+    def _refill(self, key: PoolKey):
+        try:
+            while True:
+                with self._lock:
+                    if len(self._pools.get(key, [])) >= self.target_size:
+                        return
+                start = time.perf_counter()
+                try:
+                    entry = self._generate_entry(key)
+                except Exception as e:
+                    self._record_failure(key, f"pre-generating a question failed: {str(e)}")
+                    return
+                if entry is None:
+                    self._record_failure(key, "no question could be generated")
+                    return
+                with self._lock:
+                    self._failures.pop(key, None)
+                    self._pools.setdefault(key, []).append(entry)
+                    self._save_locked()
+                    size = len(self._pools[key])
+                self.logger.info(
+                    f"Pre-generated question for {key} in {time.perf_counter() - start:.1f}s "
+                    f"({size}/{self.target_size} ready)"
+                )
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def _record_failure(self, key: PoolKey, reason: str):
+        """Back off refilling a pool after a failed or empty refill"""
+        with self._lock:
+            failures = self._failures.get(key, (0, 0.0))[0] + 1
+            cooldown = min(self.retry_after * 2 ** (failures - 1), self.max_retry_after)
+            self._failures[key] = (failures, time.monotonic() + cooldown)
+        self.logger.warning(f"Refill of {key} stopped: {reason}; retrying in {cooldown:.0f}s")
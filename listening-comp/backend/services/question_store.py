@@ -0,0 +1,193 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from backend.utils.logger import Logger
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, "questions.sqlite3")
+LEGACY_JSON_PATH = os.path.join(DATA_DIR, "stored_questions.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id TEXT PRIMARY KEY,
+    practice_type TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    audio_file TEXT,
+    question TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_group
+    ON questions (practice_type, topic, created_at);
+CREATE INDEX IF NOT EXISTS idx_questions_created_at
+    ON questions (created_at);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class QuestionStore:
+    """Append-only SQLite store for generated questions
+
+    Every save is a single INSERT with a random id, so concurrent saves never
+    overwrite each other and nothing is rewritten. Listing is done with
+    indexed, paginated queries instead of loading every question. The old
+    stored_questions.json is imported once, keeping its ids.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, legacy_json_path: Optional[str] = LEGACY_JSON_PATH):
+        """
+        Args:
+            db_path: SQLite database file
+            legacy_json_path: stored_questions.json to migrate on first use (None to skip)
+        """
+        self.db_path = db_path
+        self.logger = Logger().get_logger()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        if legacy_json_path:
+            self._migrate_json(legacy_json_path)
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps the store safe to use
+        # from Streamlit's script threads and background workers alike
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _migrate_json(self, json_path: str):
+        """Import stored_questions.json once"""
+        with self._lock, self._connect() as conn:
+            if conn.execute("SELECT 1 FROM store_meta WHERE key = 'json_migrated'").fetchone():
+                return
+            imported = 0
+            if os.path.exists(json_path):
+                try:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        stored_questions = json.load(f)
+                except json.JSONDecodeError as e:
+                    self.logger.error(f"Could not migrate {json_path}: {str(e)}")
+                    return
+                rows = [
+                    (
+                        question_id,
+                        entry.get("practice_type", ""),
+                        entry.get("topic", ""),
+                        entry.get("created_at", ""),
+                        entry.get("audio_file"),
+                        json.dumps(entry.get("question"), ensure_ascii=False)
+                    )
+                    for question_id, entry in stored_questions.items()
+                ]
+                imported = conn.executemany(
+                    "INSERT OR IGNORE INTO questions "
+                    "(id, practice_type, topic, created_at, audio_file, question) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                ).rowcount
+            conn.execute(
+                "INSERT INTO store_meta (key, value) VALUES ('json_migrated', ?)",
+                (datetime.now().isoformat(),)
+            )
+        if imported:
+            self.logger.info(f"Migrated {imported} questions from {json_path} to {self.db_path}")
+
+    @staticmethod
+    def _to_entry(row: sqlite3.Row) -> Dict:
+        return {
+            "question": json.loads(row["question"]),
+            "practice_type": row["practice_type"],
+            "topic": row["topic"],
+            "created_at": row["created_at"],
+            "audio_file": row["audio_file"],
+        }
+
+    def add(self, question: Dict, practice_type: str, topic: str, audio_file: Optional[str] = None) -> str:
+        """Store a question and return its id"""
+        question_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO questions (id, practice_type, topic, created_at, audio_file, question) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    question_id,
+                    practice_type,
+                    topic,
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+                    audio_file,
+                    json.dumps(question, ensure_ascii=False)
+                )
+            )
+        return question_id
+
+    def get(self, question_id: str) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM questions WHERE id = ?", (question_id,)).fetchone()
+        return self._to_entry(row) if row else None
+
+    def groups(self) -> Dict[str, Dict[str, int]]:
+        """Question counts per practice type and topic, in order of first use"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT practice_type, topic, COUNT(*) AS count, MIN(created_at) AS first_created "
+                "FROM questions GROUP BY practice_type, topic ORDER BY first_created"
+            ).fetchall()
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row["practice_type"], {})[row["topic"]] = row["count"]
+        return grouped
+
+    def list_questions(
+        self,
+        practice_type: Optional[str] = None,
+        topic: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Tuple[str, Dict]]:
+        """Page of (id, entry) pairs, newest first, optionally filtered"""
+        clauses, params = [], []
+        if practice_type is not None:
+            clauses.append("practice_type = ?")
+            params.append(practice_type)
+        if topic is not None:
+            clauses.append("topic = ?")
+            params.append(topic)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM questions {where}ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                (*params, limit, offset)
+            ).fetchall()
+        return [(row["id"], self._to_entry(row)) for row in rows]
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def load_all(self) -> Dict[str, Dict]:
+        """All questions keyed by id, in the format of stored_questions.json"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM questions ORDER BY created_at").fetchall()
+        return {row["id"]: self._to_entry(row) for row in rows}
+
+    def referenced_audio_files(self) -> Set[str]:
+        """File names of the audio referenced by stored questions"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT audio_file FROM questions WHERE audio_file IS NOT NULL"
+            ).fetchall()
+        return {os.path.basename(row["audio_file"]) for row in rows if row["audio_file"]}
@@ -0,0 +1,76 @@
+from typing import Dict, List, Optional
+
+# Labelled blocks of a generated question, in the order they usually appear
+FIELD_LABELS = ("Introduction", "Conversation", "Situation", "Question", "Options")
+
+
+class IncrementalQuestionParser:
+    """Parses a generated question as its text streams in
+
+    The text is the "Introduction:/Conversation:/Situation:/Question:/Options:"
+    block format the question prompts ask for. Complete lines are parsed as
+    they arrive, so snapshot() can be rendered while the model is still
+    writing; finish() returns the same dict a full, non-streamed parse gives.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._fields: Dict[str, object] = {}
+        self._current_key: Optional[str] = None
+        self._current_value: List[str] = []
+
+    def _close_current(self):
+        if self._current_key:
+            if self._current_key == "Options":
+                self._fields["Options"] = list(self._current_value)
+            else:
+                self._fields[self._current_key] = " ".join(self._current_value)
+
+    def _parse_line(self, line: str):
+        line = line.strip()
+        if not line:
+            return
+        for label in FIELD_LABELS:
+            if line.startswith(f"{label}:"):
+                self._close_current()
+                self._current_key = label
+                rest = line[len(label) + 1:].strip()
+                self._current_value = [] if label == "Options" else [rest]
+                return
+        if self._current_key == "Options" and len(line) > 1 and line[0].isdigit() and line[1] == ".":
+            self._current_value.append(line[2:].strip())
+        elif self._current_key:
+            self._current_value.append(line)
+
+    def feed(self, text: str) -> Dict:
+        """Add streamed text and return the current snapshot"""
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._parse_line(line)
+        return self.snapshot()
+
+    @property
+    def completed_fields(self) -> List[str]:
+        """Fields whose block has ended (a later label has started)"""
+        return [key for key in self._fields if key != self._current_key]
+
+    def snapshot(self) -> Dict:
+        """Fields parsed so far, including the block still being written"""
+        snapshot = dict(self._fields)
+        if self._current_key:
+            value = list(self._current_value)
+            pending = self._buffer.strip()
+            if pending and self._current_key != "Options":
+                value.append(pending)
+            snapshot[self._current_key] = value if self._current_key == "Options" else " ".join(value)
+        return snapshot
+
+    def finish(self) -> Dict:
+        """Parse any trailing text and return the complete question"""
+        if self._buffer:
+            self._parse_line(self._buffer)
+            self._buffer = ""
+        self._close_current()
+        self._current_key = None
+        return dict(self._fields)
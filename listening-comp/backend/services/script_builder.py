@@ -0,0 +1,128 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+# A speaker label such as "男性:", "女の人：", "A:" or "店員：" at the start of
+# the text or after whitespace / sentence-ending punctuation
+_SPEAKER_LABEL = re.compile(
+    r'(?:^|(?<=[\s。！？!?」』）)]))([^\s:：。、，,「」『』（）()!?！？]{1,12})\s*[:：]\s*'
+)
+
+# Checked in this order, so "female"/"woman" are not mistaken for "male"/"man"
+_FEMALE_MARKERS = ('女', 'female', 'woman', 'girl', 'lady', 'mother', 'wife', '母', '妻', '姉', '妹', '娘', 'おばあ')
+_MALE_MARKERS = ('男', 'male', 'man', 'boy', 'father', 'husband', '父', '夫', '兄', '弟', '息子', 'おじい')
+_EXACT_LABELS = {'f': 'female', 'ｆ': 'female', 'w': 'female', 'm': 'male', 'ｍ': 'male'}
+
+QUESTION_FIELDS = ('Introduction', 'Situation', 'Conversation', 'Question', 'Options')
+
+# Section of the question each script part belongs to, used to place pauses
+SECTION_INTRO = 'intro'
+SECTION_CONVERSATION = 'conversation'
+SECTION_QUESTION = 'question'
+SECTION_SOURCE = 'source'
+SECTIONS = (SECTION_INTRO, SECTION_CONVERSATION, SECTION_QUESTION, SECTION_SOURCE)
+
+
+def infer_gender(speaker: str) -> Optional[str]:
+    """Gender implied by a speaker label, or None if it does not say"""
+    label = speaker.strip().lower()
+    if label in _EXACT_LABELS:
+        return _EXACT_LABELS[label]
+    if any(marker in label for marker in _FEMALE_MARKERS):
+        return 'female'
+    if any(marker in label for marker in _MALE_MARKERS):
+        return 'male'
+    return None
+
+
+def split_turns(conversation: str) -> List[Tuple[str, str, str]]:
+    """
+    Split a dialogue into (speaker, text, gender) turns using its speaker labels.
+    Speakers whose label does not imply a gender alternate between male and
+    female in order of appearance. Returns [] if the dialogue has no labels.
+    """
+    labels = list(_SPEAKER_LABEL.finditer(conversation))
+    if not labels:
+        return []
+
+    speaker_genders: Dict[str, str] = {}
+    next_unknown_gender = 'male'
+    turns = []
+    for index, match in enumerate(labels):
+        end = labels[index + 1].start() if index + 1 < len(labels) else len(conversation)
+        text = conversation[match.end():end].strip()
+        if not text:
+            continue
+        speaker = match.group(1)
+        if speaker not in speaker_genders:
+            gender = infer_gender(speaker)
+            if gender is None:
+                gender = next_unknown_gender
+                next_unknown_gender = 'female' if gender == 'male' else 'male'
+            speaker_genders[speaker] = gender
+        turns.append((speaker, text, speaker_genders[speaker]))
+    return turns
+
+
+def build_script(question: Dict) -> Optional[List[Tuple[str, str, str, str]]]:
+    """
+    Build the audio script for a structured question without an LLM.
+
+    The introduction (or situation) and question are read by the announcer and
+    the conversation is split into labelled speaker turns. Each part is a
+    (speaker, text, gender, section) tuple. Returns None when the conversation
+    has no speaker labels to split on.
+    """
+    parts = []
+    introduction = (question.get('Introduction') or question.get('Situation') or '').strip()
+    if introduction:
+        parts.append(('Announcer', introduction, 'male', SECTION_INTRO))
+
+    conversation = (question.get('Conversation') or '').strip()
+    if conversation:
+        turns = split_turns(conversation)
+        if not turns:
+            return None
+        parts.extend((speaker, text, gender, SECTION_CONVERSATION) for speaker, text, gender in turns)
+
+    question_text = (question.get('Question') or '').strip()
+    if question_text:
+        parts.append(('Announcer', question_text, 'male', SECTION_QUESTION))
+
+    return parts or None
+
+
+def assign_sections(parts: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str, str]]:
+    """
+    Add sections to (speaker, text, gender) parts from their order: announcer
+    parts before the first other speaker are the introduction, announcer parts
+    after it the question, and everything else the conversation.
+    """
+    sectioned = []
+    seen_conversation = False
+    for speaker, text, gender in parts:
+        if speaker.lower() != 'announcer':
+            section = SECTION_CONVERSATION
+            seen_conversation = True
+        else:
+            section = SECTION_QUESTION if seen_conversation else SECTION_INTRO
+        sectioned.append((speaker, text, gender, section))
+    return sectioned
+
+
+def build_audio_plan(parts: List[Tuple[str, str, str, str]], pause_settings: Dict[str, int]) -> List[Tuple[str, int]]:
+    """
+    Lay out the audio of a script as an ordered list of steps.
+
+    Each step is ('pause', duration_ms) or ('part', index into parts). A long
+    pause separates sections and a short pause separates parts within one.
+    """
+    plan = []
+    previous_section = None
+    for index, part in enumerate(parts):
+        section = part[3]
+        if previous_section is not None:
+            pause = 'long' if section != previous_section else 'short'
+            plan.append(('pause', pause_settings[pause]))
+        plan.append(('part', index))
+        previous_section = section
+    return plan
@@ -0,0 +1,206 @@
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from youtube_transcript_api import YouTubeTranscriptApi
+from backend.utils.file_utils import atomic_write_bytes
+from backend.utils.logger import Logger
+
+try:
+    import msgpack
+except ImportError:  # optional, JSON is used without it
+    msgpack = None
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "data", "transcript_cache"
+)
+
+FORMAT_VERSION = 1
+
+
+def download_transcript(video_id: str, language: str = 'ja') -> List[Dict]:
+    """Fetch a transcript from YouTube, bypassing the cache"""
+    return YouTubeTranscriptApi.get_transcript(video_id, languages=[language])
+
+
+class _Flight:
+    """A fetch in progress that other callers for the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class TranscriptCache:
+    """On-disk cache of transcript segments keyed by (video_id, language)
+
+    Segments are stored compactly as [text, start, duration] rows, with
+    MessagePack when it is installed and JSON otherwise, and expire after
+    ttl_seconds. Concurrent requests for the same transcript share a single
+    fetch (single-flight), and hits, misses and fetches are counted.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl_seconds: float = 7 * 24 * 3600, use_msgpack: bool = True):
+        """
+        Args:
+            cache_dir: Directory holding the cached transcripts
+            ttl_seconds: Age after which a cached transcript is fetched again
+            use_msgpack: Write MessagePack if available (JSON entries are still read)
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.extension = "msgpack" if use_msgpack and msgpack is not None else "json"
+        self.logger = Logger().get_logger()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.fetches = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def path_for(self, video_id: str, language: str, extension: Optional[str] = None) -> str:
+        return os.path.join(self.cache_dir, f"{video_id}.{language}.{extension or self.extension}")
+
+    @staticmethod
+    def _encode(segments: List[Dict]) -> Dict:
+        return {
+            "version": FORMAT_VERSION,
+            "fetched_at": time.time(),
+            "segments": [[s["text"], s.get("start", 0.0), s.get("duration", 0.0)] for s in segments]
+        }
+
+    @staticmethod
+    def _decode(entry: Dict) -> List[Dict]:
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in entry["segments"]
+        ]
+
+    def _read(self, video_id: str, language: str) -> Optional[Dict]:
+        for extension in (self.extension, "json" if self.extension == "msgpack" else "msgpack"):
+            path = self.path_for(video_id, language, extension)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            try:
+                if extension == "msgpack":
+                    if msgpack is None:
+                        continue
+                    return msgpack.unpackb(data, raw=False)
+                return json.loads(data.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError) as e:
+                self.logger.warning(f"Ignoring unreadable cached transcript {path}: {str(e)}")
+        return None
+
+    def get(self, video_id: str, language: str = 'ja') -> Optional[List[Dict]]:
+        """Cached segments, or None if missing or expired"""
+        entry = self._read(video_id, language)
+        expired = entry is not None and time.time() - entry.get("fetched_at", 0) > self.ttl_seconds
+        with self._lock:
+            if entry is None or expired:
+                self.misses += 1
+                self.expired += expired
+                return None
+            self.hits += 1
+        return self._decode(entry)
+
+    def put(self, video_id: str, language: str, segments: List[Dict]):
+        entry = self._encode(segments)
+        if self.extension == "msgpack":
+            data = msgpack.packb(entry, use_bin_type=True)
+        else:
+            data = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        atomic_write_bytes(self.path_for(video_id, language), data)
+
+    def get_or_fetch(
+        self,
+        video_id: str,
+        language: str = 'ja',
+        fetcher: Callable[[str, str], List[Dict]] = download_transcript
+    ) -> Optional[List[Dict]]:
+        """
+        Return the cached transcript, fetching and caching it on a miss.
+
+        While one thread fetches a transcript, other callers for the same
+        (video_id, language) wait for its result instead of fetching again.
+        Empty results are not cached. Fetch errors are raised to every waiter.
+        """
+        segments = self.get(video_id, language)
+        if segments is not None:
+            return segments
+
+        key = (video_id, language)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error:
+                raise flight.error
+            return flight.result
+
+        try:
+            # Another leader may have stored it between our lookup and now
+            entry = self._read(video_id, language)
+            if entry is not None and time.time() - entry.get("fetched_at", 0) <= self.ttl_seconds:
+                flight.result = self._decode(entry)
+                return flight.result
+            with self._lock:
+                self.fetches += 1
+            flight.result = fetcher(video_id, language)
+            if flight.result:
+                self.put(video_id, language, flight.result)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "fetches": self.fetches,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache() -> TranscriptCache:
+    """Process-wide transcript cache, created on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TranscriptCache()
+        return _cache
+
+
+def cached_transcript(video_id: str, language: str = 'ja') -> Optional[List[Dict]]:
+    """Transcript segments for a video through the shared cache"""
+    return get_transcript_cache().get_or_fetch(video_id, language)
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from typing import Dict, Optional
+from backend.utils.content_hash import stable_hash
+from backend.utils.file_utils import atomic_write_bytes
+
+
+class TTSCache:
+    """Content-addressed cache of synthesized speech segments
+
+    Files are named by a hash of (text, voice, engine, format), written
+    atomically (temp file + rename) so concurrent workers and processes can
+    share the directory, and evicted least-recently-used first once the
+    directory grows beyond max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024, min_age_seconds: float = 60.0):
+        """
+        Args:
+            cache_dir: Directory holding the cached segments
+            max_bytes: Upper bound for the total size of cached segments
+            min_age_seconds: Segments used more recently than this are never
+                evicted, so files handed out to running jobs stay readable
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.min_age_seconds = min_age_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.characters_saved = 0
+
+    @staticmethod
+    def make_key(text: str, voice: str, engine: str, output_format: str) -> str:
+        """Cache key for a synthesis request"""
+        return stable_hash([text, voice, engine, output_format])
+
+    def path_for(self, key: str, extension: str = "mp3") -> str:
+        return os.path.join(self.cache_dir, f"{key}.{extension}")
+
+    def get(self, key: str, characters: int = 0, extension: str = "mp3") -> Optional[str]:
+        """Return the cached file for key, or None on a miss
+
+        Args:
+            characters: Length of the text, counted as saved Polly characters on a hit
+        """
+        path = self.path_for(key, extension)
+        try:
+            # Touch the file so eviction treats it as recently used
+            os.utime(path, None)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self.characters_saved += characters
+        return path
+
+    def read(self, key: str, characters: int = 0, extension: str = "mp3") -> Optional[bytes]:
+        """Return the cached bytes for key, or None on a miss"""
+        path = self.get(key, characters, extension)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            # Evicted by another process between the check and the read
+            return None
+
+    def put(self, key: str, data: bytes, extension: str = "mp3") -> str:
+        """Atomically store data under key and return its path"""
+        path = self.path_for(key, extension)
+        atomic_write_bytes(path, data)
+        self.evict()
+        return path
+
+    def evict(self):
+        """Remove least recently used segments until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+
+        cutoff = time.time() - self.min_age_seconds
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes or mtime > cutoff:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+                'characters_saved': self.characters_saved
+            }
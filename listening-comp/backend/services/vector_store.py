@@ -2,15 +2,56 @@ import chromadb
 from chromadb.utils import embedding_functions
 from chromadb.errors import InvalidCollectionException
 import json
+import math
 import os
-import boto3
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from backend.services.bedrock_gateway import BedrockGateway, BedrockThrottledError, get_bedrock_gateway
+from backend.utils.content_hash import content_hash
 from backend.utils.logger import Logger
 
+# Chroma's own HNSW defaults. Override per collection key ("section2",
+# "section3", "transcripts") through QuestionVectorStore(hnsw_config=...).
+DEFAULT_HNSW_CONFIG = {
+    "space": "l2",
+    "M": 16,
+    "construction_ef": 100,
+    "search_ef": 10,
+}
+
+
+# Maximum distance at which two entries count as near-duplicates, per distance
+# space. All three correspond to a cosine similarity of ~0.95 on the
+# unit-normalized Titan embeddings (Chroma's l2 is the squared distance).
+NEAR_DUPLICATE_DISTANCE = {
+    "l2": 0.1,
+    "cosine": 0.05,
+    "ip": 0.05,
+}
+
+# Cap on the duplicate sources kept in a canonical entry's metadata
+MAX_LINKED_DUPLICATES = 100
+
+
+def hnsw_metadata(config: Dict) -> Dict:
+    """Translate an HNSW config dict into Chroma collection metadata keys"""
+    return {f"hnsw:{key}": value for key, value in config.items()}
+
+
+def embedding_distance(a: List[float], b: List[float], space: str) -> float:
+    """Distance between two embeddings as Chroma computes it for the given space"""
+    dot = sum(x * y for x, y in zip(a, b))
+    if space == "ip":
+        return 1.0 - dot
+    if space == "cosine":
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return 1.0 - dot / norm if norm else 1.0
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
 class BedrockEmbeddingFunction(embedding_functions.EmbeddingFunction):
-    def __init__(self, model_id="amazon.titan-embed-text-v2:0"):
+    def __init__(self, model_id="amazon.titan-embed-text-v2:0", gateway: Optional[BedrockGateway] = None):
         """Initialize Bedrock embedding function"""
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name="us-east-1")
+        self.gateway = gateway or get_bedrock_gateway()
         self.model_id = model_id
         self.logger = Logger().get_logger()
         self.dimension = 1024  # Titan v2 uses 1024 dimensions
@@ -25,17 +66,14 @@ class BedrockEmbeddingFunction(embedding_functions.EmbeddingFunction):
                 self.logger.info(f"Generating embedding for text: {preview}")
                 self.logger.debug(f"Full text length: {len(text)}")
                 
-                response = self.bedrock_client.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps({
-                        "inputText": text
-                    })
-                )
-                response_body = json.loads(response['body'].read())
+                response_body = self.gateway.invoke_model(self.model_id, {"inputText": text})
                 self.logger.debug(f"Embedding response keys: {response_body.keys()}")
                 embedding = response_body['embedding']
                 embeddings.append(embedding)
                 self.logger.info(f"Successfully generated embedding of dimension {len(embedding)}")
+            except BedrockThrottledError:
+                # A zero vector would be indexed as if it were real; let the caller retry later
+                raise
             except Exception as e:
                 self.logger.error(f"Error generating embedding: {str(e)}")
                 # Return a zero vector as fallback with correct dimension
@@ -43,20 +81,44 @@ class BedrockEmbeddingFunction(embedding_functions.EmbeddingFunction):
         return embeddings
 
 class QuestionVectorStore:
-    def __init__(self, persist_directory: str = "backend/data/vectorstore"):
-        """Initialize the vector store for JLPT listening questions"""
+    def __init__(
+        self,
+        persist_directory: str = "backend/data/vectorstore",
+        hnsw_config: Optional[Dict[str, Dict]] = None,
+        dedupe: bool = True,
+        near_duplicate_distance: Optional[float] = None,
+        embedding_fn: Optional[embedding_functions.EmbeddingFunction] = None,
+        gateway: Optional[BedrockGateway] = None
+    ):
+        """Initialize the vector store for JLPT listening questions
+
+        Args:
+            persist_directory (str): Directory for the Chroma database
+            hnsw_config (Dict[str, Dict]): Per-collection HNSW overrides keyed by
+                collection key, e.g. {"transcripts": {"M": 32, "search_ef": 64}}.
+                Unspecified values fall back to DEFAULT_HNSW_CONFIG.
+            dedupe (bool): Skip exact and near-duplicate entries on ingestion and
+                link them to the canonical entry instead
+            near_duplicate_distance (float): Override for the near-duplicate
+                distance threshold (defaults to NEAR_DUPLICATE_DISTANCE[space])
+            embedding_fn: Embedding function to use instead of Bedrock Titan
+                (e.g. an offline stub); must match the existing collections
+            gateway: Bedrock gateway to use instead of the process-wide one
+        """
         self.persist_directory = persist_directory
+        self.dedupe = dedupe
+        self.near_duplicate_distance = near_duplicate_distance
         self.logger = Logger().get_logger()
         os.makedirs(persist_directory, exist_ok=True)
         
         # Initialize ChromaDB client
         self.client = chromadb.PersistentClient(path=persist_directory)
         
-        # Initialize Bedrock client
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name="us-east-1")
+        # Shared Bedrock gateway
+        self.gateway = gateway or get_bedrock_gateway()
         
-        # Use Bedrock's Titan embedding model
-        self.embedding_fn = BedrockEmbeddingFunction()
+        # Use Bedrock's Titan embedding model unless another one is given
+        self.embedding_fn = embedding_fn or BedrockEmbeddingFunction(gateway=self.gateway)
         
         # Create or get collections
         self.collections = {}
@@ -75,7 +137,17 @@ class QuestionVectorStore:
             }
         }
         
+        hnsw_config = hnsw_config or {}
+        unknown_keys = set(hnsw_config) - set(collection_configs)
+        if unknown_keys:
+            raise ValueError(f"Unknown collections in hnsw_config: {sorted(unknown_keys)}")
+        self.hnsw_config = {
+            key: {**DEFAULT_HNSW_CONFIG, **hnsw_config.get(key, {})}
+            for key in collection_configs
+        }
+        
         for key, config in collection_configs.items():
+            index_metadata = hnsw_metadata(self.hnsw_config[key])
             try:
                 # Try to get existing collection first
                 self.collections[key] = self.client.get_collection(
@@ -84,21 +156,44 @@ class QuestionVectorStore:
                 # Update embedding function for existing collection
                 self.collections[key]._embedding_function = self.embedding_fn
                 self.logger.info(f"Retrieved existing collection: {config['name']}")
+                self._warn_on_index_mismatch(self.collections[key], index_metadata)
             except InvalidCollectionException:
                 # Collection doesn't exist, create new one
                 self.collections[key] = self.client.create_collection(
                     name=config["name"],
                     embedding_function=self.embedding_fn,
-                    metadata=config["metadata"]
+                    metadata={**config["metadata"], **index_metadata}
+                )
+                self.logger.info(
+                    f"Created new collection: {config['name']} with HNSW settings {self.hnsw_config[key]}"
                 )
-                self.logger.info(f"Created new collection: {config['name']}")
+
+    def _warn_on_index_mismatch(self, collection, index_metadata: Dict):
+        """Log when an existing collection was built with different HNSW settings
+
+        Chroma fixes the index parameters when a collection is created, so
+        changing them requires re-creating (and re-indexing) the collection.
+        Settings missing from the metadata (collections created before they
+        were configurable) were built with Chroma's defaults.
+        """
+        existing = collection.metadata or {}
+        defaults = hnsw_metadata(DEFAULT_HNSW_CONFIG)
+        mismatched = {}
+        for key, value in index_metadata.items():
+            current = existing.get(key, defaults.get(key))
+            if current != value:
+                mismatched[key] = (current, value)
+        if mismatched:
+            self.logger.warning(
+                f"Collection {collection.name} keeps its creation-time HNSW settings; "
+                f"requested changes (existing, requested) are ignored: {mismatched}. "
+                f"The index must be rebuilt (re-create the collection and re-ingest) to apply them."
+            )
 
     def add_questions(self, section_num: int, questions: List[Dict], video_id: str):
-        """Add questions to the vector store"""
+        """Add questions to the vector store, linking duplicates to existing entries"""
         if section_num not in [2, 3]:
             raise ValueError("Only sections 2 and 3 are currently supported")
-            
-        collection = self.collections[f"section{section_num}"]
         
         ids = []
         documents = []
@@ -131,12 +226,163 @@ class QuestionVectorStore:
                 """
             documents.append(document)
         
-        # Add to collection
-        collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
+        # Add to collection, skipping duplicates
+        stats = self._add_deduplicated(f"section{section_num}", ids, documents, metadatas)
+        self.logger.info(
+            f"Section {section_num} questions from {video_id}: added {stats['added']}, "
+            f"updated {stats['updated']}, exact duplicates {stats['exact_duplicates']}, near duplicates {stats['near_duplicates']}"
+        )
+        return stats
+
+    def _near_duplicate_threshold(self, collection_key: str) -> float:
+        """Distance threshold for near-duplicates in the given collection"""
+        if self.near_duplicate_distance is not None:
+            return self.near_duplicate_distance
+        return NEAR_DUPLICATE_DISTANCE[self.hnsw_config[collection_key]["space"]]
+
+    def _find_exact_duplicate(self, collection, text_hash: str) -> Optional[str]:
+        """Return the id of a stored entry with the same content hash"""
+        result = collection.get(where={"content_hash": text_hash}, limit=1, include=[])
+        return result["ids"][0] if result["ids"] else None
+
+    def _find_near_duplicate(
+        self, collection, embedding: List[float], threshold: float, exclude_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Return the id of the nearest stored entry if it is within the threshold
+
+        exclude_id (the entry being re-ingested) is skipped, so an edited
+        entry is not matched against its own stored version.
+        """
+        count = collection.count()
+        if count == 0:
+            return None
+        result = collection.query(
+            query_embeddings=[embedding],
+            n_results=min(count, 2 if exclude_id else 1),
+            include=["distances"]
         )
+        for other_id, distance in zip(result["ids"][0], result["distances"][0]):
+            if other_id != exclude_id:
+                return other_id if distance <= threshold else None
+        return None
+
+    def _link_duplicate(self, collection, canonical_id: str, duplicate_id: str, metadata: Dict):
+        """Record a duplicate's source on the canonical entry's metadata"""
+        result = collection.get(ids=[canonical_id], include=["metadatas"])
+        if not result["ids"]:
+            return
+        canonical = dict(result["metadatas"][0])
+        duplicates = json.loads(canonical.get("duplicates", "[]"))
+        if duplicate_id in {entry["id"] for entry in duplicates}:
+            return
+        if len(duplicates) < MAX_LINKED_DUPLICATES:
+            source = {
+                key: value for key, value in metadata.items()
+                if key not in ("full_structure", "content_hash", "duplicates", "duplicate_count")
+            }
+            duplicates.append({"id": duplicate_id, **source})
+        canonical["duplicates"] = json.dumps(duplicates, ensure_ascii=False)
+        canonical["duplicate_count"] = canonical.get("duplicate_count", 0) + 1
+        collection.update(ids=[canonical_id], metadatas=[canonical])
+
+    @staticmethod
+    def _entry_columns(entries: List[Tuple[str, str, Dict, List[float]]]) -> Dict[str, List]:
+        """Keyword arguments for collection.add/upsert from (id, document, metadata, embedding) entries"""
+        return {
+            "ids": [entry[0] for entry in entries],
+            "documents": [entry[1] for entry in entries],
+            "metadatas": [entry[2] for entry in entries],
+            "embeddings": [entry[3] for entry in entries],
+        }
+
+    def _add_deduplicated(
+        self,
+        collection_key: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict]
+    ) -> Dict[str, int]:
+        """Add entries to a collection, linking duplicates instead of storing them
+
+        Exact duplicates (same normalized text) are detected by content hash
+        before anything is embedded. The remaining entries are embedded once;
+        an entry whose nearest neighbour is within the near-duplicate threshold
+        is linked to that neighbour rather than added. Entries whose id is
+        already stored with different text are updated in place.
+
+        Returns:
+            Dict[str, int]: Counts of added, updated, exact_duplicates and near_duplicates
+        """
+        collection = self.collections[collection_key]
+        stats = {"added": 0, "updated": 0, "exact_duplicates": 0, "near_duplicates": 0}
+        for metadata, document in zip(metadatas, documents):
+            metadata["content_hash"] = content_hash(document)
+
+        if not self.dedupe:
+            collection.add(ids=ids, documents=documents, metadatas=metadatas)
+            stats["added"] = len(ids)
+            return stats
+
+        # Exact duplicates, within this batch and against the store
+        candidates: List[Tuple[str, str, Dict]] = []
+        batch_hashes: Dict[str, str] = {}
+        links: List[Tuple[str, str, Dict]] = []
+        for entry_id, document, metadata in zip(ids, documents, metadatas):
+            text_hash = metadata["content_hash"]
+            canonical_id = batch_hashes.get(text_hash) or self._find_exact_duplicate(collection, text_hash)
+            if canonical_id == entry_id:
+                # Same entry re-ingested; already stored
+                continue
+            if canonical_id:
+                links.append((canonical_id, entry_id, metadata))
+                stats["exact_duplicates"] += 1
+                continue
+            batch_hashes[text_hash] = entry_id
+            candidates.append((entry_id, document, metadata))
+
+        # Near duplicates, using the embeddings we need for storage anyway
+        threshold = self._near_duplicate_threshold(collection_key)
+        space = self.hnsw_config[collection_key]["space"]
+        embeddings = self.embedding_fn([document for _, document, _ in candidates]) if candidates else []
+        accepted: List[Tuple[str, str, Dict, List[float]]] = []
+        for (entry_id, document, metadata), embedding in zip(candidates, embeddings):
+            canonical_id = None
+            if any(embedding):  # zero vectors come from failed embeddings
+                canonical_id = next(
+                    (
+                        other_id for other_id, _, _, other_embedding in accepted
+                        if any(other_embedding)
+                        and embedding_distance(embedding, other_embedding, space) <= threshold
+                    ),
+                    None
+                ) or self._find_near_duplicate(collection, embedding, threshold, exclude_id=entry_id)
+            if canonical_id:
+                links.append((canonical_id, entry_id, metadata))
+                stats["near_duplicates"] += 1
+            else:
+                accepted.append((entry_id, document, metadata, embedding))
+
+        # Ids already in the store were re-ingested with edited text: update
+        # them in place, keeping the duplicates linked to them
+        stored = collection.get(ids=[entry[0] for entry in accepted], include=["metadatas"]) if accepted else None
+        stored_metadata = dict(zip(stored["ids"], stored["metadatas"])) if stored else {}
+        new_entries = [entry for entry in accepted if entry[0] not in stored_metadata]
+        edited_entries = [entry for entry in accepted if entry[0] in stored_metadata]
+        for entry_id, _, metadata, _ in edited_entries:
+            for key in ("duplicates", "duplicate_count"):
+                if key in stored_metadata[entry_id]:
+                    metadata[key] = stored_metadata[entry_id][key]
+
+        if new_entries:
+            collection.add(**self._entry_columns(new_entries))
+            stats["added"] = len(new_entries)
+        if edited_entries:
+            collection.upsert(**self._entry_columns(edited_entries))
+            stats["updated"] = len(edited_entries)
+
+        for canonical_id, duplicate_id, metadata in links:
+            self._link_duplicate(collection, canonical_id, duplicate_id, metadata)
+        return stats
 
     def search_similar_questions(
         self, 
@@ -250,6 +496,9 @@ class QuestionVectorStore:
             video_id (str): YouTube video ID
             transcript_data (List[Dict]): List of transcript segments with text and timing
             metadata (Dict): Additional metadata to store with segments
+            
+        Returns:
+            Dict[str, int]: Counts of added chunks and skipped duplicates
         """
         try:
             # Process transcript segments in chunks
@@ -280,6 +529,9 @@ class QuestionVectorStore:
             self.logger.info(f"Created {len(chunks)} chunks from transcript")
             
             # Process each chunk
+            chunk_ids = []
+            chunk_texts = []
+            chunk_metadatas = []
             for i, chunk in enumerate(chunks):
                 # Combine text from segments in chunk
                 text = " ".join(seg['text'] for seg in chunk)
@@ -299,16 +551,18 @@ class QuestionVectorStore:
                 if metadata:
                     chunk_metadata.update(metadata)
                 
-                # Add to transcripts collection instead of section2
-                self.collections['transcripts'].add(
-                    documents=[text],
-                    metadatas=[chunk_metadata],
-                    ids=[f"{video_id}_chunk_{i}"]
-                )
-                
-                self.logger.info(f"Added chunk {i+1}/{len(chunks)} to vector store")
+                chunk_ids.append(f"{video_id}_chunk_{i}")
+                chunk_texts.append(text)
+                chunk_metadatas.append(chunk_metadata)
+            
+            # Add to transcripts collection instead of section2
+            stats = self._add_deduplicated('transcripts', chunk_ids, chunk_texts, chunk_metadatas)
             
-            self.logger.info(f"Successfully processed all transcript chunks")
+            self.logger.info(
+                f"Successfully processed all transcript chunks: added {stats['added']}, "
+                f"updated {stats['updated']}, exact duplicates {stats['exact_duplicates']}, near duplicates {stats['near_duplicates']}"
+            )
+            return stats
             
         except Exception as e:
             self.logger.error(f"Error adding transcript to vector store: {str(e)}", exc_info=True)
@@ -377,9 +631,9 @@ class QuestionVectorStore:
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"Generating question using Titan model (attempt {attempt + 1}/{max_retries})")
-                response = self.bedrock_client.invoke_model(
-                    modelId="amazon.titan-text-express-v1",
-                    body=json.dumps({
+                response_body = self.gateway.invoke_model(
+                    "amazon.titan-text-express-v1",
+                    {
                         "inputText": f"""You are a JLPT question generator. Your task is to create a listening practice question based on this Japanese transcript segment:
 
 {context}
@@ -399,9 +653,8 @@ Output ONLY a valid JSON object in this EXACT format, with NO additional text or
                             "temperature": 0.7 - (attempt * 0.2),  # Reduce temperature with each retry
                             "topP": 0.9 - (attempt * 0.1)  # Reduce topP with each retry
                         }
-                    })
+                    }
                 )
-                response_body = json.loads(response['body'].read())
                 self.logger.debug(f"Model response: {response_body}")
                 
                 # Extract and clean the JSON from the response
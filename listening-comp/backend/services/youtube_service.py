@@ -1,13 +1,43 @@
-from typing import Dict, List, Optional
-from youtube_transcript_api import YouTubeTranscriptApi
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
 from youtubesearchpython import VideosSearch
+from backend.services.transcript_cache import cached_transcript
 from backend.utils.logger import Logger
+from backend.utils.rate_limiter import TokenBucket
 import os
 import asyncio
+import threading
+
+
+def fetch_youtube_transcript(video_id: str) -> List[Dict]:
+    """Blocking fetch of a video's Japanese transcript through the shared cache"""
+    return cached_transcript(video_id, 'ja')
 
 
 class YouTubeService:
-    def __init__(self):
+    def __init__(
+        self,
+        transcript_fetcher: Callable[[str], List[Dict]] = fetch_youtube_transcript,
+        max_concurrent_fetches: int = 4,
+        requests_per_second: float = 2.0,
+        fetch_timeout: float = 30.0
+    ):
+        """
+        Args:
+            transcript_fetcher: Blocking function returning the transcript of a video ID
+            max_concurrent_fetches: Transcripts fetched at the same time
+            requests_per_second: Sustained fetch rate allowed per host
+            fetch_timeout: Seconds after which a single video is given up on
+        """
+        self.transcript_fetcher = transcript_fetcher
+        self.max_concurrent_fetches = max_concurrent_fetches
+        self.requests_per_second = requests_per_second
+        self.fetch_timeout = fetch_timeout
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        # Executors of fetches still running, including ones that timed out
+        self._fetch_executors = set()
+        self._fetch_executors_lock = threading.Lock()
         self.base_url = "https://www.youtube.com"
         self.google_search_url = "https://www.google.com/search"
         self.logger = Logger().get_logger()
@@ -55,12 +85,7 @@ class YouTubeService:
                 
             self.logger.info(f"Getting transcript for video: {video_id}")
             
-            # Get transcript using YouTubeTranscriptApi
-            transcript = await asyncio.to_thread(
-                YouTubeTranscriptApi.get_transcript,
-                video_id,
-                languages=['ja']
-            )
+            transcript = await self._fetch_in_thread(video_id)
             
             if not transcript:
                 self.logger.warning(f"No transcript found for video: {video_id}")
@@ -73,6 +98,36 @@ class YouTubeService:
             self.logger.error(f"Error getting transcript: {str(e)}", exc_info=True)
             return None
 
+    async def _fetch_in_thread(self, video_id: str) -> List[Dict]:
+        """
+        Run the blocking fetcher off the event loop, on a single-use thread.
+
+        youtube-transcript-api has no request timeout, so a fetch that
+        get_transcripts gives up on keeps running. With its own executor
+        that thread is never reused; it exits when the request returns
+        instead of holding a slot of a shared pool. The loop's default
+        executor is not used, so asyncio.run() does not wait on it either.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcript-fetch")
+        with self._fetch_executors_lock:
+            self._fetch_executors.add(executor)
+        future = executor.submit(self.transcript_fetcher, video_id)
+        executor.shutdown(wait=False)
+
+        def release(_):
+            with self._fetch_executors_lock:
+                self._fetch_executors.discard(executor)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    def close(self):
+        """Wait for running transcript fetches, including timed-out ones"""
+        with self._fetch_executors_lock:
+            executors = list(self._fetch_executors)
+        for executor in executors:
+            executor.shutdown(wait=True)
+
     @staticmethod
     def extract_video_id(url: str) -> Optional[str]:
         """Extract video ID from YouTube URL"""
@@ -85,6 +140,43 @@ class YouTubeService:
             return url.split("youtu.be/")[1][:11]
         return None
 
+    def _rate_limiter_for(self, video_url: str) -> TokenBucket:
+        """Token bucket shared by all fetches to the URL's host"""
+        host = urlparse(video_url).netloc.lower().removeprefix("www.")
+        if host in ("youtu.be", "m.youtube.com"):
+            host = "youtube.com"
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            # setdefault keeps one bucket per host when sessions race to create it
+            limiter = self._rate_limiters.setdefault(
+                host, TokenBucket(self.requests_per_second, capacity=self.max_concurrent_fetches)
+            )
+        return limiter
+
+    async def get_transcripts(self, video_urls: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Fetch transcripts for several videos concurrently.
+        
+        At most max_concurrent_fetches run at once, each host is rate limited,
+        and a video that takes longer than fetch_timeout is skipped (its
+        single-use thread finishes in the background without taking a
+        slot from later fetches). Returns the transcripts
+        found, keyed by URL in input order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def fetch(video_url: str):
+            async with semaphore:
+                await self._rate_limiter_for(video_url).acquire_async()
+                try:
+                    return await asyncio.wait_for(self.get_transcript(video_url), self.fetch_timeout)
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"Timed out after {self.fetch_timeout}s getting transcript: {video_url}")
+                    return None
+
+        transcripts = await asyncio.gather(*(fetch(url) for url in video_urls))
+        return {url: transcript for url, transcript in zip(video_urls, transcripts) if transcript}
+
     async def get_level_transcript(self, level: str) -> Dict[str, str]:
         """
         Get transcripts for a specific JLPT level.
@@ -96,12 +188,8 @@ class YouTubeService:
             # Search for videos dynamically
             videos = await self.search_jlpt_videos(level)
             
-            # Get transcripts for all videos
-            results = {}
-            for video in videos:
-                transcript = await self.get_transcript(video["url"])
-                if transcript:
-                    results[video["url"]] = transcript
+            # Get transcripts for all videos concurrently
+            results = await self.get_transcripts([video["url"] for video in videos])
             
             if not results:
                 self.logger.warning(f"No transcripts found for JLPT {level}")
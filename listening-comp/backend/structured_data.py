@@ -1,7 +1,12 @@
-from typing import Optional, Dict, List
-import boto3
+from typing import Optional, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
+import time
 import logging
+from backend.services.bedrock_gateway import BedrockThrottledError, get_bedrock_gateway
+from backend.utils.content_hash import stable_hash
+from backend.utils.file_utils import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -9,12 +14,26 @@ logger = logging.getLogger(__name__)
 # MODEL_ID = "amazon.nova-micro-v1:0"
 MODEL_ID = "amazon.nova-lite-v1:0"
 
+# Section extractions run at temperature 0, so their results are memoized here
+SECTION_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "section_cache")
+
 
 class TranscriptStructurer:
-    def __init__(self, model_id: str = MODEL_ID):
-        """Initialize Bedrock client"""
-        self.bedrock_client = boto3.client("bedrock-runtime", region_name="us-east-1")
+    def __init__(self, model_id: str = MODEL_ID, max_workers: int = 3, cache_dir: Optional[str] = SECTION_CACHE_DIR):
+        """Initialize Bedrock gateway
+
+        Args:
+            model_id: Bedrock model used for extraction
+            max_workers: Sections extracted concurrently
+            cache_dir: Directory memoizing section results (None disables it)
+        """
+        self.gateway = get_bedrock_gateway()
         self.model_id = model_id
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.last_section_stats = {}
         self.prompts = {
             1: """Extract questions from section of this JLPT transcript where the answer can be determined solely from the conversation without needing visual aids.
             
@@ -120,29 +139,93 @@ class TranscriptStructurer:
 
     def _invoke_bedrock(self, prompt: str, transcript: str) -> Optional[str]:
         """Make a single call to Bedrock with the given prompt"""
+        return self._invoke_bedrock_with_usage(prompt, transcript)[0]
+
+    def _invoke_bedrock_with_usage(self, prompt: str, transcript: str) -> Tuple[Optional[str], Dict]:
+        """Call Bedrock and return the text with its token usage
+
+        Returns (None, {}) if the call fails; BedrockThrottledError is raised
+        so a throttle is not recorded as a failed section.
+        """
         full_prompt = f"{prompt}\n\nHere's the transcript:\n{transcript}"
 
         messages = [{"role": "user", "content": [{"text": full_prompt}]}]
 
         try:
-            response = self.bedrock_client.converse(
-                modelId=self.model_id,
-                messages=messages,
-                inferenceConfig={"temperature": 0},
+            response = self.gateway.converse(
+                self.model_id, messages, inference_config={"temperature": 0}
             )
-            return response["output"]["message"]["content"][0]["text"]
+            usage = response.get("usage", {})
+            return response["output"]["message"]["content"][0]["text"], {
+                "input_tokens": usage.get("inputTokens", 0),
+                "output_tokens": usage.get("outputTokens", 0),
+            }
+        except BedrockThrottledError:
+            raise
         except Exception as e:
             logger.error(f"Error invoking Bedrock: {str(e)}")
+            return None, {}
+
+    def _cache_path(self, prompt: str, transcript: str) -> Optional[str]:
+        if not self.cache_dir:
             return None
+        key = stable_hash([self.model_id, prompt, transcript])
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def extract_section(self, section_num: int, transcript: str) -> Tuple[Optional[str], Dict]:
+        """Extract one section, reusing a memoized result for the same model, prompt and transcript
+
+        Returns:
+            (text, stats) where stats has latency, token counts and whether it was cached
+        """
+        prompt = self.prompts[section_num]
+        cache_path = self._cache_path(prompt, transcript)
+        start = time.perf_counter()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cached = json.load(f)
+                return cached["text"], {
+                    **cached["usage"],
+                    "latency_s": round(time.perf_counter() - start, 3),
+                    "cached": True,
+                }
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable section cache {cache_path}: {str(e)}")
+
+        text, usage = self._invoke_bedrock_with_usage(prompt, transcript)
+        stats = {**usage, "latency_s": round(time.perf_counter() - start, 3), "cached": False}
+        if text and cache_path:
+            atomic_write_bytes(
+                cache_path,
+                json.dumps({"text": text, "usage": usage}, ensure_ascii=False).encode("utf-8")
+            )
+        return text, stats
 
     def structure_transcript(self, transcript: str) -> Dict[int, str]:
-        """Structure the transcript into three sections using separate prompts"""
+        """Structure the transcript into sections, extracting them concurrently
+
+        Per-section latency and token counts are logged and kept in
+        self.last_section_stats.
+        """
         results = {}
         logger.info("Extracting questions section by section:")
         # Skipping section 1 for now
-        for section_num in range(2, 4):
-            logger.info(f"Processing section {section_num}...")
-            result = self._invoke_bedrock(self.prompts[section_num], transcript)
+        section_nums = list(range(2, 4))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            extracted = list(executor.map(
+                lambda section_num: self.extract_section(section_num, transcript),
+                section_nums
+            ))
+
+        self.last_section_stats = {}
+        for section_num, (result, stats) in zip(section_nums, extracted):
+            self.last_section_stats[section_num] = stats
+            logger.info(
+                f"Section {section_num}: {stats.get('latency_s', 0)}s, "
+                f"{stats.get('input_tokens', 0)} input / {stats.get('output_tokens', 0)} output tokens"
+                f"{' (cached)' if stats.get('cached') else ''}"
+            )
             if result:
                 results[section_num] = result
                 logger.info(f"Section {section_num} processed successfully")
@@ -178,7 +261,7 @@ class TranscriptStructurer:
             logger.error(f"Error loading transcript: {str(e)}")
             return None
 
-    def structure_transcript(self, transcript):
+    def structure_segments(self, transcript):
         """Convert raw transcript data into structured format"""
         structured_data = {"segments": [], "full_text": ""}
 
@@ -204,3 +287,4 @@ if __name__ == "__main__":
         structurer.save_questions(
             structured_sections, "backend/data/questions/sY7L5cfCWno.txt"
         )
+        print(json.dumps(structurer.last_section_stats, indent=2))
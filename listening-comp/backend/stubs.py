@@ -0,0 +1,89 @@
+"""Offline stand-ins for the YouTube and Bedrock backends
+
+Used by the ingestion pipeline's --stub mode so the whole flow can be run
+end to end without network access or AWS credentials. Each stub can sleep
+to imitate the latency of the service it replaces.
+"""
+import hashlib
+import math
+import random
+import time
+from typing import Dict, List
+from chromadb.utils import embedding_functions
+from backend.structured_data import TranscriptStructurer
+
+_LINES = [
+    "すみません、駅はどこですか。",
+    "まっすぐ行って、二つ目の角を右に曲がってください。",
+    "明日の会議は何時からですか。",
+    "十時からです。資料を忘れないでください。",
+    "このシャツ、もう少し大きいサイズはありますか。",
+    "はい、Lサイズがございます。",
+    "週末は何をしましたか。",
+    "友達と映画を見に行きました。",
+]
+
+
+class StubTranscriptFetcher:
+    """Returns a deterministic Japanese transcript for any video ID"""
+
+    def __init__(self, latency: float = 0.0, segments: int = 40):
+        self.latency = latency
+        self.segments = segments
+
+    def __call__(self, video_id: str, language: str = 'ja') -> List[Dict]:
+        time.sleep(self.latency)
+        rng = random.Random(video_id)
+        return [
+            {"text": rng.choice(_LINES), "start": i * 3.0, "duration": 3.0}
+            for i in range(self.segments)
+        ]
+
+
+class StubStructurer(TranscriptStructurer):
+    """TranscriptStructurer that formats questions locally instead of calling Bedrock"""
+
+    def __init__(self, latency: float = 0.0, questions_per_section: int = 3):
+        # No Bedrock client or section cache needed
+        self.latency = latency
+        self.questions_per_section = questions_per_section
+        self.last_section_stats = {}
+
+    def structure_transcript(self, transcript: str) -> Dict[int, str]:
+        time.sleep(self.latency)
+        lines = [line for line in transcript.splitlines() if line.strip()] or _LINES
+        rng = random.Random(transcript)
+        section2, section3 = [], []
+        for _ in range(self.questions_per_section):
+            first, second = rng.sample(lines, 2) if len(lines) > 1 else (lines[0], lines[0])
+            options = "\n".join(f"{n}. {rng.choice(_LINES)}" for n in range(1, 5))
+            section2.append(
+                f"<question>\nIntroduction:\n{first}\n\nConversation:\n男: {first} 女: {second}\n\n"
+                f"Question:\n{second}\n\nOptions:\n{options}\n</question>"
+            )
+            section3.append(f"<question>\nSituation:\n{first}\n\nQuestion:\n何と言いますか\n</question>")
+        self.last_section_stats = {
+            section: {"latency_s": self.latency, "input_tokens": 0, "output_tokens": 0, "cached": False}
+            for section in (2, 3)
+        }
+        return {2: "\n\n".join(section2), 3: "\n\n".join(section3)}
+
+
+class HashEmbeddingFunction(embedding_functions.EmbeddingFunction):
+    """Deterministic character-bigram hashing embeddings (no Bedrock calls)"""
+
+    def __init__(self, dimension: int = 64, latency: float = 0.0):
+        self.dimension = dimension
+        self.latency = latency
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.latency)
+        embeddings = []
+        for text in texts:
+            vector = [0.0] * self.dimension
+            for a, b in zip(text, text[1:]):
+                bucket = int(hashlib.md5(f"{a}{b}".encode("utf-8")).hexdigest(), 16) % self.dimension
+                vector[bucket] += 1.0
+            norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+            embeddings.append([x / norm for x in vector])
+        return embeddings
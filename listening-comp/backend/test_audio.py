@@ -30,8 +30,8 @@ def test_audio_generation():
     parts = generator.parse_conversation(test_question)
     
     print("\nParsed conversation parts:")
-    for speaker, text, gender in parts:
-        print(f"Speaker: {speaker} ({gender})")
+    for speaker, text, gender, section in parts:
+        print(f"Speaker: {speaker} ({gender}, {section})")
         print(f"Text: {text}")
         print("---")
     
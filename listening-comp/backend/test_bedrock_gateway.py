@@ -0,0 +1,98 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from botocore.exceptions import ClientError, EventStreamError
+from backend.services.bedrock_gateway import BedrockGateway, BedrockThrottledError
+
+MODEL_ID = "amazon.nova-lite-v1:0"
+MESSAGES = [{"role": "user", "content": [{"text": "こんにちは"}]}]
+
+
+def client_error(code: str, operation: str = "Converse", error_class=ClientError) -> ClientError:
+    return error_class({"Error": {"Code": code, "Message": f"{code} from stub"}}, operation)
+
+
+class StubBedrock:
+    """bedrock-runtime client that raises the given error or returns a canned reply"""
+
+    def __init__(self, error=None, stream_error=None):
+        self.error = error
+        self.stream_error = stream_error
+
+    def converse(self, **kwargs):
+        if self.error:
+            raise self.error
+        return {
+            "output": {"message": {"content": [{"text": "はい"}]}},
+            "usage": {"inputTokens": 5, "outputTokens": 2},
+        }
+
+    def converse_stream(self, **kwargs):
+        def events():
+            yield {"contentBlockDelta": {"delta": {"text": "は"}}}
+            if self.stream_error:
+                raise self.stream_error
+            yield {"contentBlockDelta": {"delta": {"text": "い"}}}
+            yield {"metadata": {"usage": {"inputTokens": 5, "outputTokens": 2}}}
+        if self.error:
+            raise self.error
+        return {"stream": events()}
+
+
+def _raises(call, error_class):
+    try:
+        call()
+    except error_class as e:
+        return e
+    raise AssertionError(f"expected {error_class.__name__}")
+
+
+def test_throttling_codes_map_to_throttled_error():
+    for code in ("ThrottlingException", "ServiceQuotaExceededException", "TooManyRequestsException"):
+        gateway = BedrockGateway(client=StubBedrock(error=client_error(code)))
+        error = _raises(lambda: gateway.converse_text(MODEL_ID, "こんにちは"), BedrockThrottledError)
+        assert isinstance(error.__cause__, ClientError)
+    metrics = gateway.metrics()[MODEL_ID]
+    assert metrics["errors"] == 1 and metrics["throttled"] == 1
+
+
+def test_other_client_errors_are_not_throttles():
+    gateway = BedrockGateway(client=StubBedrock(error=client_error("ValidationException")))
+    error = _raises(lambda: gateway.converse(MODEL_ID, MESSAGES), ClientError)
+    assert not isinstance(error, BedrockThrottledError)
+    metrics = gateway.metrics()[MODEL_ID]
+    assert metrics["errors"] == 1 and metrics["throttled"] == 0
+
+
+def test_stream_throttle_maps_to_throttled_error():
+    # Errors inside the event stream use camel-cased codes
+    stream_error = client_error("throttlingException", "ConverseStream", EventStreamError)
+    gateway = BedrockGateway(client=StubBedrock(stream_error=stream_error))
+    received = []
+
+    def consume():
+        for text in gateway.converse_stream(MODEL_ID, MESSAGES):
+            received.append(text)
+
+    _raises(consume, BedrockThrottledError)
+    assert received == ["は"]
+    assert gateway.metrics()[MODEL_ID]["throttled"] == 1
+
+
+def test_successful_calls_record_usage():
+    gateway = BedrockGateway(client=StubBedrock())
+    assert gateway.converse_text(MODEL_ID, "こんにちは") == "はい"
+    assert "".join(gateway.converse_stream(MODEL_ID, MESSAGES)) == "はい"
+    metrics = gateway.metrics()[MODEL_ID]
+    assert metrics["calls"] == 2 and metrics["errors"] == 0
+    assert metrics["input_tokens"] == 10 and metrics["output_tokens"] == 4
+    assert "ttft_p50_ms" in metrics
+
+
+if __name__ == "__main__":
+    test_throttling_codes_map_to_throttled_error()
+    test_other_client_errors_are_not_throttles()
+    test_stream_throttle_maps_to_throttled_error()
+    test_successful_calls_record_usage()
+    print("All Bedrock gateway tests passed")
@@ -0,0 +1,156 @@
+import ast
+import inspect
+import json
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.question_pool import QuestionPool
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend")
+POOL_METHODS = ("ensure", "take", "size")
+
+
+def _is_pool(node: ast.AST) -> bool:
+    """question_pool or get_question_pool(), the two ways the frontend reaches the pool"""
+    if isinstance(node, ast.Name):
+        return node.id == "question_pool"
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "get_question_pool"
+
+
+def frontend_pool_calls():
+    """(file, line, method, call node) of every QuestionPool call in the frontend"""
+    calls = []
+    for root, _, files in os.walk(FRONTEND_DIR):
+        for name in files:
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+            for node in ast.walk(tree):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in POOL_METHODS
+                    and _is_pool(node.func.value)
+                ):
+                    calls.append((os.path.relpath(path, FRONTEND_DIR), node.lineno, node.func.attr, node))
+    return calls
+
+
+def test_frontend_calls_match_pool_signatures():
+    calls = frontend_pool_calls()
+    assert {method for _, _, method, _ in calls} >= {"ensure", "take"}
+    for path, line, method, node in calls:
+        signature = inspect.signature(getattr(QuestionPool, method))
+        args = [None] * len(node.args)
+        kwargs = {keyword.arg: None for keyword in node.keywords}
+        try:
+            signature.bind(None, *args, **kwargs)
+        except TypeError as e:
+            raise AssertionError(f"frontend/{path}:{line} calls QuestionPool.{method} with {len(args)} arguments: {e}")
+
+
+def _wait_idle(pool: QuestionPool, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        with pool._lock:
+            if not pool._refilling:
+                return
+        assert time.monotonic() < deadline, "refill did not finish"
+        time.sleep(0.01)
+
+
+class FlakyGenerator:
+    """Question generator that fails until told to succeed, counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.succeed = False
+
+    def __call__(self, topic):
+        self.calls += 1
+        if not self.succeed:
+            raise RuntimeError("Bedrock unavailable")
+        return {"Question": f"{topic} {self.calls}"}
+
+
+def test_failed_refill_backs_off():
+    with tempfile.TemporaryDirectory() as directory:
+        generator = FlakyGenerator()
+        pool = QuestionPool(
+            {"Dialogue Practice": generator},
+            target_size=2,
+            pool_file=os.path.join(directory, "pool.json"),
+            retry_after=0.2,
+            max_retry_after=0.3
+        )
+        key = ("Dialogue Practice", "Shopping")
+
+        pool.ensure(*key)
+        _wait_idle(pool)
+        assert generator.calls == 1
+
+        # Cooling down: page reruns do not start another refill
+        pool.ensure(*key)
+        assert pool.take(*key) is None
+        _wait_idle(pool)
+        assert generator.calls == 1
+
+        time.sleep(0.25)
+        pool.ensure(*key)
+        _wait_idle(pool)
+        assert generator.calls == 2
+        assert pool._failures[key][0] == 2
+        assert pool._failures[key][1] - time.monotonic() <= 0.3  # capped at max_retry_after
+
+        time.sleep(0.35)
+        generator.succeed = True
+        pool.ensure(*key)
+        _wait_idle(pool)
+        assert pool.size(*key) == 2
+        assert key not in pool._failures
+
+
+def test_version_1_pool_keys_are_merged():
+    with tempfile.TemporaryDirectory() as directory:
+        pool_file = os.path.join(directory, "pool.json")
+        kept_audio = os.path.join(directory, "kept.mp3")
+        open(kept_audio, "wb").close()
+        with open(pool_file, "w", encoding="utf-8") as f:
+            json.dump({"pools": [
+                {"key": ["Dialogue Practice", "Shopping", "N5"], "entries": [
+                    {"question": {"Question": "a"}, "audio_file": kept_audio, "created_at": ""},
+                    {"question": {"Question": "b"}, "audio_file": os.path.join(directory, "gone.mp3"), "created_at": ""},
+                ]},
+                {"key": ["Dialogue Practice", "Shopping", "N4"], "entries": [
+                    {"question": {"Question": "c"}, "audio_file": None, "created_at": ""},
+                ]},
+            ]}, f)
+
+        pool = QuestionPool({"Dialogue Practice": lambda topic: None}, target_size=3, pool_file=pool_file)
+        assert pool.size("Dialogue Practice", "Shopping") == 3
+        first = pool.take("Dialogue Practice", "Shopping")
+        second = pool.take("Dialogue Practice", "Shopping")
+        assert first["audio_file"] == kept_audio
+        assert second["audio_file"] is None  # missing audio is dropped, the question kept
+        _wait_idle(pool)
+
+        with open(pool_file, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        assert saved["version"] == 2
+        assert saved["pools"] == [
+            {"key": ["Dialogue Practice", "Shopping"], "entries": [
+                {"question": {"Question": "c"}, "audio_file": None, "created_at": ""},
+            ]}
+        ]
+
+
+if __name__ == "__main__":
+    test_frontend_calls_match_pool_signatures()
+    test_failed_refill_backs_off()
+    test_version_1_pool_keys_are_merged()
+    print("All question pool tests passed")
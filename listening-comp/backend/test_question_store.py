@@ -0,0 +1,80 @@
+import json
+import sys
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.question_store import QuestionStore
+
+LEGACY_QUESTIONS = {
+    "20240101_120000": {
+        "question": {"Introduction": "駅で", "Conversation": "男：…", "Question": "どこですか。"},
+        "practice_type": "Dialogue Practice",
+        "topic": "Daily Conversation",
+        "created_at": "2024-01-01 12:00:00",
+        "audio_file": "frontend/static/audio/question_1.mp3",
+    },
+    "20240102_090000": {
+        "question": {"Situation": "友達に会った", "Question": "何と言いますか"},
+        "practice_type": "Phrase Matching",
+        "topic": "Greetings",
+        "created_at": "2024-01-02 09:00:00",
+        "audio_file": None,
+    },
+}
+
+
+def _write_legacy(path: str, questions: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(questions, f, ensure_ascii=False)
+
+
+def test_migrates_legacy_json_once():
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "questions.sqlite3")
+        json_path = os.path.join(directory, "stored_questions.json")
+        _write_legacy(json_path, LEGACY_QUESTIONS)
+
+        store = QuestionStore(db_path, legacy_json_path=json_path)
+        assert store.load_all() == LEGACY_QUESTIONS  # same ids, same entries, in created_at order
+        assert store.referenced_audio_files() == {"question_1.mp3"}
+        assert store.groups() == {"Dialogue Practice": {"Daily Conversation": 1}, "Phrase Matching": {"Greetings": 1}}
+
+        # Later JSON edits are not imported again; the database is the source of truth
+        _write_legacy(json_path, {**LEGACY_QUESTIONS, "20240103_000000": LEGACY_QUESTIONS["20240101_120000"]})
+        reopened = QuestionStore(db_path, legacy_json_path=json_path)
+        assert reopened.count() == 2
+
+
+def test_unreadable_json_is_retried():
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "questions.sqlite3")
+        json_path = os.path.join(directory, "stored_questions.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        assert QuestionStore(db_path, legacy_json_path=json_path).count() == 0
+        _write_legacy(json_path, LEGACY_QUESTIONS)
+        assert QuestionStore(db_path, legacy_json_path=json_path).count() == 2
+
+
+def test_concurrent_adds_are_all_kept():
+    with tempfile.TemporaryDirectory() as directory:
+        store = QuestionStore(os.path.join(directory, "questions.sqlite3"), legacy_json_path=None)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(
+                lambda i: store.add({"Question": f"問題{i}"}, "Dialogue Practice", "Shopping"),
+                range(40)
+            ))
+        assert len(set(ids)) == 40
+        assert store.count() == 40
+        page = store.list_questions("Dialogue Practice", "Shopping", limit=10, offset=10)
+        assert len(page) == 10
+
+
+if __name__ == "__main__":
+    test_migrates_legacy_json_once()
+    test_unreadable_json_is_retried()
+    test_concurrent_adds_are_all_kept()
+    print("All question store tests passed")
@@ -0,0 +1,56 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.script_builder import assign_sections, build_audio_plan, build_script
+
+PAUSES = {'long': 2000, 'short': 500, 'segment': 1000}
+
+# Introduction and question without the phrases announcers usually use
+test_question = {
+    "Introduction": "駅で男の人と女の人が話しています。",
+    "Conversation": """
+    男性: すみません、この電車は新宿駅に止まりますか。
+    女性: はい、次の駅が新宿です。
+    男性: ありがとうございます。何分くらいかかりますか。
+    女性: そうですね、5分くらいです。
+    """,
+    "Question": "新宿駅まで何分かかりますか。",
+    "Options": ["3分です。", "5分です。", "10分です。", "15分です。"]
+}
+
+
+def test_build_script_marks_sections():
+    parts = build_script(test_question)
+    assert [part[3] for part in parts] == [
+        'intro', 'conversation', 'conversation', 'conversation', 'conversation', 'question'
+    ]
+
+
+def test_audio_plan_pauses_for_built_script():
+    plan = build_audio_plan(build_script(test_question), PAUSES)
+    assert plan == [
+        ('part', 0), ('pause', 2000),
+        ('part', 1), ('pause', 500),
+        ('part', 2), ('pause', 500),
+        ('part', 3), ('pause', 500),
+        ('part', 4), ('pause', 2000),
+        ('part', 5),
+    ]
+
+
+def test_assign_sections_from_order():
+    parts = assign_sections([
+        ('Announcer', '駅で話しています。', 'male'),
+        ('Student', 'すみません。', 'female'),
+        ('Teacher', 'はい。', 'male'),
+        ('Announcer', '何分かかりますか。', 'male'),
+    ])
+    assert [part[3] for part in parts] == ['intro', 'conversation', 'conversation', 'question']
+
+
+if __name__ == "__main__":
+    test_build_script_marks_sections()
+    test_audio_plan_pauses_for_built_script()
+    test_assign_sections_from_order()
+    print("All script builder tests passed")
@@ -0,0 +1,103 @@
+import sys
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.transcript_cache import TranscriptCache
+
+SEGMENTS = [
+    {"text": "問題1", "start": 0.0, "duration": 1.5},
+    {"text": "男の人と女の人が話しています。", "start": 1.5, "duration": 3.0},
+]
+
+
+class BlockingFetcher:
+    """Fetcher that holds every call until released, counting calls"""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, video_id, language):
+        self.calls += 1
+        self.release.wait(timeout=5)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _fetch_concurrently(cache, fetcher, callers=6):
+    def call():
+        try:
+            return cache.get_or_fetch("abc123", "ja", fetcher=fetcher)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(call) for _ in range(callers)]
+        # Release the fetch only once every other caller is waiting on it
+        _wait_for(lambda: cache.stats()["coalesced"] == callers - 1)
+        fetcher.release.set()
+        return [future.result() for future in futures]
+
+
+def test_concurrent_misses_share_one_fetch():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TranscriptCache(directory)
+        fetcher = BlockingFetcher(result=SEGMENTS)
+        results = _fetch_concurrently(cache, fetcher)
+
+        assert fetcher.calls == 1
+        assert all(result == SEGMENTS for result in results)
+        assert cache.get_or_fetch("abc123", "ja", fetcher=fetcher) == SEGMENTS
+        assert fetcher.calls == 1
+        stats = cache.stats()
+        assert stats["fetches"] == 1 and stats["coalesced"] == 5 and stats["hits"] == 1
+
+
+def test_fetch_error_reaches_every_waiter_and_is_not_cached():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TranscriptCache(directory)
+        fetcher = BlockingFetcher(error=RuntimeError("transcripts disabled"))
+        results = _fetch_concurrently(cache, fetcher)
+
+        assert fetcher.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.stats()["errors"] == 1
+
+        # The failed flight is gone, so the next caller fetches again
+        retry = BlockingFetcher(result=SEGMENTS)
+        retry.release.set()
+        assert cache.get_or_fetch("abc123", "ja", fetcher=retry) == SEGMENTS
+        assert retry.calls == 1
+
+
+def test_expired_entries_are_fetched_again():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TranscriptCache(directory, ttl_seconds=0, use_msgpack=False)
+        cache.put("abc123", "ja", SEGMENTS)
+        time.sleep(0.01)
+        assert cache.get("abc123", "ja") is None
+        assert cache.stats()["expired"] == 1
+
+        fresh = TranscriptCache(directory, use_msgpack=False)
+        assert fresh.get("abc123", "ja") == SEGMENTS
+
+
+if __name__ == "__main__":
+    test_concurrent_misses_share_one_fetch()
+    test_fetch_error_reaches_every_waiter_and_is_not_cached()
+    test_expired_entries_are_fetched_again()
+    print("All transcript cache tests passed")
@@ -0,0 +1,77 @@
+import io
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.services.audio_generator import AudioGenerator
+from backend.services.tts_cache import TTSCache
+
+
+class StubPolly:
+    """Polly client returning fake MP3 bytes and counting requests"""
+
+    def __init__(self):
+        self.requests = []
+
+    def synthesize_speech(self, **kwargs):
+        self.requests.append(kwargs)
+        return {"AudioStream": io.BytesIO(f"{kwargs['VoiceId']}:{kwargs['Text']}".encode("utf-8"))}
+
+
+def _age(cache: TTSCache, key: str, seconds_ago: float):
+    timestamp = time.time() - seconds_ago
+    os.utime(cache.path_for(key), (timestamp, timestamp))
+
+
+def test_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TTSCache(directory, max_bytes=30, min_age_seconds=0)
+        for age, key in ((300, "a"), (200, "b"), (100, "c")):
+            cache.put(key, b"x" * 10)
+            _age(cache, key, age)
+
+        # Reading "a" makes it the most recently used entry
+        assert cache.read("a") == b"x" * 10
+        cache.put("d", b"x" * 10)
+
+        assert cache.get("b") is None
+        for key in ("a", "c", "d"):
+            assert cache.get(key) is not None
+
+
+def test_recent_entries_are_not_evicted():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TTSCache(directory, max_bytes=15, min_age_seconds=60)
+        cache.put("a", b"x" * 10)
+        cache.put("b", b"x" * 10)
+        # Over budget, but both segments may still be in use by a running job
+        assert cache.get("a") is not None and cache.get("b") is not None
+
+
+def test_generator_reuses_cached_segments():
+    with tempfile.TemporaryDirectory() as directory:
+        polly = StubPolly()
+        generator = AudioGenerator(
+            audio_dir=os.path.join(directory, "audio"),
+            script_cache_dir=os.path.join(directory, "scripts"),
+            polly_client=polly,
+            gateway=object()
+        )
+        first = generator.synthesize_part_bytes("こんにちは", "Kazuha")
+        second = generator.synthesize_part_bytes("こんにちは", "Kazuha")
+        other_voice = generator.synthesize_part_bytes("こんにちは", "Takumi")
+
+        assert first == second == "Kazuha:こんにちは".encode("utf-8")
+        assert other_voice == "Takumi:こんにちは".encode("utf-8")
+        assert len(polly.requests) == 2
+        stats = generator.tts_cache.stats()
+        assert stats["hits"] == 1 and stats["characters_saved"] == len("こんにちは")
+
+
+if __name__ == "__main__":
+    test_evicts_least_recently_used()
+    test_recent_entries_are_not_evicted()
+    test_generator_reuses_cached_segments()
+    print("All TTS cache tests passed")
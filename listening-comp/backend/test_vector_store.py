@@ -0,0 +1,100 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chromadb.utils import embedding_functions
+from backend.services.vector_store import QuestionVectorStore
+
+# Offline embeddings: each document maps to the vector of the first marker it contains
+MARKER_VECTORS = {
+    "TRAIN": [1.0, 0.0, 0.0],
+    "TRAINLIKE": [0.99, 0.1, 0.0],  # within the l2 near-duplicate threshold of TRAIN
+    "SHOP": [0.0, 1.0, 0.0],
+    "WEATHER": [0.0, 0.0, 1.0],
+}
+
+
+class StubEmbeddingFunction(embedding_functions.EmbeddingFunction):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, input):
+        self.calls += 1
+        vectors = []
+        for text in input:
+            marker = max((m for m in MARKER_VECTORS if m in text), key=len)
+            vectors.append(MARKER_VECTORS[marker])
+        return vectors
+
+
+def question(marker: str, text: str = "") -> dict:
+    return {
+        "Introduction": f"{marker} {text}",
+        "Conversation": "男：すみません。女：はい。",
+        "Question": "男の人はどうしますか。",
+    }
+
+
+def make_store(directory: str) -> QuestionVectorStore:
+    return QuestionVectorStore(persist_directory=directory, embedding_fn=StubEmbeddingFunction(), gateway=object())
+
+
+def stored_metadata(store: QuestionVectorStore, entry_id: str) -> dict:
+    return store.collections["section2"].get(ids=[entry_id], include=["metadatas"])["metadatas"][0]
+
+
+def test_exact_duplicates_are_linked_without_embedding():
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        stats = store.add_questions(2, [question("TRAIN"), question("SHOP"), question("TRAIN")], "v1")
+        assert stats == {"added": 2, "updated": 0, "exact_duplicates": 1, "near_duplicates": 0}
+
+        calls = store.embedding_fn.calls
+        stats = store.add_questions(2, [question("TRAIN")], "v2")
+        assert stats == {"added": 0, "updated": 0, "exact_duplicates": 1, "near_duplicates": 0}
+        assert store.embedding_fn.calls == calls  # hash match, nothing embedded
+
+        assert store.collections["section2"].count() == 2
+        canonical = stored_metadata(store, "v1_2_0")
+        assert canonical["duplicate_count"] == 2
+        assert "v2_2_0" in canonical["duplicates"]
+
+
+def test_near_duplicates_are_linked():
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        store.add_questions(2, [question("TRAIN")], "v1")
+        stats = store.add_questions(2, [question("TRAINLIKE"), question("WEATHER")], "v2")
+        assert stats == {"added": 1, "updated": 0, "exact_duplicates": 0, "near_duplicates": 1}
+        assert store.collections["section2"].count() == 2
+        assert stored_metadata(store, "v1_2_0")["duplicate_count"] == 1
+
+
+def test_edited_entry_is_updated_in_place():
+    with tempfile.TemporaryDirectory() as directory:
+        store = make_store(directory)
+        store.add_questions(2, [question("TRAIN")], "v1")
+        store.add_questions(2, [question("TRAIN")], "v2")
+
+        # Same id, edited text still close to its stored version: not a duplicate of itself
+        stats = store.add_questions(2, [question("TRAIN", "駅で")], "v1")
+        assert stats == {"added": 0, "updated": 1, "exact_duplicates": 0, "near_duplicates": 0}
+
+        collection = store.collections["section2"]
+        assert collection.count() == 1
+        stored = collection.get(ids=["v1_2_0"], include=["documents", "metadatas"])
+        assert "駅で" in stored["documents"][0]
+        assert stored["metadatas"][0]["duplicate_count"] == 1
+        assert "v2_2_0" in stored["metadatas"][0]["duplicates"]
+
+        # Re-ingesting the unchanged entry is a no-op
+        stats = store.add_questions(2, [question("TRAIN", "駅で")], "v1")
+        assert stats == {"added": 0, "updated": 0, "exact_duplicates": 0, "near_duplicates": 0}
+
+
+if __name__ == "__main__":
+    test_exact_duplicates_are_linked_without_embedding()
+    test_near_duplicates_are_linked()
+    test_edited_entry_is_updated_in_place()
+    print("All vector store tests passed")
@@ -0,0 +1,28 @@
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Any
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for content comparison
+
+    Applies NFKC (full-width/half-width and compatibility forms), lower-cases
+    latin characters and collapses all whitespace.
+    """
+    text = unicodedata.normalize("NFKC", text or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the normalized text"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def stable_hash(obj: Any) -> str:
+    """SHA-256 of a JSON-serializable object, independent of dict ordering"""
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
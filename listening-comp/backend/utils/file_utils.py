@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+
+def atomic_write_bytes(path: str, data: bytes):
+    """Write data to path atomically
+
+    The data goes to a temporary file in the same directory which is then
+    renamed over the target, so readers never see a partially written file
+    and concurrent writers of the same content cannot corrupt it.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
@@ -0,0 +1,29 @@
+import math
+import os
+import resource
+import sys
+from typing import Iterable
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def current_rss_mb() -> float:
+    """Current resident set size of this process in MB
+
+    Reads /proc on Linux and falls back to the peak RSS elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and KB elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
@@ -1,5 +1,5 @@
-from youtube_transcript_api import YouTubeTranscriptApi
 import os
+from backend.services.transcript_cache import cached_transcript
 from backend.utils.logger import Logger
 
 class YouTubeTranscriptDownloader:
@@ -10,7 +10,7 @@ class YouTubeTranscriptDownloader:
         """Get transcript for a YouTube video"""
         try:
             self.logger.info(f"Attempting to get transcript for video: {video_id}")
-            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['ja'])
+            transcript = cached_transcript(video_id, 'ja')
             self.logger.debug(f"Successfully retrieved transcript with {len(transcript)} segments")
             return transcript
         except Exception as e:
@@ -5,6 +5,9 @@ import streamlit as st
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from backend.services.audio_stream_server import get_stream_server
+from backend.services.audio_transcoder import AUDIO_PROFILES, DEFAULT_PROFILE
+
 class AudioManager:
     def __init__(self):
         pass
@@ -14,42 +17,61 @@ class AudioManager:
         st.markdown("---")
         st.subheader("🎧 Audio Practice")
         
+        profile = st.selectbox(
+            "Audio format",
+            list(AUDIO_PROFILES),
+            index=list(AUDIO_PROFILES).index(DEFAULT_PROFILE),
+            format_func=lambda name: AUDIO_PROFILES[name]["label"],
+            key="audio_profile"
+        )
+        
         col1, col2 = st.columns([3, 1])
         
         with col1:
             # Display current audio if available
             if st.session_state.current_audio and os.path.exists(st.session_state.current_audio):
-                st.audio(st.session_state.current_audio)
+                self.play_audio(audio_generator, st.session_state.current_audio, profile)
+            
+            stream_audio = st.toggle("Start playback while generating", value=True)
             
             # Generate new audio button
             if st.button("Generate New Audio"):
-                with st.spinner("Generating audio..."):
-                    try:
-                        # Use transcript-based audio generation if source segments exist
-                        if "source_segments" in current_question:
-                            audio_file = audio_generator.generate_audio_from_transcript(current_question)
-                        else:
-                            audio_file = audio_generator.generate_audio(current_question)
+                if stream_audio:
+                    self.stream_new_audio(
+                        audio_generator,
+                        current_question,
+                        current_practice_type,
+                        current_topic,
+                        save_question
+                    )
+                else:
+                    with st.spinner("Generating audio..."):
+                        try:
+                            # Use transcript-based audio generation if source segments exist
+                            if "source_segments" in current_question:
+                                audio_file = audio_generator.generate_audio_from_transcript(current_question)
+                            else:
+                                audio_file = audio_generator.generate_audio(current_question)
                         
-                        # Verify the audio file exists
-                        if not os.path.exists(audio_file):
-                            raise Exception("Audio file was not created")
+                            # Verify the audio file exists
+                            if not os.path.exists(audio_file):
+                                raise Exception("Audio file was not created")
                             
-                        st.session_state.current_audio = audio_file
+                            st.session_state.current_audio = audio_file
                         
-                        # Update stored question with audio file
-                        save_question(
-                            current_question,
-                            current_practice_type,
-                            current_topic,
-                            audio_file
-                        )
+                            # Update stored question with audio file
+                            save_question(
+                                current_question,
+                                current_practice_type,
+                                current_topic,
+                                audio_file
+                            )
                         
-                        st.success("New audio generated!")
-                        st.experimental_rerun()
+                            st.success("New audio generated!")
+                            st.experimental_rerun()
                         
-                    except Exception as e:
-                        st.error(f"Failed to generate audio: {str(e)}")
+                        except Exception as e:
+                            st.error(f"Failed to generate audio: {str(e)}")
         
         with col2:
             if "source_segments" in current_question:
@@ -61,4 +83,38 @@ class AudioManager:
                             st.session_state.current_audio = audio_file
                             st.experimental_rerun()
                         except Exception as e:
-                            st.error(f"Failed to regenerate audio: {str(e)}")
\ No newline at end of file
+                            st.error(f"Failed to regenerate audio: {str(e)}")
+
+    def play_audio(self, audio_generator, audio_file, profile):
+        """Play audio in the selected profile, falling back to the original MP3"""
+        try:
+            path, mime = audio_generator.audio_for_profile(audio_file, profile)
+        except Exception as e:
+            st.warning(f"Could not convert audio to {AUDIO_PROFILES[profile]['label']}: {str(e)}")
+            path, mime = audio_file, AUDIO_PROFILES[DEFAULT_PROFILE]["mime"]
+        st.audio(path, format=mime)
+        if path != audio_file:
+            size, original = os.path.getsize(path), os.path.getsize(audio_file)
+            st.caption(f"{size / 1024:.0f} KB ({size / original:.0%} of the standard MP3)")
+
+    def stream_new_audio(self, audio_generator, current_question, current_practice_type, current_topic, save_question):
+        """Start playback while audio is generated, then persist and save it"""
+        try:
+            server = get_stream_server()
+            job = server.submit(audio_generator.generate_audio_stream(current_question))
+            st.audio(server.url_for(job), format="audio/mpeg")
+            
+            with st.spinner("Finishing audio..."):
+                audio_file = job.wait()
+            st.session_state.current_audio = audio_file
+            
+            # Update stored question with the persisted audio file
+            save_question(
+                current_question,
+                current_practice_type,
+                current_topic,
+                audio_file
+            )
+            st.success("New audio generated!")
+        except Exception as e:
+            st.error(f"Failed to generate audio: {str(e)}")
@@ -3,6 +3,8 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend.services.bedrock_gateway import THROTTLED_MESSAGE, BedrockThrottledError
+from frontend.resources import get_question_pool
 
 
 class PracticeControls:
@@ -43,18 +45,58 @@ class PracticeControls:
         )
         topic = topics[practice_type][topic_display]
 
+        # Keep questions for the selected topic ready in the background
+        question_pool = get_question_pool()
+        question_pool.ensure(practice_type, topic)
+
         if st.button("Generate New Question"):
-            section_num = 2 if practice_type == "Dialogue Practice" else 3
-            new_question = (
-                st.session_state.question_generator.generate_similar_question(
-                    section_num, topic
-                )
-            )
+            pooled = question_pool.take(practice_type, topic)
+            if pooled:
+                new_question = pooled["question"]
+                audio_file = pooled["audio_file"]
+            else:
+                section_num = 2 if practice_type == "Dialogue Practice" else 3
+                new_question = self.stream_question(section_num, topic)
+                audio_file = None
+                if not new_question:
+                    return
             st.session_state.current_question = new_question
             st.session_state.current_practice_type = practice_type
             st.session_state.current_topic = topic
             st.session_state.feedback = None
 
             # Save the generated question
-            self.question_manager.save_question(new_question, practice_type, topic)
-            st.session_state.current_audio = None
+            self.question_manager.save_question(new_question, practice_type, topic, audio_file)
+            st.session_state.current_audio = audio_file
+
+    def stream_question(self, section_num, topic):
+        """Generate a question, showing each part as the model writes it"""
+        placeholder = st.empty()
+        new_question = None
+        try:
+            for partial, complete in st.session_state.question_generator.generate_similar_question_stream(
+                section_num, topic
+            ):
+                if complete:
+                    new_question = partial
+                else:
+                    placeholder.markdown(self.format_partial_question(partial))
+        except BedrockThrottledError:
+            placeholder.empty()
+            st.warning(THROTTLED_MESSAGE)
+            return None
+        placeholder.empty()
+        if new_question is None:
+            st.error("Failed to generate a question. Please try again.")
+        return new_question
+
+    @staticmethod
+    def format_partial_question(question):
+        """Markdown for a question that is still being generated"""
+        lines = []
+        for key in ("Introduction", "Conversation", "Situation", "Question"):
+            if question.get(key):
+                lines.append(f"**{key}:** {question[key]}")
+        for i, option in enumerate(question.get("Options", []), 1):
+            lines.append(f"{i}. {option}")
+        return "\n\n".join(lines) + " ▌"
@@ -1,5 +1,6 @@
 import streamlit as st
 from .audio_manager import AudioManager
+from backend.services.bedrock_gateway import THROTTLED_MESSAGE, BedrockThrottledError
 
 
 class QuestionContent:
@@ -83,9 +84,13 @@ class QuestionContent:
             if selected and st.button("Submit Answer"):
                 selected_index = options.index(selected) + 1
                 st.session_state.selected_answer = selected_index
-                st.session_state.feedback = (
-                    st.session_state.question_generator.get_feedback(
-                        st.session_state.current_question, selected_index
+                try:
+                    st.session_state.feedback = (
+                        st.session_state.question_generator.get_feedback(
+                            st.session_state.current_question, selected_index
+                        )
                     )
-                )
-                st.rerun()
+                except BedrockThrottledError:
+                    st.warning(THROTTLED_MESSAGE)
+                else:
+                    st.rerun()
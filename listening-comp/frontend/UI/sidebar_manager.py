@@ -6,6 +6,9 @@ from backend.get_transcript import get_transcript
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Saved questions shown per topic before "Show more"
+PAGE_SIZE = 10
+
 
 class SidebarManager:
     def __init__(self, question_manager):
@@ -16,30 +19,16 @@ class SidebarManager:
 
     def render(self):
         """Render the sidebar with saved questions grouped by practice type and topic"""
-        stored_questions = self.question_manager.load_stored_questions()
+        grouped_questions = self.question_manager.get_question_groups()
 
         with st.sidebar:
             st.header("📚 Saved Questions")
-            if not stored_questions:
+            if not grouped_questions:
                 st.info(
                     "No saved questions yet. Generate some questions to see them here!"
                 )
                 return
 
-            # Group questions by practice type and topic
-            grouped_questions = {}
-            for qid, qdata in stored_questions.items():
-                practice_type = qdata["practice_type"]
-                topic = qdata["topic"]
-
-                if practice_type not in grouped_questions:
-                    grouped_questions[practice_type] = {}
-
-                if topic not in grouped_questions[practice_type]:
-                    grouped_questions[practice_type][topic] = []
-
-                grouped_questions[practice_type][topic].append((qid, qdata))
-
             # Add custom CSS for bigger emojis and spacing
             st.markdown(
                 """
@@ -152,33 +141,35 @@ class SidebarManager:
                     else:
                         # Practice type tab content
                         topics = grouped_questions[tab_type]
-                        for topic, questions in topics.items():
+                        for topic, question_count in topics.items():
                             topic_emoji = topic_emojis.get(topic, "📌")
-                            with st.expander(f"{topic_emoji} {topic}"):
-                                for qid, qdata in sorted(
-                                    questions,
-                                    key=lambda x: x[1]["created_at"],
-                                    reverse=True,
-                                ):
-                                    created_at = qdata["created_at"]
-                                    date_str = "-".join(
-                                        created_at.split()[0].split("-")[1:]
-                                    )
-                                    time_str = created_at.split()[1].split(".")[
-                                        0
-                                    ]  # Remove microseconds
-                                    button_label = f"⏰ {date_str} {time_str}"
-
-                                    if st.button(button_label, key=f"question_{qid}"):
-                                        st.session_state.current_question = qdata[
-                                            "question"
-                                        ]
-                                        st.session_state.current_practice_type = qdata[
-                                            "practice_type"
-                                        ]
-                                        st.session_state.current_topic = qdata["topic"]
-                                        st.session_state.current_audio = qdata.get(
-                                            "audio_file"
-                                        )
-                                        st.session_state.feedback = None
-                                        st.rerun()
+                            with st.expander(f"{topic_emoji} {topic} ({question_count})"):
+                                self.render_topic_questions(tab_type, topic, question_count)
+
+    def render_topic_questions(self, practice_type, topic, question_count):
+        """List a topic's saved questions, newest first, one page at a time"""
+        limit_key = f"sidebar_limit_{practice_type}_{topic}"
+        limit = st.session_state.get(limit_key, PAGE_SIZE)
+        questions = self.question_manager.list_questions(practice_type, topic, limit=limit)
+
+        for qid, qdata in questions:
+            created_at = qdata["created_at"]
+            date_str = "-".join(created_at.split()[0].split("-")[1:])
+            time_str = created_at.split()[1].split(".")[0]  # Remove microseconds
+            button_label = f"⏰ {date_str} {time_str}"
+
+            if st.button(button_label, key=f"question_{qid}"):
+                st.session_state.current_question = qdata["question"]
+                st.session_state.current_practice_type = qdata["practice_type"]
+                st.session_state.current_topic = qdata["topic"]
+                st.session_state.current_audio = qdata.get("audio_file")
+                st.session_state.feedback = None
+                st.rerun()
+
+        if question_count > limit:
+            if st.button(
+                f"Show more ({question_count - limit} older)",
+                key=f"more_{practice_type}_{topic}",
+            ):
+                st.session_state[limit_key] = limit + PAGE_SIZE
+                st.rerun()
@@ -3,16 +3,16 @@ from random import choice
 import asyncio
 import os
 import random
-from backend.services.youtube_service import YouTubeService
 from backend.utils.transcript_downloader import (
     YouTubeTranscriptDownloader as TranscriptDownloader,
 )
 from backend.utils.logger import Logger
+from frontend.resources import get_youtube_service
 
 
 class YouTubeTestsTab:
     def __init__(self):
-        self.youtube_service = YouTubeService()
+        self.youtube_service = get_youtube_service()
         self.transcript_downloader = TranscriptDownloader()
         self.logger = Logger().get_logger()
 
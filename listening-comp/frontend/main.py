@@ -2,18 +2,25 @@ import os
 import sys
 import streamlit as st
 import asyncio
+import time
 from functools import partial
 
 # Add backend to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.services.vector_store import QuestionVectorStore
-from backend.services.audio_generator import AudioGenerator
+from backend.utils.metrics import current_rss_mb
+from frontend.resources import (
+    get_audio_generator,
+    get_question_pool,
+    get_question_store,
+    get_vector_store,
+    get_youtube_service,
+    log_session_startup,
+)
 from frontend.UI.question_content import QuestionContent
 from frontend.UI.practice_controls import PracticeControls
 from frontend.UI.audio_manager import AudioManager
 from frontend.question_manager import QuestionManager
-from backend.services.youtube_service import YouTubeService
 from backend.utils.directory_manager import DirectoryManager
 from backend.utils.logger import Logger
 
@@ -25,6 +32,9 @@ class JLPTListeningApp:
 
     def initialize_session_state(self):
         """Initialize session state variables"""
+        new_session = 'audio_generator' not in st.session_state
+        if new_session:
+            start, rss_before = time.perf_counter(), current_rss_mb()
         if 'current_question' not in st.session_state:
             st.session_state.current_question = None
         if 'current_audio' not in st.session_state:
@@ -34,19 +44,21 @@ class JLPTListeningApp:
         if 'current_topic' not in st.session_state:
             st.session_state.current_topic = "Daily Life"
         if 'audio_generator' not in st.session_state:
-            st.session_state.audio_generator = AudioGenerator()
+            st.session_state.audio_generator = get_audio_generator()
         if 'vector_store' not in st.session_state:
-            st.session_state.vector_store = QuestionVectorStore()
+            st.session_state.vector_store = get_vector_store()
         if 'youtube_service' not in st.session_state:
-            st.session_state.youtube_service = YouTubeService()
+            st.session_state.youtube_service = get_youtube_service()
         if 'youtube_url' not in st.session_state:
             st.session_state.youtube_url = ""
         if 'jlpt_level' not in st.session_state:
             st.session_state.jlpt_level = "N5"
+        if new_session:
+            log_session_startup(start, rss_before)
 
     def setup_ui_components(self):
         """Setup UI components"""
-        self.question_manager = QuestionManager()
+        self.question_manager = QuestionManager(get_question_store())
         self.practice_controls = PracticeControls(self.question_manager)
         self.question_content = QuestionContent(self.question_manager)
         self.audio_manager = AudioManager()
@@ -100,13 +112,21 @@ class JLPTListeningApp:
             # Topic selection
             topics = ["Daily Life", "Shopping", "Travel", "Work", "Study", "Health", "Entertainment"]
             selected_topic = st.selectbox("Select Topic", topics, key="current_topic")
+            get_question_pool().ensure("Transcript Dialogue", selected_topic)
             
             # Question generation
             if st.button("Generate Question from Transcripts"):
                 with st.spinner("Generating question..."):
                     try:
-                        question = st.session_state.vector_store.generate_question_from_transcript(selected_topic)
-                        audio_file = st.session_state.audio_generator.generate_audio_from_transcript(question)
+                        # Served from the pre-generated pool when one is ready
+                        pooled = get_question_pool().take("Transcript Dialogue", selected_topic)
+                        if pooled:
+                            question, audio_file = pooled["question"], pooled["audio_file"]
+                        else:
+                            question = st.session_state.vector_store.generate_question_from_transcript(selected_topic)
+                            audio_file = None
+                        if not audio_file:
+                            audio_file = st.session_state.audio_generator.generate_audio_from_transcript(question)
                         
                         st.session_state.current_question = question
                         st.session_state.current_audio = audio_file
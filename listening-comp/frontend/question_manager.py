@@ -1,45 +1,22 @@
-import os
-import json
-from datetime import datetime
+from backend.services.question_store import QuestionStore
 
 
 class QuestionManager:
-    def __init__(self):
-        self.questions_file = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "backend/data/stored_questions.json",
-        )
+    def __init__(self, store=None):
+        self.store = store or QuestionStore()
 
     def load_stored_questions(self):
-        """Load previously stored questions from JSON file"""
-        if os.path.exists(self.questions_file):
-            with open(self.questions_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+        """Load all previously stored questions"""
+        return self.store.load_all()
 
-    def save_question(self, question, practice_type, topic, audio_file=None):
-        """Save a generated question to JSON file"""
-        # Load existing questions
-        stored_questions = self.load_stored_questions()
-
-        # Create a unique ID for the question using timestamp
-        question_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        # Add metadata
-        question_data = {
-            "question": question,
-            "practice_type": practice_type,
-            "topic": topic,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "audio_file": audio_file,
-        }
+    def get_question_groups(self):
+        """Question counts grouped by practice type and topic"""
+        return self.store.groups()
 
-        # Add to stored questions
-        stored_questions[question_id] = question_data
+    def list_questions(self, practice_type, topic, limit=20, offset=0):
+        """Page of stored (id, question data) pairs for a topic, newest first"""
+        return self.store.list_questions(practice_type, topic, limit, offset)
 
-        # Save back to file
-        os.makedirs(os.path.dirname(self.questions_file), exist_ok=True)
-        with open(self.questions_file, "w", encoding="utf-8") as f:
-            json.dump(stored_questions, f, ensure_ascii=False, indent=2)
-
-        return question_id
+    def save_question(self, question, practice_type, topic, audio_file=None):
+        """Save a generated question to the question store"""
+        return self.store.add(question, practice_type, topic, audio_file)
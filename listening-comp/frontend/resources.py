@@ -0,0 +1,89 @@
+"""Process-wide shared resources for the Streamlit app
+
+Streamlit runs every browser session in its own script thread, so anything
+stored in st.session_state is built once per learner. The clients below are
+expensive (boto3 clients, a Chroma PersistentClient on the shared persist
+directory) and safe to share, so they are built once per process with
+st.cache_resource, which also serializes concurrent first calls.
+"""
+import time
+import streamlit as st
+from backend.question_generator import QuestionGenerator
+from backend.services.audio_generator import AudioGenerator
+from backend.services.question_pool import QuestionPool
+from backend.services.question_store import QuestionStore
+from backend.services.vector_store import QuestionVectorStore
+from backend.services.youtube_service import YouTubeService
+from backend.utils.logger import Logger
+from backend.utils.metrics import current_rss_mb
+
+
+def _timed_build(name, builder):
+    """Build a resource, logging how long it took and how much RSS it added"""
+    logger = Logger().get_logger()
+    rss_before = current_rss_mb()
+    start = time.perf_counter()
+    resource = builder()
+    logger.info(
+        f"Built shared {name} in {time.perf_counter() - start:.3f}s "
+        f"(RSS +{current_rss_mb() - rss_before:.1f}MB)"
+    )
+    return resource
+
+
+@st.cache_resource(show_spinner=False)
+def get_audio_generator() -> AudioGenerator:
+    # Audio GC checks references through the shared question store
+    question_store = get_question_store()
+    return _timed_build("AudioGenerator", lambda: AudioGenerator(question_store=question_store))
+
+
+@st.cache_resource(show_spinner=False)
+def get_vector_store() -> QuestionVectorStore:
+    return _timed_build("QuestionVectorStore", QuestionVectorStore)
+
+
+@st.cache_resource(show_spinner=False)
+def get_youtube_service() -> YouTubeService:
+    return _timed_build("YouTubeService", YouTubeService)
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_store() -> QuestionStore:
+    return _timed_build("QuestionStore", QuestionStore)
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_generator() -> QuestionGenerator:
+    # Reuses the shared vector store instead of opening a second Chroma client
+    return _timed_build("QuestionGenerator", lambda: QuestionGenerator(vector_store=get_vector_store()))
+
+
+@st.cache_resource(show_spinner=False)
+def get_question_pool() -> QuestionPool:
+    # Resolve the shared clients here, in the script thread; the pool's
+    # background workers only use the captured objects
+    question_generator = get_question_generator()
+    vector_store = get_vector_store()
+    audio_generator = get_audio_generator()
+
+    def render_audio(question):
+        if "source_segments" in question:
+            return audio_generator.generate_audio_from_transcript(question)
+        return audio_generator.generate_audio(question)
+
+    # Section numbers match PracticeControls: dialogues are section 2, phrases section 3
+    generators = {
+        "Dialogue Practice": lambda topic: question_generator.generate_similar_question(2, topic),
+        "Phrase Matching": lambda topic: question_generator.generate_similar_question(3, topic),
+        "Transcript Dialogue": lambda topic: vector_store.generate_question_from_transcript(topic),
+    }
+    return _timed_build("QuestionPool", lambda: QuestionPool(generators, render_audio=render_audio))
+
+
+def log_session_startup(start: float, rss_before: float):
+    """Log the time and memory a new browser session took to initialize"""
+    Logger().get_logger().info(
+        f"Session initialized in {time.perf_counter() - start:.3f}s "
+        f"(RSS {current_rss_mb():.1f}MB, +{current_rss_mb() - rss_before:.1f}MB)"
+    )
@@ -8,15 +8,18 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from backend.question_generator import QuestionGenerator
-from backend.audio_generator import AudioGenerator
-from backend.services.youtube_service import YouTubeService
+from frontend.resources import (
+    get_audio_generator,
+    get_question_generator,
+    get_question_store,
+    get_youtube_service,
+)
 
 
 class UIManager:
     def __init__(self):
         self.initialize_session_state()
-        self.question_manager = QuestionManager()
+        self.question_manager = QuestionManager(get_question_store())
         self.audio_manager = AudioManager()
         self.sidebar_manager = SidebarManager(self.question_manager)
         self.question_content = QuestionContent(self.question_manager)
@@ -25,11 +28,11 @@ class UIManager:
     def initialize_session_state(self):
         """Initialize all required session state variables"""
         if "question_generator" not in st.session_state:
-            st.session_state.question_generator = QuestionGenerator()
+            st.session_state.question_generator = get_question_generator()
         if "audio_generator" not in st.session_state:
-            st.session_state.audio_generator = AudioGenerator()
+            st.session_state.audio_generator = get_audio_generator()
         if "youtube_service" not in st.session_state:
-            st.session_state.youtube_service = YouTubeService()
+            st.session_state.youtube_service = get_youtube_service()
         if "current_question" not in st.session_state:
             st.session_state.current_question = None
         if "feedback" not in st.session_state:
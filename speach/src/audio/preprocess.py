@@ -0,0 +1,254 @@
+"""
+Audio preprocessing: normalization of recorded/uploaded audio and
+preparation for upload to the transcription service.
+"""
+
+import io
+import subprocess
+from pydub import AudioSegment
+from pydub.silence import detect_nonsilent, detect_silence
+from pydub.utils import mediainfo
+from ..utils.logger import get_logger
+from ..utils.config import (
+    VAD_SILENCE_OFFSET_DB,
+    VAD_MAX_PAUSE_MS,
+    VAD_PADDING_MS,
+    VAD_JOIN_PAUSE_MS,
+    UPLOAD_AUDIO_FORMAT,
+    UPLOAD_OPUS_BITRATE,
+    CHUNK_MAX_S,
+    CHUNK_MIN_SILENCE_MS,
+)
+
+logger = get_logger("audio.preprocess")
+
+# ffmpeg output arguments per upload format (both are accepted by Whisper)
+ENCODER_ARGS = {
+    "flac": ["-c:a", "flac", "-f", "flac"],
+    "ogg": ["-c:a", "libopus", "-b:a", UPLOAD_OPUS_BITRATE, "-f", "ogg"],
+}
+
+
+def normalize_audio(source, format_hint=None, sample_rate=16000, channels=1):
+    """
+    Decode audio and convert it to WAV at the rate Whisper works best with,
+    entirely in memory.
+
+    Args:
+        source (bytes or file-like): Encoded audio (e.g. an st.audio_input or
+            st.file_uploader value, which are BytesIO objects)
+        format_hint (str, optional): Container format such as "mp3" or "m4a",
+            if known; otherwise ffmpeg detects it
+        sample_rate (int): Output sample rate
+        channels (int): Output channel count
+
+    Returns:
+        io.BytesIO: WAV data, positioned at the start
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    source.seek(0)
+
+    audio = AudioSegment.from_file(source, format=format_hint)
+    logger.debug(
+        f"Audio decoded: {audio.duration_seconds}s, {audio.channels} channels, {audio.frame_rate}Hz"
+    )
+    audio = audio.set_frame_rate(sample_rate).set_channels(channels)
+
+    buffer = io.BytesIO()
+    audio.export(buffer, format="wav")
+    buffer.seek(0)
+    return buffer
+
+
+def trim_silence(
+    audio,
+    silence_offset_db=VAD_SILENCE_OFFSET_DB,
+    max_pause_ms=VAD_MAX_PAUSE_MS,
+    padding_ms=VAD_PADDING_MS,
+    join_pause_ms=VAD_JOIN_PAUSE_MS,
+):
+    """
+    Remove leading/trailing silence and shorten long pauses.
+
+    Speech is found with an energy threshold relative to the clip's average
+    loudness. Silence shorter than max_pause_ms is kept as is, so natural
+    pauses within a sentence are not touched.
+
+    Args:
+        audio (AudioSegment): Audio to trim
+        silence_offset_db (float): Threshold below the average loudness counted as silence
+        max_pause_ms (int): Shortest pause that is shortened
+        padding_ms (int): Audio kept before and after each speech region
+        join_pause_ms (int): Pause inserted between speech regions
+
+    Returns:
+        AudioSegment: Trimmed audio, or the input if no speech was detected
+    """
+    if audio.dBFS == float("-inf"):
+        logger.warning("Audio is completely silent, skipping trimming")
+        return audio
+
+    regions = detect_nonsilent(
+        audio,
+        min_silence_len=max_pause_ms,
+        silence_thresh=audio.dBFS + silence_offset_db,
+        seek_step=10,
+    )
+    if not regions:
+        logger.warning("No speech detected, skipping trimming")
+        return audio
+
+    trimmed = AudioSegment.empty()
+    for index, (start, end) in enumerate(regions):
+        if index:
+            trimmed += AudioSegment.silent(duration=join_pause_ms, frame_rate=audio.frame_rate)
+        trimmed += audio[max(0, start - padding_ms):min(len(audio), end + padding_ms)]
+    return trimmed
+
+
+def encode_audio(audio, upload_format):
+    """
+    Encode audio with ffmpeg through pipes, without temporary files.
+
+    Args:
+        audio (AudioSegment): Audio to encode
+        upload_format (str): "flac" or "ogg" (Opus)
+
+    Returns:
+        bytes: Encoded audio
+    """
+    wav = io.BytesIO()
+    audio.export(wav, format="wav")
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "wav", "-i", "pipe:0",
+         *ENCODER_ARGS[upload_format], "pipe:1"],
+        input=wav.getvalue(),
+        capture_output=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def prepare_for_upload(audio_file_path, upload_format=UPLOAD_AUDIO_FORMAT, trim=True):
+    """
+    Trim silence and encode audio compactly for upload, in memory.
+
+    Args:
+        audio_file_path (str): Path to the recorded audio (any format pydub reads)
+        upload_format (str): "flac" or "ogg" (Opus)
+        trim (bool): Whether to remove silence before encoding
+
+    Returns:
+        dict: Encoded "data" and its "format", plus original/processed
+            sizes and durations
+    """
+    if upload_format not in ENCODER_ARGS:
+        raise ValueError(f"Unsupported upload format: {upload_format}")
+
+    with open(audio_file_path, "rb") as f:
+        original = f.read()
+    audio = AudioSegment.from_file(io.BytesIO(original))
+    original_ms = len(audio)
+    if trim:
+        audio = trim_silence(audio)
+    data = encode_audio(audio, upload_format)
+
+    result = {
+        "data": data,
+        "format": upload_format,
+        "original_bytes": len(original),
+        "upload_bytes": len(data),
+        "original_ms": original_ms,
+        "upload_ms": len(audio),
+    }
+    logger.info(
+        f"Prepared upload: {result['original_bytes']} -> {result['upload_bytes']} bytes, "
+        f"{original_ms / 1000:.1f}s -> {len(audio) / 1000:.1f}s of audio ({upload_format})"
+    )
+    return result
+
+
+def audio_duration_seconds(audio_file_path):
+    """
+    Read an audio file's duration with ffprobe, without decoding it.
+
+    Args:
+        audio_file_path (str): Path to the audio file
+
+    Returns:
+        float: Duration in seconds, or 0.0 if ffprobe does not report one
+    """
+    return float(mediainfo(audio_file_path).get("duration") or 0.0)
+
+
+def find_chunk_boundaries(
+    audio,
+    max_chunk_ms=CHUNK_MAX_S * 1000,
+    min_silence_ms=CHUNK_MIN_SILENCE_MS,
+    silence_offset_db=VAD_SILENCE_OFFSET_DB,
+):
+    """
+    Split audio into chunks no longer than max_chunk_ms, cutting in pauses.
+
+    Each chunk ends in the middle of the last pause before the length limit,
+    so words are not cut in half. A chunk with no pause in it is cut at the
+    limit.
+
+    Args:
+        audio (AudioSegment): Audio to split
+        max_chunk_ms (int): Upper bound for a chunk's length
+        min_silence_ms (int): Shortest pause a chunk may be cut at
+        silence_offset_db (float): Threshold below the average loudness counted as silence
+
+    Returns:
+        list: (start_ms, end_ms) of each chunk, in order
+    """
+    cuts = []
+    if audio.dBFS != float("-inf"):
+        silences = detect_silence(
+            audio,
+            min_silence_len=min_silence_ms,
+            silence_thresh=audio.dBFS + silence_offset_db,
+            seek_step=10,
+        )
+        cuts = [(start + end) // 2 for start, end in silences]
+
+    boundaries = []
+    start = 0
+    while len(audio) - start > max_chunk_ms:
+        limit = start + max_chunk_ms
+        candidates = [cut for cut in cuts if start < cut <= limit]
+        end = candidates[-1] if candidates else limit
+        boundaries.append((start, end))
+        start = end
+    boundaries.append((start, len(audio)))
+    return boundaries
+
+
+def prepare_chunks(audio_file_path, max_chunk_ms=CHUNK_MAX_S * 1000, min_silence_ms=CHUNK_MIN_SILENCE_MS):
+    """
+    Decode a long recording and split it into chunks for transcription.
+
+    Silence is not trimmed, so timestamps within a chunk plus its start_ms
+    are timestamps in the original recording. Chunks are encoded by the
+    caller (see encode_audio), so encoding can run in parallel.
+
+    Args:
+        audio_file_path (str): Path to the recorded audio (any format pydub reads)
+        max_chunk_ms (int): Upper bound for a chunk's length
+        min_silence_ms (int): Shortest pause a chunk may be cut at
+
+    Returns:
+        list: Dicts with the chunk's "audio" (AudioSegment), "start_ms" and "end_ms"
+    """
+    audio = AudioSegment.from_file(audio_file_path)
+    boundaries = find_chunk_boundaries(audio, max_chunk_ms, min_silence_ms)
+    logger.info(
+        f"Split {len(audio) / 1000:.1f}s of audio into {len(boundaries)} chunks: "
+        f"{[round((end - start) / 1000, 1) for start, end in boundaries]}s"
+    )
+    return [
+        {"audio": audio[start:end], "start_ms": start, "end_ms": end}
+        for start, end in boundaries
+    ]
@@ -3,6 +3,7 @@ Feedback service using Groq's language models.
 """
 from groq import Groq
 from ..utils.logger import get_logger
+from ..utils.result_cache import content_hash, get_result_cache
 from ..utils.config import GROQ_API_KEY, GROQ_MODEL
 
 logger = get_logger("feedback.groq")
@@ -10,13 +11,14 @@ logger = get_logger("feedback.groq")
 class GroqClient:
     """Client for Groq's language model services."""
     
-    def __init__(self, api_key=None, model=GROQ_MODEL):
+    def __init__(self, api_key=None, model=GROQ_MODEL, cache=None):
         """
         Initialize the Groq client.
         
         Args:
             api_key (str, optional): Groq API key. Defaults to value from config.
             model (str, optional): Model name to use. Defaults to value from config.
+            cache (ResultCache, optional): Cache for analyses. Defaults to the shared cache.
         """
         self.api_key = api_key or GROQ_API_KEY
         if not self.api_key:
@@ -24,6 +26,7 @@ class GroqClient:
             raise ValueError("Groq API key is required")
         
         self.model = model
+        self.cache = cache or get_result_cache()
         logger.debug(f"Initializing GroqClient with model: {model}")
         self.client = Groq(api_key=self.api_key)
     
@@ -69,7 +72,15 @@ class GroqClient:
         """
         logger.info("Analyzing Japanese sentence structure")
         
-        from ..prompts.feedback_prompts import JAPANESE_ANALYSIS_PROMPT
+        from ..prompts.feedback_prompts import JAPANESE_ANALYSIS_PROMPT, JAPANESE_ANALYSIS_PROMPT_VERSION
+        
+        cache_key = content_hash(
+            transcript, {"model": self.model, "prompt_version": JAPANESE_ANALYSIS_PROMPT_VERSION}
+        )
+        cached = self.cache.get("groq_analysis", cache_key)
+        if cached:
+            logger.info("Using cached Japanese analysis")
+            return cached
         
         # Format the prompt with the transcript
         prompt = JAPANESE_ANALYSIS_PROMPT.format(transcript=transcript)
@@ -79,10 +90,12 @@ class GroqClient:
             
             # For simplicity, we're returning the raw response
             # In a production app, you might want to parse this into a structured format
-            return {
+            result = {
                 "raw_feedback": response,
                 "transcript": transcript
             }
+            self.cache.put("groq_analysis", cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"Error analyzing Japanese sentence: {str(e)}")
             raise
\ No newline at end of file
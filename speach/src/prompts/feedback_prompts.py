@@ -2,6 +2,9 @@
 Prompts for the feedback service.
 """
 
+# Bump when JAPANESE_ANALYSIS_PROMPT changes, so cached analyses are not reused
+JAPANESE_ANALYSIS_PROMPT_VERSION = 1
+
 JAPANESE_ANALYSIS_PROMPT = """
 あなたは日本語の専門家です。次の日本語の文章を分析し、文法的な問題、文の構造、自然な表現について詳細なフィードバックを提供してください。
 
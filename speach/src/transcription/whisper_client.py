@@ -2,23 +2,34 @@
 Transcription service using OpenAI Whisper.
 """
 import os
+import time
 from pathlib import Path
 from openai import OpenAI
+from ..audio.preprocess import audio_duration_seconds, encode_audio, prepare_chunks, prepare_for_upload
 from ..utils.logger import get_logger
-from ..utils.config import OPENAI_API_KEY, WHISPER_MODEL
+from ..utils.task_graph import TaskGraph
+from ..utils.result_cache import content_hash, get_result_cache
+from ..utils import config
+from ..utils.config import OPENAI_API_KEY, WHISPER_MODEL, TRANSCRIPTION_WORKERS
 
 logger = get_logger("transcription.whisper")
 
+# Characters of the preceding transcript passed as a chunk's prompt
+# (Whisper only uses the last 224 tokens of a prompt)
+PROMPT_CONTEXT_CHARS = 200
+
 class WhisperClient:
     """Client for OpenAI's Whisper transcription service."""
     
-    def __init__(self, api_key=None, model=WHISPER_MODEL):
+    def __init__(self, api_key=None, model=WHISPER_MODEL, cache=None, max_workers=TRANSCRIPTION_WORKERS):
         """
         Initialize the Whisper client.
         
         Args:
             api_key (str, optional): OpenAI API key. Defaults to value from config.
             model (str, optional): Whisper model to use. Defaults to value from config.
+            cache (ResultCache, optional): Cache for transcriptions. Defaults to the shared cache.
+            max_workers (int): Chunks of a long recording transcribed at once
         """
         self.api_key = api_key or OPENAI_API_KEY
         if not self.api_key:
@@ -26,10 +37,12 @@ class WhisperClient:
             raise ValueError("OpenAI API key is required for Whisper transcription")
             
         self.model = model
+        self.cache = cache or get_result_cache()
+        self.max_workers = max_workers
         logger.debug(f"Initializing WhisperClient with model: {model}")
         self.client = OpenAI(api_key=self.api_key)
 
-    def transcribe(self, audio_file_path, language=None, prompt=None):
+    def transcribe(self, audio_file_path, language=None, prompt=None, preprocess=True, long_audio=None):
         """
         Transcribe an audio file using Whisper.
         
@@ -37,6 +50,9 @@ class WhisperClient:
             audio_file_path (str): Path to the audio file
             language (str, optional): Language code for transcription
             prompt (str, optional): Prompt to guide transcription
+            preprocess (bool): Trim silence and compress the audio before upload
+            long_audio (bool, optional): Transcribe in parallel chunks. Defaults to
+                recordings longer than LONG_AUDIO_THRESHOLD_S.
             
         Returns:
             dict: Transcription result containing text and metadata
@@ -48,10 +64,31 @@ class WhisperClient:
             logger.error(f"Audio file not found: {audio_path}")
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
+        cache_key = self._cache_key(audio_path, language, prompt, preprocess, long_audio)
+        cached = self.cache.get("whisper", cache_key)
+        if cached:
+            logger.info(f"Using cached transcription for {audio_path.name}")
+            return {**cached, "audio_file": audio_path.name}
+        
+        if long_audio is None:
+            long_audio = self._is_long(audio_path)
+        if long_audio:
+            result = self._transcribe_chunked(audio_path, language, prompt)
+            self.cache.put("whisper", cache_key, result)
+            return result
+        
+        upload = None
+        if preprocess:
+            try:
+                upload = prepare_for_upload(str(audio_path))
+            except Exception as e:
+                logger.warning(f"Audio preprocessing failed, uploading original file: {str(e)}")
+        
         try:
             with open(audio_path, "rb") as audio_file:
                 params = {
-                    "file": audio_file,
+                    # The file name tells the API which format it is
+                    "file": (f"{audio_path.stem}.{upload['format']}", upload["data"]) if upload else audio_file,
                     "model": self.model,
                 }
                 
@@ -60,19 +97,158 @@ class WhisperClient:
                 if prompt:
                     params["prompt"] = prompt
                     
-                logger.debug(f"Sending transcription request with parameters: {params}")
+                logger.debug(
+                    "Sending transcription request with parameters: "
+                    f"{ {key: value for key, value in params.items() if key != 'file'} }"
+                )
+                start = time.perf_counter()
                 response = self.client.audio.transcriptions.create(**params)
+                elapsed = time.perf_counter() - start
                 
-                logger.info("Transcription successful")
-                return {
+                logger.info(f"Transcription successful in {elapsed:.2f}s")
+                if upload:
+                    self._log_upload_savings(upload, elapsed)
+                result = {
                     "text": response.text,
                     "model": self.model,
                     "language": language,
                     "audio_file": audio_path.name,
+                    "preprocessing": {key: value for key, value in upload.items() if key != "data"} if upload else None,
                 }
+                self.cache.put("whisper", cache_key, result)
+                return result
         except Exception as e:
             logger.error(f"Error during transcription: {str(e)}")
             raise
+    
+    def _cache_key(self, audio_path, language, prompt, preprocess, long_audio):
+        """Cache key from the audio content and every setting that changes the transcript."""
+        settings = {
+            "model": self.model,
+            "language": language,
+            "prompt": prompt,
+            "preprocess": preprocess,
+            "long_audio": long_audio,
+            "chunking": [config.LONG_AUDIO_THRESHOLD_S, config.CHUNK_MAX_S, config.CHUNK_MIN_SILENCE_MS, self.max_workers],
+        }
+        if preprocess:
+            settings.update(
+                format=config.UPLOAD_AUDIO_FORMAT,
+                opus_bitrate=config.UPLOAD_OPUS_BITRATE,
+                vad=[config.VAD_SILENCE_OFFSET_DB, config.VAD_MAX_PAUSE_MS, config.VAD_PADDING_MS, config.VAD_JOIN_PAUSE_MS],
+            )
+        return content_hash(audio_path.read_bytes(), settings)
+    
+    def _is_long(self, audio_path):
+        """Whether a recording is long enough to be transcribed in chunks."""
+        try:
+            return audio_duration_seconds(str(audio_path)) > config.LONG_AUDIO_THRESHOLD_S
+        except Exception as e:
+            logger.warning(f"Could not read audio duration, transcribing in one request: {str(e)}")
+            return False
+    
+    def _transcribe_chunked(self, audio_path, language, prompt):
+        """
+        Transcribe a long recording in chunks, several at a time.
+        
+        The recording is cut at pauses into chunks of at most CHUNK_MAX_S. For
+        continuity each chunk is prompted with the end of an earlier chunk's
+        text: with N workers, chunk i waits for chunk i - N, so N requests are
+        in flight and a single worker prompts every chunk with the one before it.
+        
+        Args:
+            audio_path (Path): Path to the audio file
+            language (str, optional): Language code for transcription
+            prompt (str, optional): Prompt to guide transcription
+            
+        Returns:
+            dict: Transcription result with the stitched text and timestamped segments
+        """
+        chunks = prepare_chunks(str(audio_path))
+        graph = TaskGraph(max_workers=self.max_workers)
+        for index, chunk in enumerate(chunks):
+            previous = f"chunk_{index - self.max_workers}" if index >= self.max_workers else None
+            graph.add(
+                f"chunk_{index}",
+                self._chunk_task(chunk, language, prompt, previous),
+                depends_on=(previous,) if previous else (),
+            )
+        
+        start = time.perf_counter()
+        results = {}
+        request_seconds = 0.0
+        for name, result, error, seconds in graph.run():
+            if error is not None:
+                logger.error(f"Transcription of {name} failed: {str(error)}")
+                raise error
+            results[name] = result
+            request_seconds += seconds
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Transcribed {len(chunks)} chunks in {elapsed:.2f}s "
+            f"({request_seconds:.2f}s of requests, {self.max_workers} workers)"
+        )
+        
+        ordered = [results[f"chunk_{index}"] for index in range(len(chunks))]
+        # Japanese and Chinese are written without spaces between sentences
+        separator = "" if language in ("ja", "zh") else " "
+        return {
+            "text": separator.join(part["text"].strip() for part in ordered if part["text"].strip()),
+            "model": self.model,
+            "language": language,
+            "audio_file": audio_path.name,
+            "preprocessing": None,
+            "segments": [segment for part in ordered for segment in part["segments"]],
+            "chunks": [{"start_ms": chunk["start_ms"], "end_ms": chunk["end_ms"]} for chunk in chunks],
+        }
+    
+    def _chunk_task(self, chunk, language, prompt, previous):
+        """TaskGraph task transcribing one chunk, prompted with the text of chunk `previous`."""
+        def task(**done):
+            context = done[previous]["text"].strip()[-PROMPT_CONTEXT_CHARS:] if previous else ""
+            chunk_prompt = " ".join(part for part in (prompt, context) if part) or None
+            return self._transcribe_chunk(chunk, language, chunk_prompt)
+        return task
+    
+    def _transcribe_chunk(self, chunk, language, prompt):
+        """Encode and transcribe one chunk, with timestamps relative to the whole recording."""
+        upload_format = config.UPLOAD_AUDIO_FORMAT
+        params = {
+            "file": (f"chunk_{chunk['start_ms']}.{upload_format}", encode_audio(chunk["audio"], upload_format)),
+            "model": self.model,
+            "response_format": "verbose_json",
+        }
+        if language:
+            params["language"] = language
+        if prompt:
+            params["prompt"] = prompt
+        
+        response = self.client.audio.transcriptions.create(**params)
+        offset = chunk["start_ms"] / 1000
+        return {
+            "text": response.text,
+            "segments": [
+                {
+                    "start": round(segment.start + offset, 2),
+                    "end": round(segment.end + offset, 2),
+                    "text": segment.text.strip(),
+                }
+                for segment in getattr(response, "segments", None) or []
+            ],
+        }
+    
+    def _log_upload_savings(self, upload, elapsed):
+        """Log bytes and estimated upload time saved by preprocessing."""
+        saved = upload["original_bytes"] - upload["upload_bytes"]
+        ratio = saved / upload["original_bytes"] if upload["original_bytes"] else 0.0
+        # Estimated at this request's throughput; the request time also includes decoding
+        time_saved = elapsed * saved / upload["upload_bytes"] if upload["upload_bytes"] else 0.0
+        logger.info(
+            f"Uploaded {upload['upload_bytes']} bytes instead of {upload['original_bytes']} "
+            f"({saved} bytes, {ratio:.0%} saved; "
+            f"{(upload['original_ms'] - upload['upload_ms']) / 1000:.1f}s of silence removed); "
+            f"~{time_saved:.2f}s upload time saved"
+        )
             
     def transcribe_japanese(self, audio_file_path, prompt=None):
         """
@@ -6,14 +6,16 @@ import os
 import time
 import streamlit as st
 from PIL import Image
-import tempfile
-from pydub import AudioSegment  # Add missing import
 
 from ..utils.logger import get_logger
+from ..utils.config import AUDIO_DIR
+from ..utils.helpers import generate_unique_filename
+from ..audio.preprocess import normalize_audio
 from ..audio.recorder import record_and_save
 from ..transcription.whisper_client import WhisperClient
 from ..image_generation.bedrock_client import BedrockImageGenerator
 from ..feedback.groq_client import GroqClient
+from ..utils.task_graph import TaskGraph
 
 logger = get_logger("ui.app")
 
@@ -73,23 +75,23 @@ class SpeechApp:
             "Record or upload your voice to automatically transcribe, analyze Japanese structure, and generate images."
         )
         
-        # Create two columns for the main layout
+        # Create two columns for the main layout. Result slots are created up
+        # front so each result can be filled in as soon as it is ready.
         left_col, right_col = st.columns(2)
+        with left_col:
+            audio_area = st.container()
+            self.transcript_slot = st.empty()
+        with right_col:
+            self.feedback_slot = st.empty()
+            self.image_slot = st.empty()
         
         # Left column for audio input and transcript
-        with left_col:
+        with audio_area:
             self._render_audio_section()
-            if st.session_state.transcript:
-                self._render_transcript_section()
         
-        # Right column for feedback and image
-        with right_col:
-            if st.session_state.feedback:
-                self._render_feedback_section()
-            if st.session_state.image_path:
-                self._render_image_section()
-            elif st.session_state.processing:
-                st.spinner("Processing...")
+        # Transcript on the left, feedback and image on the right
+        for stage in ("transcription", "analysis", "image"):
+            self._render_result(stage)
 
     def _render_audio_section(self):
         """Render the audio recording section."""
@@ -103,26 +105,13 @@ class SpeechApp:
             if uploaded_file:
                 logger.info(f"Processing uploaded audio file: {uploaded_file.name}")
                 try:
-                    # Read the uploaded file into memory
-                    audio_bytes = uploaded_file.read()
-                    # Create a temporary file with original extension
+                    # Convert to 16kHz mono WAV in memory and keep only that file
                     original_ext = os.path.splitext(uploaded_file.name)[1].lower()
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=original_ext
-                    ) as tmp_file:
-                        tmp_file.write(audio_bytes)
-                        temp_path = tmp_file.name
-                    # Convert to WAV using pydub
-                    logger.debug(f"Converting uploaded file to WAV format: {temp_path}")
-                    audio = AudioSegment.from_file(temp_path)
-                    # Set parameters for Whisper API compatibility
-                    audio = audio.set_frame_rate(16000)
-                    audio = audio.set_channels(1)
-                    # Save as WAV
-                    wav_path = temp_path.replace(original_ext, ".wav")
-                    audio.export(wav_path, format="wav")
-                    # Clean up original temp file
-                    os.unlink(temp_path)
+                    logger.debug(f"Converting uploaded file to WAV format: {uploaded_file.name}")
+                    wav_buffer = normalize_audio(uploaded_file, format_hint=original_ext.lstrip(".") or None)
+                    wav_path = str(AUDIO_DIR / generate_unique_filename(prefix="upload", extension="wav"))
+                    with open(wav_path, "wb") as f:
+                        f.write(wav_buffer.getvalue())
                     st.session_state.audio_file_path = wav_path
                     logger.info(
                         f"Successfully converted uploaded file to WAV: {wav_path}"
@@ -149,80 +138,107 @@ class SpeechApp:
             st.audio(st.session_state.audio_file_path)
 
     def _process_audio_and_continue(self):
-        """Process audio and continue with all subsequent steps automatically."""
-        st.session_state.processing = True
-        self._process_audio()
-        if st.session_state.transcript:
-            self._analyze_japanese()
-            if st.session_state.feedback:
-                self._generate_image()
-        st.session_state.processing = False
+        """
+        Process audio and continue with all subsequent steps automatically.
 
-    def _process_audio(self):
-        """Process the recorded or uploaded audio."""
+        Transcription runs first; Japanese analysis (Groq) and image
+        generation (Bedrock) both only need the transcript, so they run
+        concurrently afterwards. Each result is rendered as it completes and
+        stage timings are logged.
+        """
         logger.info(f"Processing audio file: {st.session_state.audio_file_path}")
         if not self.whisper_client:
             st.error("Whisper service is not available")
             return
 
-        with st.spinner("Transcribing audio..."):
-            try:
-                result = self.whisper_client.transcribe_japanese(
-                    st.session_state.audio_file_path
-                )
-                st.session_state.transcript = result["text"]
+        st.session_state.processing = True
+        st.session_state.transcript = None
+        st.session_state.feedback = None
+        st.session_state.image_path = None
+
+        audio_file_path = st.session_state.audio_file_path
+        graph = TaskGraph(max_workers=2)
+        graph.add("transcription", lambda: self.whisper_client.transcribe_japanese(audio_file_path)["text"])
+        if self.groq_client:
+            graph.add(
+                "analysis",
+                lambda transcription: self.groq_client.analyze_japanese_sentence(transcription)["raw_feedback"],
+                depends_on=("transcription",),
+            )
+        else:
+            st.error("Groq service is not available")
+        if self.bedrock_client:
+            graph.add(
+                "image",
+                lambda transcription: self.bedrock_client.generate_image_from_transcript(transcription)[1],
+                depends_on=("transcription",),
+            )
+        else:
+            st.error("Bedrock service is not available")
+
+        timings = {}
+        start = time.perf_counter()
+        with st.spinner("Transcribing, analyzing and generating image..."):
+            for stage, result, error, seconds in graph.run():
+                timings[stage] = seconds
+                self._store_result(stage, result, error)
+                self._render_result(stage)
+        wall = time.perf_counter() - start
+        st.session_state.processing = False
+
+        stage_times = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        logger.info(
+            f"Pipeline finished in {wall:.2f}s ({stage_times}; "
+            f"{sum(timings.values()) - wall:.2f}s saved by running stages concurrently)"
+        )
+
+    def _store_result(self, stage, result, error):
+        """Save a pipeline stage's result in the session, or report its error."""
+        if stage == "transcription":
+            if error is None:
+                st.session_state.transcript = result
                 logger.info("Transcription successful")
-                logger.debug(f"Transcript: {st.session_state.transcript}")
-            except Exception as e:
-                logger.error(f"Transcription error: {str(e)}")
-                st.error(f"Transcription error: {str(e)}")
+                logger.debug(f"Transcript: {result}")
+            else:
+                logger.error(f"Transcription error: {str(error)}")
+                st.error(f"Transcription error: {str(error)}")
+        elif stage == "analysis":
+            if error is None:
+                st.session_state.feedback = result
+                logger.info("Japanese analysis successful")
+            elif st.session_state.transcript:
+                logger.error(f"Analysis error: {str(error)}")
+                st.error(f"Analysis error: {str(error)}")
+        elif stage == "image":
+            if error is None:
+                st.session_state.image_path = result
+                logger.info(f"Image generation successful: {result}")
+            elif st.session_state.transcript:
+                logger.error(f"Image generation error: {str(error)}")
+                st.error(f"Image generation error: {str(error)}")
+
+    def _render_result(self, stage):
+        """Render a pipeline stage's result into its slot."""
+        if stage == "transcription" and st.session_state.transcript:
+            with self.transcript_slot.container():
+                self._render_transcript_section()
+        elif stage == "analysis" and st.session_state.feedback:
+            with self.feedback_slot.container():
+                self._render_feedback_section()
+        elif stage == "image" and st.session_state.image_path:
+            with self.image_slot.container():
+                self._render_image_section()
 
     def _render_transcript_section(self):
         """Render the transcript section."""
         st.header("📝 Transcription")
         st.write(st.session_state.transcript)
 
-    def _analyze_japanese(self):
-        """Analyze Japanese sentence structure."""
-        logger.info("Analyzing Japanese sentence structure")
-        if not self.groq_client:
-            st.error("Groq service is not available")
-            return
-
-        with st.spinner("Analyzing Japanese sentence structure..."):
-            try:
-                result = self.groq_client.analyze_japanese_sentence(
-                    st.session_state.transcript
-                )
-                st.session_state.feedback = result["raw_feedback"]
-                logger.info("Japanese analysis successful")
-            except Exception as e:
-                logger.error(f"Analysis error: {str(e)}")
-                st.error(f"Analysis error: {str(e)}")
-
     def _render_feedback_section(self):
         """Render the feedback section."""
         st.header("🔍 Japanese Structure Analysis")
         st.write(st.session_state.feedback)
 
-    def _generate_image(self):
-        """Generate an image based on the transcript."""
-        logger.info("Generating image from transcript")
-        if not self.bedrock_client:
-            st.error("Bedrock service is not available")
-            return
-
-        with st.spinner("Generating image..."):
-            try:
-                _, image_path = self.bedrock_client.generate_image_from_transcript(
-                    st.session_state.transcript
-                )
-                st.session_state.image_path = image_path
-                logger.info(f"Image generation successful: {image_path}")
-            except Exception as e:
-                logger.error(f"Image generation error: {str(e)}")
-                st.error(f"Image generation error: {str(e)}")
-
     def _render_image_section(self):
         """Render the image section."""
         if st.session_state.image_path and os.path.exists(st.session_state.image_path):
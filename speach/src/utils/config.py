@@ -31,4 +31,22 @@ os.makedirs(LOG_DIR, exist_ok=True)
 # Model configuration
 WHISPER_MODEL = "whisper-1"
 BEDROCK_IMAGE_MODEL = "amazon.titan-image-generator-v1"
-GROQ_MODEL = "llama3-70b-8192"
\ No newline at end of file
+GROQ_MODEL = "llama3-70b-8192"
+
+# Audio preprocessing before Whisper upload
+VAD_SILENCE_OFFSET_DB = -16  # Silence threshold relative to the clip's average loudness (dBFS)
+VAD_MAX_PAUSE_MS = 700  # Pauses at least this long are shortened
+VAD_PADDING_MS = 150  # Audio kept around each speech region
+VAD_JOIN_PAUSE_MS = 300  # Pause left where a long pause was removed
+UPLOAD_AUDIO_FORMAT = "flac"  # "flac" (lossless) or "ogg" (Opus)
+UPLOAD_OPUS_BITRATE = "24k"
+
+# Cache of Whisper transcriptions and Groq analyses
+RESULT_CACHE_PATH = BASE_DIR / "data" / "result_cache.sqlite3"
+RESULT_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+# Long recordings are split at pauses and transcribed in parallel
+LONG_AUDIO_THRESHOLD_S = 120  # Longer recordings are transcribed in chunks
+CHUNK_MAX_S = 60  # Upper bound for a chunk's length
+CHUNK_MIN_SILENCE_MS = 400  # Shortest pause a chunk may be cut at
+TRANSCRIPTION_WORKERS = 3  # Chunks transcribed at once
@@ -0,0 +1,168 @@
+"""
+Persistent result cache for the Speech application.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from .logger import get_logger
+from .config import RESULT_CACHE_PATH, RESULT_CACHE_MAX_BYTES
+
+logger = get_logger("utils.result_cache")
+
+
+def content_hash(*parts):
+    """
+    Build a cache key from bytes and JSON-serializable parts.
+
+    Args:
+        *parts: Bytes (hashed as is) or values serialized as sorted JSON
+
+    Returns:
+        str: SHA-256 hex digest of all parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        # Length prefix so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of JSON results, shared across sessions and restarts.
+
+    Entries are grouped by namespace and evicted least recently used first
+    once their total size exceeds max_bytes.
+    """
+
+    def __init__(self, path=RESULT_CACHE_PATH, max_bytes=RESULT_CACHE_MAX_BYTES):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path (str or Path): SQLite database file
+            max_bytes (int): Upper bound for the total size of stored values
+        """
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    def _connect(self):
+        # One connection per call, so the cache can be used from worker threads
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, namespace, key):
+        """
+        Look up a cached result.
+
+        Args:
+            namespace (str): Kind of result, e.g. "whisper"
+            key (str): Cache key, usually from content_hash
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM results WHERE namespace = ? AND key = ?", (namespace, key)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE results SET last_used = ? WHERE namespace = ? AND key = ?",
+                    (time.time(), namespace, key),
+                )
+            logger.info(f"Cache hit for {namespace} result {key[:12]}")
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Could not read {namespace} result from cache: {str(e)}")
+            return None
+
+    def put(self, namespace, key, value):
+        """
+        Store a result and evict old entries if the cache is over its size limit.
+
+        Args:
+            namespace (str): Kind of result, e.g. "whisper"
+            key (str): Cache key, usually from content_hash
+            value: JSON-serializable result
+        """
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                    (namespace, key, data, size, now, now),
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store {namespace} result in cache: {str(e)}")
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        rows = conn.execute("SELECT namespace, key, size FROM results ORDER BY last_used").fetchall()
+        for namespace, key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE namespace = ? AND key = ?", (namespace, key))
+            total -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cached results ({total} bytes remain)")
+
+    def stats(self):
+        """
+        Summarize the cache contents.
+
+        Returns:
+            dict: Entry count and total size per namespace
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM results GROUP BY namespace"
+            ).fetchall()
+        return {namespace: {"entries": count, "bytes": size} for namespace, count, size in rows}
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """
+    Get the application's shared result cache.
+
+    Returns:
+        ResultCache: Cache stored at RESULT_CACHE_PATH
+    """
+    global _result_cache
+    with _result_cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache()
+        return _result_cache
@@ -0,0 +1,91 @@
+"""
+Small dependency-driven task runner for the Speech application.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from .logger import get_logger
+
+logger = get_logger("utils.task_graph")
+
+
+class TaskGraph:
+    """
+    Runs named tasks on a thread pool, each as soon as the tasks it depends on
+    have finished.
+
+    Task functions receive the results of their dependencies as keyword
+    arguments and must not touch Streamlit; results are handed back to the
+    calling thread in completion order, so they can be rendered there.
+    """
+
+    def __init__(self, max_workers=4):
+        """
+        Initialize an empty task graph.
+
+        Args:
+            max_workers (int): Maximum number of tasks running at once
+        """
+        self.max_workers = max_workers
+        self.tasks = {}
+
+    def add(self, name, func, depends_on=()):
+        """
+        Add a task.
+
+        Args:
+            name (str): Unique task name
+            func (callable): Called with the dependencies' results as keyword arguments
+            depends_on (tuple): Names of tasks that must succeed first
+        """
+        unknown = [dep for dep in depends_on if dep not in self.tasks]
+        if unknown:
+            raise ValueError(f"Task {name} depends on unknown tasks: {unknown}")
+        self.tasks[name] = (func, tuple(depends_on))
+
+    def run(self):
+        """
+        Run all tasks.
+
+        Yields:
+            tuple: (name, result, error, seconds) for each task as it finishes.
+                Tasks whose dependencies failed are yielded with an error
+                and are not run.
+        """
+        results = {}
+        failed = set()
+        pending = dict(self.tasks)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name, (func, deps) in list(pending.items()):
+                    if any(dep in failed for dep in deps):
+                        del pending[name]
+                        failed.add(name)
+                        logger.warning(f"Skipping task {name}: a dependency failed")
+                        yield name, None, RuntimeError(f"Skipped because a dependency of {name} failed"), 0.0
+                    elif all(dep in results for dep in deps):
+                        del pending[name]
+                        kwargs = {dep: results[dep] for dep in deps}
+                        running[executor.submit(self._timed, func, kwargs)] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    result, error, seconds = future.result()
+                    if error is None:
+                        results[name] = result
+                    else:
+                        failed.add(name)
+                    yield name, result, error, seconds
+
+    @staticmethod
+    def _timed(func, kwargs):
+        start = time.perf_counter()
+        try:
+            return func(**kwargs), None, time.perf_counter() - start
+        except Exception as e:
+            return None, e, time.perf_counter() - start
@@ -0,0 +1,89 @@
+"""
+Tests for the persistent result cache.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.result_cache import ResultCache, content_hash
+from src.transcription.whisper_client import WhisperClient
+
+
+class StubTranscriptions:
+    """Stands in for client.audio.transcriptions, counting requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **params):
+        self.requests.append(params)
+        return SimpleNamespace(text="こんにちは")
+
+
+def test_content_hash_is_stable():
+    key = content_hash(b"audio", {"model": "whisper-1", "language": "ja"})
+    # Keys are persisted, so they must not change between releases
+    assert key == "cad2def36f0179e94a9d9d01f4688de4e9f052fda83be002304486254182a9fa"
+    assert key == content_hash(b"audio", {"language": "ja", "model": "whisper-1"})
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+    assert key != content_hash(b"audio", {"model": "whisper-1", "language": "en"})
+
+
+def test_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as directory:
+        # Each value below is stored as 12 bytes of JSON
+        cache = ResultCache(Path(directory) / "cache.sqlite3", max_bytes=40)
+        for key in ("a", "b", "c"):
+            cache.put("whisper", key, "x" * 10)
+            time.sleep(0.01)
+
+        assert cache.get("whisper", "a") == "x" * 10
+        time.sleep(0.01)
+        cache.put("whisper", "d", "x" * 10)
+
+        assert cache.get("whisper", "b") is None
+        for key in ("a", "c", "d"):
+            assert cache.get("whisper", key) == "x" * 10
+        assert cache.stats() == {"whisper": {"entries": 3, "bytes": 36}}
+
+
+def test_entries_persist_per_namespace():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "cache.sqlite3"
+        ResultCache(path).put("whisper", "key", {"text": "こんにちは"})
+
+        reopened = ResultCache(path)
+        assert reopened.get("whisper", "key") == {"text": "こんにちは"}
+        assert reopened.get("feedback", "key") is None
+
+
+def test_whisper_reuses_cached_transcription():
+    with tempfile.TemporaryDirectory() as directory:
+        audio_path = Path(directory) / "recording.wav"
+        audio_path.write_bytes(b"RIFF fake audio")
+        cache = ResultCache(Path(directory) / "cache.sqlite3")
+        transcriptions = StubTranscriptions()
+        client = WhisperClient(api_key="test", cache=cache)
+        client.client = SimpleNamespace(audio=SimpleNamespace(transcriptions=transcriptions))
+
+        first = client.transcribe(str(audio_path), language="ja", preprocess=False, long_audio=False)
+        second = client.transcribe(str(audio_path), language="ja", preprocess=False, long_audio=False)
+        assert first == second
+        assert second["text"] == "こんにちは"
+        assert len(transcriptions.requests) == 1
+
+        # A different setting is a different transcription
+        client.transcribe(str(audio_path), language="en", preprocess=False, long_audio=False)
+        assert len(transcriptions.requests) == 2
+
+
+if __name__ == "__main__":
+    test_content_hash_is_stable()
+    test_evicts_least_recently_used()
+    test_entries_persist_per_namespace()
+    test_whisper_reuses_cached_transcription()
+    print("All result cache tests passed")